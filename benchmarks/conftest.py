@@ -0,0 +1,52 @@
+"""Configuration for the benchmark suite.
+
+In addition to the options provided by `pytest-benchmark`, an optional JSON
+file of timing limits can be supplied with `--benchmark-limits`. This maps
+glob patterns of benchmark names (as displayed by `pytest-benchmark`, e.g.
+`test_set[typed]`) to the maximum allowed mean time in seconds. Benchmarks
+whose mean time exceeds a matching limit are failed.
+
+"""
+
+import json
+from fnmatch import fnmatch
+
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--benchmark-limits",
+        metavar="PATH",
+        default=None,
+        help=(
+            "JSON file mapping glob patterns of benchmark names to maximum "
+            "allowed mean times in seconds."
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
+def benchmark_limits(request):
+    """Timing limits loaded from the `--benchmark-limits` file."""
+    path = request.config.getoption("--benchmark-limits")
+    if path is None:
+        return {}
+    with open(path) as file:
+        return json.load(file)
+
+
+@pytest.fixture(autouse=True)
+def check_benchmark_limits(request, benchmark, benchmark_limits):
+    """Fail benchmarks whose mean time exceeds any matching limit."""
+    yield
+    if not benchmark_limits or benchmark.stats is None:
+        return
+    mean = benchmark.stats.stats.mean
+    for pattern, limit in benchmark_limits.items():
+        if fnmatch(request.node.name, pattern) and mean > limit:
+            msg = (
+                f"Benchmark {request.node.name} mean time of {mean:.3g}s exceeds "
+                f"the limit of {limit:.3g}s for `{pattern}`."
+            )
+            pytest.fail(msg)
@@ -0,0 +1,57 @@
+"""Benchmarks comparing the cast registry with casting via `exec`.
+
+Processed properties previously cast values by building and executing the
+source string `processed_value = {type}({value})`. This is compared against
+:func:`cast_value`, which calls the registered cast function directly, over a
+large batch of mixed inputs whose `str` is valid source (so that the `exec`
+path can cast them too).
+
+Run with::
+
+    pytest benchmarks/test_cast.py
+
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from pyproprop.cast import cast_value
+
+NUM_INPUTS = 10000
+
+
+def exec_cast(value, expected_type):
+    """Cast a value to a type by executing generated source."""
+    cast_str = f"processed_value = {expected_type.__name__}({value})"
+    exec(cast_str)
+    return locals()["processed_value"]
+
+
+def mixed_inputs(num_inputs=NUM_INPUTS):
+    """Batch of ints, floats, bools and Numpy scalars."""
+    rng = random.Random(0)
+    generators = [
+        lambda: rng.randint(-1000, 1000),
+        lambda: rng.uniform(-1000, 1000),
+        lambda: rng.random() > 0.5,
+        lambda: np.float64(rng.uniform(-1000, 1000)),
+    ]
+    return [rng.choice(generators)() for _ in range(num_inputs)]
+
+
+CAST_FUNCS = {"registry": cast_value, "exec": exec_cast}
+
+
+@pytest.mark.parametrize("expected_type", [float, str, complex])
+@pytest.mark.parametrize("cast", list(CAST_FUNCS))
+def test_cast_batch(benchmark, cast, expected_type):
+    benchmark.group = f"cast: {expected_type.__name__}"
+    cast_func = CAST_FUNCS[cast]
+    inputs = mixed_inputs()
+
+    def cast_all():
+        return [cast_func(value, expected_type) for value in inputs]
+
+    benchmark(cast_all)
@@ -0,0 +1,54 @@
+"""Benchmarks of storing many records in columns against many instances.
+
+Run with::
+
+    pytest benchmarks/test_columnar.py
+
+"""
+
+import numpy as np
+
+from pyproprop import ProcessedPropertyArray, processed_property
+
+NUM_RECORDS = 10000
+
+
+class Point:
+    """Class with numeric and options processed properties."""
+
+    lower = processed_property("lower", type=float, min=0)
+    upper = processed_property("upper", type=float, greater_than="lower")
+    mode = processed_property("mode", options=("fast", "slow"))
+
+    def __init__(self, lower, upper, mode):
+        self.lower = lower
+        self.upper = upper
+        self.mode = mode
+
+
+LOWER = np.linspace(0.0, 1.0, NUM_RECORDS)
+UPPER = LOWER + 1.0
+MODE = ["fast", "slow"] * (NUM_RECORDS // 2)
+
+
+def test_instances(benchmark):
+    benchmark.group = "many records"
+
+    def create_instances():
+        return [
+            Point(lower, upper, mode)
+            for lower, upper, mode in zip(LOWER.tolist(), UPPER.tolist(), MODE)
+        ]
+
+    benchmark(create_instances)
+
+
+def test_columnar_extend(benchmark):
+    benchmark.group = "many records"
+
+    def extend():
+        records = ProcessedPropertyArray(Point)
+        records.extend(lower=LOWER, upper=UPPER, mode=MODE)
+        return records
+
+    benchmark(extend)
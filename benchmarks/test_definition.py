@@ -0,0 +1,33 @@
+"""Benchmarks of the time taken to define processed properties.
+
+Setters and validators are compiled when a processed property is defined, so
+this is paid at import time by packages defining many processed properties.
+
+Run with::
+
+    pytest benchmarks/test_definition.py
+
+"""
+
+from pyproprop import processed_property
+
+
+def define_class():
+    """Define a class with three processed properties."""
+
+    class Bounds:
+        lower = processed_property("lower", type=float, cast=True, min=0)
+        upper = processed_property("upper", type=float, greater_than="lower")
+        name = processed_property("name", type=str, optional=True)
+
+    return Bounds
+
+
+def test_define_property(benchmark):
+    benchmark.group = "definition"
+    benchmark(processed_property, "x", type=float, cast=True, min=0)
+
+
+def test_define_class(benchmark):
+    benchmark.group = "definition"
+    benchmark(define_class)
@@ -0,0 +1,49 @@
+"""Benchmarks of :func:`format_str_case` for each supported case.
+
+Run with::
+
+    pytest benchmarks/test_format_str_case.py
+
+"""
+
+import pytest
+
+from pyproprop import format_str_case, format_str_case_many
+from pyproprop.format_str_case import SUPPORTED_STR_FORMAT_OPTIONS
+
+ITEM = "it's an  example-with punctuation,and string _with__lots___of_underscores_"
+
+CASES = sorted(SUPPORTED_STR_FORMAT_OPTIONS, key=str)
+
+
+@pytest.mark.parametrize("cache", [False, True])
+@pytest.mark.parametrize("process", [False, True])
+@pytest.mark.parametrize("case", CASES)
+def test_format_str_case(benchmark, case, process, cache):
+    benchmark.group = f"format_str_case: process={process}, cache={cache}"
+    benchmark(format_str_case, ITEM, case, process=process, cache=cache)
+
+
+# Many strings with repeats, as when normalising column or variable names
+MANY_ITEMS = [f"{ITEM} {i % 100}" for i in range(10000)]
+
+
+def format_str_case_loop(items, case, deduplicate=False):
+    """Format many strings with one :func:`format_str_case` call each."""
+    return [format_str_case(item, case) for item in items]
+
+
+MANY_FUNCS = {
+    "loop": format_str_case_loop,
+    "many": format_str_case_many,
+}
+
+
+@pytest.mark.parametrize("deduplicate", [False, True])
+@pytest.mark.parametrize("func", list(MANY_FUNCS))
+@pytest.mark.parametrize("case", ["lower", "snake", "hyphen"])
+def test_format_str_case_many(benchmark, case, func, deduplicate):
+    if func == "loop" and deduplicate:
+        pytest.skip("Deduplication is only supported by `format_str_case_many`.")
+    benchmark.group = f"format_str_case_many: {case}"
+    benchmark(MANY_FUNCS[func], MANY_ITEMS, case, deduplicate=deduplicate)
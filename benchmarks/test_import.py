@@ -0,0 +1,67 @@
+"""Benchmarks of the time taken to `import pyproprop`.
+
+Pyproprop is imported in a fresh interpreter run with `-X importtime`, whose
+output on stderr is parsed to find the cumulative import time of Pyproprop and
+which of its heavy dependencies were imported along with it. These are stored
+in each benchmark's `extra_info` as `import_time_us` and `heavy_imports`.
+
+Run with::
+
+    pytest benchmarks/test_import.py --benchmark-columns=mean
+
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ("numpy", "sympy", "titlecase")
+
+STATEMENTS = {
+    "pyproprop": "import pyproprop",
+    "pyproprop+numpy": "import numpy, pyproprop",
+}
+
+
+def parse_importtime(stderr):
+    """Cumulative import times in microseconds keyed by module name."""
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        try:
+            times[name.strip()] = int(cumulative)
+        except ValueError:
+            continue
+    return times
+
+
+def import_times(statement):
+    """Run an import statement in a new interpreter and parse its timings."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return parse_importtime(result.stderr)
+
+
+@pytest.mark.parametrize("statement", list(STATEMENTS))
+def test_import(benchmark, statement):
+    benchmark.group = "import"
+    times = benchmark.pedantic(
+        import_times, args=(STATEMENTS[statement],), rounds=5, iterations=1
+    )
+    benchmark.extra_info["import_time_us"] = times["pyproprop"]
+    benchmark.extra_info["heavy_imports"] = [
+        name for name in HEAVY_MODULES if name in times
+    ]
+
+
+def test_import_is_lazy():
+    """Importing Pyproprop alone does not import its heavy dependencies."""
+    times = import_times(STATEMENTS["pyproprop"])
+    assert not [name for name in HEAVY_MODULES if name in times]
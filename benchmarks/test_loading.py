@@ -0,0 +1,35 @@
+"""Benchmarks of creating many validated instances from rows of values.
+
+Run with::
+
+    pytest benchmarks/test_loading.py
+
+"""
+
+from pyproprop import load_many, processed_property
+
+NUM_ROWS = 10000
+
+
+class Bounds:
+    """Class with related processed properties."""
+
+    lower = processed_property("lower", type=float, cast=True)
+    upper = processed_property("upper", type=float, cast=True, at_least="lower")
+
+    def __init__(self, lower, upper):
+        self.lower = lower
+        self.upper = upper
+
+
+ROWS = [(i, i + 1) for i in range(NUM_ROWS)]
+
+
+def test_construct(benchmark):
+    benchmark.group = "load many"
+    benchmark(lambda: [Bounds(lower, upper) for lower, upper in ROWS])
+
+
+def test_load_many(benchmark):
+    benchmark.group = "load many"
+    benchmark(lambda: list(load_many(Bounds, ROWS)))
@@ -0,0 +1,70 @@
+"""Benchmarks of per-instance memory of dict and slots storage modes.
+
+The number of bytes allocated per instance is measured with :mod:`tracemalloc`
+while constructing many instances of a class with processed properties, and
+stored in each benchmark's `extra_info` as `bytes_per_instance`.
+
+Run with::
+
+    pytest benchmarks/test_memory.py --benchmark-columns=mean
+
+"""
+
+import tracemalloc
+
+import pytest
+
+from pyproprop import processed_property, processed_property_slots
+
+NUM_INSTANCES = 10000
+
+
+class DictStorage:
+    """Class storing processed properties in the instance `__dict__`."""
+
+    x = processed_property("x", type=float)
+    y = processed_property("y", type=float)
+    z = processed_property("z", type=float)
+
+    def __init__(self):
+        self.x = 1.0
+        self.y = 2.0
+        self.z = 3.0
+
+
+@processed_property_slots
+class SlotsStorage:
+    """Class storing processed properties in `__slots__`."""
+
+    x = processed_property("x", type=float)
+    y = processed_property("y", type=float)
+    z = processed_property("z", type=float)
+
+    def __init__(self):
+        self.x = 1.0
+        self.y = 2.0
+        self.z = 3.0
+
+
+CLASSES = {"dict": DictStorage, "slots": SlotsStorage}
+
+
+def bytes_per_instance(cls, num_instances=NUM_INSTANCES):
+    """Average number of bytes allocated when constructing an instance."""
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        instances = [cls() for _ in range(num_instances)]
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del instances
+    return (after - before) / num_instances
+
+
+@pytest.mark.parametrize("storage", list(CLASSES))
+def test_instance_memory(benchmark, storage):
+    cls = CLASSES[storage]
+    benchmark.group = "instance construction"
+    benchmark.extra_info["bytes_per_instance"] = bytes_per_instance(cls)
+    benchmark(cls)
@@ -0,0 +1,26 @@
+"""Benchmarks of :func:`named_iterable` with and without sympification.
+
+Run with::
+
+    pytest benchmarks/test_named_iterable.py
+
+"""
+
+import pytest
+
+from pyproprop import named_iterable
+
+ENTRIES = ["x", "y", "z", "u", "v", "w"]
+
+
+@pytest.mark.parametrize("sympify", [False, True])
+@pytest.mark.parametrize("use_named", [False, True])
+def test_named_iterable(benchmark, sympify, use_named):
+    benchmark.group = f"named_iterable: sympify={sympify}"
+    benchmark(named_iterable, ENTRIES, use_named=use_named, sympify=sympify)
+
+
+def test_named_iterable_from_mapping(benchmark):
+    benchmark.group = "named_iterable: sympify=False"
+    mapping = {entry: i for i, entry in enumerate(ENTRIES)}
+    benchmark(named_iterable, mapping)
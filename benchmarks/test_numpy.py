@@ -0,0 +1,65 @@
+"""Benchmarks of processed properties holding large Numpy arrays.
+
+Whole-array dtype and bound checks are compared against checking the type of
+each element in Python, as processed properties with `iterable_allowed=True`
+previously did for arrays. Validating many optimisable bound pairs with
+:func:`check_bounds_many` is compared against calling :func:`check_bounds` on
+each pair.
+
+Run with::
+
+    pytest benchmarks/test_numpy.py
+
+"""
+
+import numpy as np
+import pytest
+
+from pyproprop import check_bounds_many, processed_property
+from pyproprop.processed_property import check_bounds, check_type
+
+ARRAY_SIZES = [1000, 1000000]
+
+
+class ArrayProperties:
+    """Class with processed properties that hold arrays."""
+
+    bounded = processed_property(
+        "bounded", type=float, iterable_allowed=True, min=0.0, max=1.0
+    )
+    typed = processed_property("typed", type=float, iterable_allowed=True)
+
+
+def check_elementwise(value):
+    """Check the type of each element of an array in Python."""
+    return tuple([check_type(val, float, "", False, False, None) for val in value])
+
+
+@pytest.mark.parametrize("size", ARRAY_SIZES)
+@pytest.mark.parametrize("name", ["bounded", "typed"])
+def test_set_array(benchmark, name, size):
+    benchmark.group = f"array: {size} elements"
+    instance = ArrayProperties()
+    value = np.random.default_rng(0).random(size)
+    benchmark(setattr, instance, name, value)
+
+
+@pytest.mark.parametrize("size", ARRAY_SIZES)
+def test_check_elementwise(benchmark, size):
+    benchmark.group = f"array: {size} elements"
+    value = np.random.default_rng(0).random(size)
+    benchmark(check_elementwise, value)
+
+
+NUM_BOUNDS = 10000
+BOUNDS = [(float(i), float(i + i % 2)) for i in range(NUM_BOUNDS)]
+
+
+def test_check_bounds_loop(benchmark):
+    benchmark.group = "check_bounds"
+    benchmark(lambda: [check_bounds(pair) for pair in BOUNDS])
+
+
+def test_check_bounds_many(benchmark):
+    benchmark.group = "check_bounds"
+    benchmark(check_bounds_many, np.array(BOUNDS))
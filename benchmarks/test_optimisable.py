@@ -0,0 +1,47 @@
+"""Benchmarks of collecting and setting many free optimisable parameters.
+
+Run with::
+
+    pytest benchmarks/test_optimisable.py
+
+"""
+
+from pyproprop import OptimisableParameters, processed_property
+
+NUM_INSTANCES = 10000
+
+
+class Phase:
+    """Class with optimisable processed properties."""
+
+    initial_time = processed_property("initial_time", optimisable=True)
+    final_time = processed_property("final_time", optimisable=True)
+
+    def __init__(self):
+        self.initial_time = 0.0
+        self.final_time = (1.0, 10.0)
+
+
+def test_collect(benchmark):
+    benchmark.group = "optimisable parameters"
+    instances = [Phase() for _ in range(NUM_INSTANCES)]
+    benchmark(OptimisableParameters, *instances)
+
+
+def test_set_solution(benchmark):
+    benchmark.group = "optimisable parameters"
+
+    parameters = None
+
+    def set_solution(solution):
+        nonlocal parameters
+        parameters.set_solution(solution)
+
+    def setup_parameters():
+        nonlocal parameters
+        parameters = OptimisableParameters(
+            *(Phase() for _ in range(NUM_INSTANCES))
+        )
+        return (parameters.lower,), {}
+
+    benchmark.pedantic(set_solution, setup=setup_parameters, rounds=20)
@@ -0,0 +1,78 @@
+"""Benchmarks of :class:`Options` construction and dispatchers.
+
+Run with::
+
+    pytest benchmarks/test_options.py
+
+"""
+
+import pytest
+
+from pyproprop import Options, processed_property
+
+NUM_OPTIONS = [3, 100, 1000]
+
+
+def make_options(num_options):
+    """Option identifiers and matching handles."""
+    options = [f"option_{i}" for i in range(num_options)]
+    handles = [lambda i=i: i for i in range(num_options)]
+    return options, handles
+
+
+@pytest.mark.parametrize("num_options", NUM_OPTIONS)
+def test_construct(benchmark, num_options):
+    benchmark.group = "Options: construct"
+    options, handles = make_options(num_options)
+    benchmark(
+        Options, options, default=options[-1], unsupported=options[:1], handles=handles
+    )
+
+
+@pytest.mark.parametrize("num_options", NUM_OPTIONS)
+def test_dispatcher(benchmark, num_options):
+    benchmark.group = "Options: dispatcher"
+    options, handles = make_options(num_options)
+    instance = Options(options, handles=handles)
+
+    def dispatch():
+        return instance.dispatcher[options[-1]]()
+
+    benchmark(dispatch)
+
+
+@pytest.mark.parametrize("num_options", NUM_OPTIONS)
+def test_dispatcher_uncached(benchmark, num_options):
+    """Reference rebuilding the dispatcher mapping on every access."""
+    benchmark.group = "Options: dispatcher"
+    options, handles = make_options(num_options)
+    instance = Options(options, handles=handles)
+
+    def dispatch():
+        return dict(zip(instance.options, instance.handles))[options[-1]]()
+
+    benchmark(dispatch)
+
+
+@pytest.mark.parametrize("num_options", NUM_OPTIONS)
+def test_dispatch(benchmark, num_options):
+    benchmark.group = "Options: dispatcher"
+    options, handles = make_options(num_options)
+    instance = Options(options, handles=handles)
+    benchmark(instance.dispatch, options[-1])
+
+
+@pytest.mark.parametrize("num_options", NUM_OPTIONS)
+def test_processed_property_membership(benchmark, num_options):
+    benchmark.group = "Options: processed property membership"
+    options, _ = make_options(num_options)
+
+    class WithOptions:
+        option = processed_property("option", options=Options(options))
+
+    instance = WithOptions()
+
+    def set_option():
+        instance.option = options[-1]
+
+    benchmark(set_option)
@@ -0,0 +1,158 @@
+"""Benchmarks of processed property getters and setters for each kwarg.
+
+Each processed property option is benchmarked in isolation on its own class
+attribute so that regressions in a single check can be identified.
+
+Run with::
+
+    pytest benchmarks/test_processed_property.py
+
+"""
+
+import pytest
+
+from pyproprop import instrumented, processed_property, trusted
+
+
+class AllOptions:
+    """Class with a processed property for each option."""
+
+    no_options = processed_property("no_options")
+    typed = processed_property("typed", type=float)
+    cast = processed_property("cast", type=float, cast=True)
+    optional = processed_property("optional", type=float, optional=True)
+    default = processed_property("default", type=float, optional=True, default=1.0)
+    iterable_allowed = processed_property(
+        "iterable_allowed", type=float, iterable_allowed=True
+    )
+    iterable_allowed_cast = processed_property(
+        "iterable_allowed_cast", type=float, cast=True, iterable_allowed=True
+    )
+    options = processed_property(
+        "options", options=("a", "b", "c"), unsupported_options=("c",)
+    )
+    min_max = processed_property("min_max", min=0.0, max=10.0)
+    min_max_exclusive = processed_property(
+        "min_max_exclusive", min=0.0, max=10.0, exclusive=True
+    )
+    reference = processed_property("reference", type=float)
+    less_than = processed_property("less_than", less_than="reference")
+    greater_than = processed_property("greater_than", greater_than="reference")
+    at_least = processed_property("at_least", at_least="reference")
+    at_most = processed_property("at_most", at_most="reference")
+    equal_to = processed_property("equal_to", equal_to="reference")
+    len_sequence = processed_property("len_sequence", len=3)
+    optimisable = processed_property("optimisable", optimisable=True)
+    method = processed_property("method", type=float, method=abs)
+    str_format = processed_property("str_format", type=str, str_format="snake")
+    read_only = processed_property("read_only", read_only=True)
+    all_numeric = processed_property(
+        "all_numeric",
+        description="numeric property with all numeric checks",
+        type=float,
+        cast=True,
+        min=0.0,
+        max=10.0,
+        less_than="reference",
+        method=abs,
+    )
+
+    def __init__(self):
+        self.reference = 5.0
+
+
+SETTER_VALUES = {
+    "no_options": 1.0,
+    "typed": 1.0,
+    "cast": 1,
+    "optional": None,
+    "default": None,
+    "iterable_allowed": (1.0, 2.0, 3.0),
+    "options": "b",
+    "min_max": 5.0,
+    "min_max_exclusive": 5.0,
+    "less_than": 1.0,
+    "greater_than": 10.0,
+    "at_least": 5.0,
+    "at_most": 5.0,
+    "equal_to": 5.0,
+    "len_sequence": (1, 2, 3),
+    "optimisable": (1.0, 2.0),
+    "method": -1.0,
+    "str_format": "Some Property Name",
+    "all_numeric": 1,
+}
+
+
+@pytest.mark.parametrize("name", list(SETTER_VALUES))
+def test_set(benchmark, name):
+    benchmark.group = "processed_property: set"
+    instance = AllOptions()
+    value = SETTER_VALUES[name]
+    benchmark(setattr, instance, name, value)
+
+
+@pytest.mark.parametrize("level", ["store_only", "keep_method"])
+def test_set_trusted(benchmark, level):
+    benchmark.group = "processed_property: set"
+    instance = AllOptions()
+    with trusted(level):
+        benchmark(setattr, instance, "all_numeric", 1.0)
+
+
+def test_set_instrumented(benchmark):
+    benchmark.group = "processed_property: set"
+    instance = AllOptions()
+    with instrumented(reset=True):
+        benchmark(setattr, instance, "all_numeric", 1.0)
+
+
+def test_set_read_only(benchmark):
+    benchmark.group = "processed_property: set"
+
+    def setup():
+        return (AllOptions(), "read_only", 1.0), {}
+
+    benchmark.pedantic(setattr, setup=setup, rounds=10000)
+
+
+@pytest.mark.parametrize("name", list(SETTER_VALUES))
+def test_get(benchmark, name):
+    benchmark.group = "processed_property: get"
+    instance = AllOptions()
+    setattr(instance, name, SETTER_VALUES[name])
+    benchmark(getattr, instance, name)
+
+
+def test_define(benchmark):
+    benchmark.group = "processed_property: define"
+    benchmark(
+        processed_property,
+        "all_numeric",
+        description="numeric property with all numeric checks",
+        type=float,
+        cast=True,
+        min=0.0,
+        max=10.0,
+        less_than="reference",
+        method=abs,
+    )
+
+
+ITERABLE_VALUES = {
+    "tuple": tuple(float(i) for i in range(1000)),
+    "list": [float(i) for i in range(1000)],
+    "list_needing_cast": [i for i in range(1000)],
+}
+
+
+@pytest.mark.parametrize("iterable", list(ITERABLE_VALUES))
+def test_set_iterable_allowed(benchmark, iterable):
+    benchmark.group = "processed_property: set iterable_allowed"
+    instance = AllOptions()
+    name = (
+        "iterable_allowed_cast"
+        if iterable == "list_needing_cast"
+        else "iterable_allowed"
+    )
+    benchmark(setattr, instance, name, ITERABLE_VALUES[iterable])
@@ -0,0 +1,72 @@
+"""Benchmarks comparing compiled processed property setters.
+
+The compiled setter generated by :func:`compile_setter` is compared against a
+reference setter that loops over the same setter dispatcher on every
+assignment, as processed properties did before setters were compiled.
+
+Run with::
+
+    pytest benchmarks/test_setter.py
+
+"""
+
+import pytest
+
+from pyproprop import processed_property
+from pyproprop.processed_property import INSTANCE
+
+
+def dispatcher_loop_setter(prop, name, description=None):
+    """Setter looping over a property's setter dispatcher on every set."""
+    storage_name = "_" + name
+    setter_dispatcher = {
+        method: (
+            args,
+            {key: (True if val is INSTANCE else val) for key, val in kwargs.items()},
+        )
+        for method, (args, kwargs) in prop.setter_dispatcher.items()
+    }
+
+    def setter(self, value):
+        for method, (args, kwargs) in setter_dispatcher.items():
+            if kwargs.get("instance") is not None:
+                kwargs["instance"] = self
+            value = method(value, *args, **kwargs)
+        setattr(self, storage_name, value)
+        setattr(self, f"{storage_name}_dir", {"name": name, "description": description})
+
+    return prop.setter(setter)
+
+
+class CompiledSetters:
+    """Class with processed properties using compiled setters."""
+
+    typed = processed_property("typed", type=float, cast=True)
+    bounded = processed_property("bounded", type=float, cast=True, min=0, max=10)
+    compared = processed_property("compared", type=float, cast=True, less_than="typed")
+
+
+class DispatcherLoopSetters:
+    """Class with the same processed properties using dispatcher loops."""
+
+    typed = dispatcher_loop_setter(CompiledSetters.typed, "typed")
+    bounded = dispatcher_loop_setter(CompiledSetters.bounded, "bounded")
+    compared = dispatcher_loop_setter(CompiledSetters.compared, "compared")
+
+
+CLASSES = {"compiled": CompiledSetters, "dispatcher_loop": DispatcherLoopSetters}
+
+
+def set_many(instance, name, value, n=1000):
+    """Repeatedly set a processed property on an instance."""
+    for _ in range(n):
+        setattr(instance, name, value)
+
+
+@pytest.mark.parametrize("setter", list(CLASSES))
+@pytest.mark.parametrize("name", ["typed", "bounded", "compared"])
+def test_set(benchmark, setter, name):
+    benchmark.group = f"setter: {name}"
+    instance = CLASSES[setter]()
+    instance.typed = 100.0
+    benchmark(set_many, instance, name, 5.0)
@@ -0,0 +1,79 @@
+"""Benchmarks of checkpointing instances by snapshot and by pickling.
+
+Run with::
+
+    pytest benchmarks/test_snapshot.py
+
+"""
+
+import pickle
+
+from pyproprop import (
+    processed_property,
+    processed_property_picklable,
+    restore,
+    snapshot,
+)
+
+NUM_INSTANCES = 1000
+
+
+class Solver:
+    """Class with several processed properties."""
+
+    tolerance = processed_property("tolerance", type=float, cast=True, min=0)
+    max_iterations = processed_property("max_iterations", type=int, min=1)
+    method = processed_property("method", options=("newton", "bisection"))
+    lower = processed_property("lower", type=float, cast=True)
+    upper = processed_property("upper", type=float, cast=True, greater_than="lower")
+
+    def __init__(self):
+        self.tolerance = 1e-6
+        self.max_iterations = 100
+        self.method = "newton"
+        self.lower = 0
+        self.upper = 1
+
+
+PicklableSolver = processed_property_picklable(
+    type("PicklableSolver", (Solver,), {})
+)
+
+ATTR_NAMES = ("tolerance", "max_iterations", "method", "lower", "upper")
+
+
+def test_resetting(benchmark):
+    benchmark.group = "checkpoint restore"
+    instances = [Solver() for _ in range(NUM_INSTANCES)]
+    states = [[getattr(i, name) for name in ATTR_NAMES] for i in instances]
+
+    def reset():
+        for instance, values in zip(instances, states):
+            for name, value in zip(ATTR_NAMES, values):
+                setattr(instance, name, value)
+
+    benchmark(reset)
+
+
+def test_restore(benchmark):
+    benchmark.group = "checkpoint restore"
+    instances = [Solver() for _ in range(NUM_INSTANCES)]
+    states = [snapshot(instance) for instance in instances]
+
+    def restore_all():
+        for instance, state in zip(instances, states):
+            restore(instance, state)
+
+    benchmark(restore_all)
+
+
+def test_pickle(benchmark):
+    benchmark.group = "checkpoint pickle"
+    instances = [Solver() for _ in range(NUM_INSTANCES)]
+    benchmark(lambda: pickle.loads(pickle.dumps(instances)))
+
+
+def test_pickle_picklable(benchmark):
+    benchmark.group = "checkpoint pickle"
+    instances = [PicklableSolver() for _ in range(NUM_INSTANCES)]
+    benchmark(lambda: pickle.loads(pickle.dumps(instances)))
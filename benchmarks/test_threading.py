@@ -0,0 +1,69 @@
+"""Benchmarks of processed property setter throughput across threads.
+
+Each worker thread sets processed properties on its own instances. As compiled
+setters hold no shared mutable state, no lock is needed around assignments and
+throughput scales with the number of workers on free-threaded builds of
+CPython (e.g. `python3.13t`). On builds with the GIL the benchmark measures
+the contention overhead of running setters from a thread pool.
+
+Run with::
+
+    pytest benchmarks/test_threading.py
+
+"""
+
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pyproprop import processed_property
+
+NUM_SETS = 10000
+
+
+def gil_enabled():
+    """Whether the running interpreter has the GIL enabled."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+class RelatedProperties:
+    """Class with processed properties that check against the instance."""
+
+    upper = processed_property("upper", type=float, cast=True)
+    lower = processed_property("lower", type=float, cast=True, less_than="upper")
+
+
+def set_many(_):
+    """Set processed properties on a thread-local instance."""
+    instance = RelatedProperties()
+    instance.upper = 10.0
+    for _ in range(NUM_SETS):
+        instance.lower = 5.0
+
+
+def set_many_locked(lock):
+    """Set processed properties with every assignment behind a global lock."""
+    instance = RelatedProperties()
+    instance.upper = 10.0
+    for _ in range(NUM_SETS):
+        with lock:
+            instance.lower = 5.0
+
+
+@pytest.mark.parametrize("num_threads", [1, 2, 4, 8])
+@pytest.mark.parametrize("locked", [False, True], ids=["lock_free", "global_lock"])
+def test_threaded_set(benchmark, num_threads, locked):
+    gil = "gil" if gil_enabled() else "free-threaded"
+    benchmark.group = f"threaded setter ({gil}): {num_threads} threads"
+    benchmark.extra_info["gil_enabled"] = gil_enabled()
+    lock = threading.Lock()
+    func = set_many_locked if locked else set_many
+
+    def run():
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            list(executor.map(func, [lock] * num_threads))
+
+    benchmark(run)
@@ -0,0 +1,90 @@
+"""Benchmarks of transactional updates against setting properties one by one.
+
+Run with::
+
+    pytest benchmarks/test_transaction.py
+
+"""
+
+from pyproprop import processed_property, transaction, update
+
+
+class Bounds:
+    """Class with processed properties related to one another."""
+
+    lower = processed_property("lower", type=float, less_than="upper")
+    upper = processed_property("upper", type=float, greater_than="lower")
+    guess = processed_property("guess", type=float, at_least="lower", at_most="upper")
+
+    def __init__(self):
+        self.lower = 0.0
+        self.upper = 10.0
+        self.guess = 5.0
+
+
+VALUES = {"lower": 1.0, "upper": 9.0, "guess": 4.0}
+
+
+def test_setattr(benchmark):
+    benchmark.group = "bulk assignment"
+    instance = Bounds()
+
+    def set_all():
+        for name, value in VALUES.items():
+            setattr(instance, name, value)
+
+    benchmark(set_all)
+
+
+def test_update(benchmark):
+    benchmark.group = "bulk assignment"
+    benchmark(update, Bounds(), **VALUES)
+
+
+def test_transaction(benchmark):
+    benchmark.group = "bulk assignment"
+    instance = Bounds()
+
+    def set_all():
+        with transaction(instance):
+            for name, value in VALUES.items():
+                setattr(instance, name, value)
+
+    benchmark(set_all)
+
+
+NUM_CHAINED = 500
+
+# Class with a chain of properties each less than the next, so that each is
+# touched by at most two relations however many properties the class has
+ChainedBounds = type(
+    "ChainedBounds",
+    (),
+    {
+        f"x{i}": processed_property(
+            f"x{i}", type=float, less_than=f"x{i + 1}" if i < NUM_CHAINED - 1 else None
+        )
+        for i in range(NUM_CHAINED)
+    },
+)
+
+
+def chained_bounds():
+    instance = ChainedBounds()
+    for i in range(NUM_CHAINED):
+        setattr(instance, f"x{i}", float(i))
+    return instance
+
+
+def test_setattr_chained(benchmark):
+    benchmark.group = "related properties"
+    benchmark(
+        setattr, chained_bounds(), f"x{NUM_CHAINED // 2}", float(NUM_CHAINED // 2)
+    )
+
+
+def test_update_chained(benchmark):
+    benchmark.group = "related properties"
+    instance = chained_bounds()
+    values = {f"x{i}": float(i) for i in range(0, NUM_CHAINED, 50)}
+    benchmark(update, instance, **values)
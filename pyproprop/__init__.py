@@ -1,4 +1,24 @@
-from .format_str_case import format_str_case
-from .named_iterable import named_iterable
+from .cast import register_cast
+from .columnar import ProcessedPropertyArray
+from .format_str_case import format_str_case, format_str_case_many
+from .instrumentation import (
+    disable_instrumentation,
+    enable_instrumentation,
+    export_instrumentation,
+    instrumentation_snapshot,
+    instrumented,
+    reset_instrumentation,
+)
+from .loading import load_csv, load_many
+from .named_iterable import clear_sympify_cache, named_iterable
+from .optimisable import OptimisableParameters
 from .options import Options
-from .processed_property import processed_property
+from .processed_property import (
+    check_bounds_many,
+    processed_property,
+    processed_property_slots,
+    processed_property_trusted,
+    trusted,
+)
+from .snapshot import UNSET, processed_property_picklable, restore, snapshot
+from .transaction import transaction, update
@@ -0,0 +1,191 @@
+"""Registry of functions used to cast values to a processed property's type.
+
+Processed properties with `cast=True` attempt to cast values that are not
+already of the expected type. The function used for a given type is looked up
+in :py:const:`CAST_DISPATCHER`, falling back to calling the type itself.
+Additional types can be supported, or the casting of an existing type
+customised, using :func:`register_cast`.
+
+Casts to Numpy types are only added to the registry once Numpy has been
+imported, so that importing this module does not import Numpy.
+
+Attributes
+----------
+CAST_DISPATCHER : dict
+    Dispatcher mapping types to the functions used to cast values to them.
+
+"""
+
+import sys
+from decimal import Decimal
+from fractions import Fraction
+
+from .lazy_import import LazyModule
+
+np = LazyModule("numpy")
+
+__all__ = ["register_cast"]
+
+
+def numpy_scalar_types():
+    """Concrete Numpy scalar types, e.g. :py:class:`numpy.float64`."""
+    return {
+        scalar_type
+        for scalar_type in np.sctypeDict.values()
+        if issubclass(scalar_type, np.generic)
+    }
+
+
+TRUE_STRINGS = {"true"}
+FALSE_STRINGS = {"false"}
+
+
+def cast_bool(value):
+    """Cast a value to `bool`, parsing strings rather than testing truthiness.
+
+    Strings are parsed as `"True"` or `"False"`, case-insensitively, or as a
+    number, so `"False"` and `"0"` are cast to `False`. Other values are cast
+    by calling `bool`.
+
+    Raises
+    ------
+    ValueError
+        If a string is neither a boolean nor a number.
+
+    """
+    if not isinstance(value, str):
+        return bool(value)
+    stripped = value.strip()
+    if stripped.lower() in TRUE_STRINGS:
+        return True
+    if stripped.lower() in FALSE_STRINGS:
+        return False
+    try:
+        return bool(float(stripped))
+    except ValueError:
+        msg = f"{repr(value)} cannot be cast to a bool."
+        raise ValueError(msg) from None
+
+
+def cast_int(value):
+    """Cast a value to `int`, accepting strings of non-integral numbers.
+
+    Strings that `int` rejects but that are numbers, e.g. `"3.0"`, `"3.5"` or
+    `"1e3"`, are parsed as a `float` and truncated, as `int(3.5)` would be.
+    Other values are cast by calling `int`.
+
+    """
+    if not isinstance(value, str):
+        return int(value)
+    try:
+        return int(value)
+    except ValueError:
+        return int(float(value))
+
+
+CAST_DISPATCHER = {
+    int: cast_int,
+    float: float,
+    str: str,
+    bool: cast_bool,
+    complex: complex,
+    Decimal: Decimal,
+    Fraction: Fraction,
+}
+
+
+# Casts registered by the package, used to tell whether a user has registered
+# their own cast for a type with `register_cast`
+DEFAULT_CAST_DISPATCHER = dict(CAST_DISPATCHER)
+
+
+def register_numpy_casts():
+    """Add casts to Numpy types not already registered by the user.
+
+    Returns
+    -------
+    bool
+        Whether the casts were registered, i.e. whether Numpy had been
+        imported. If it has not then no value can be of a Numpy type.
+
+    """
+    if "numpy" not in sys.modules:
+        return False
+    CAST_DISPATCHER.setdefault(np.ndarray, np.array)
+    for scalar_type in numpy_scalar_types():
+        CAST_DISPATCHER.setdefault(scalar_type, scalar_type)
+    return True
+
+
+# Mutable flag recording whether :func:`register_numpy_casts` has succeeded
+_numpy_casts_registered = [False]
+
+
+def register_cast(expected_type, cast_func):
+    """Register the function used to cast values to a specified type.
+
+    Parameters
+    ----------
+    expected_type : type
+        The type, as supplied to a processed property's `type` kwarg, that
+        values are to be cast to.
+    cast_func : Callable
+        Function taking a single value and returning it cast to
+        `expected_type`. Should raise a `ValueError` or `TypeError` if the
+        value cannot be cast.
+
+    Raises
+    ------
+    TypeError
+        If `expected_type` is not a type or `cast_func` is not callable.
+
+    Example
+    -------
+    >>> register_cast(Path, lambda value: Path(value).resolve())
+
+    """
+    if not isinstance(expected_type, type):
+        msg = f"Casts can only be registered for types, not {repr(expected_type)}."
+        raise TypeError(msg)
+    if not callable(cast_func):
+        msg = f"Cast function for {repr(expected_type)} must be callable."
+        raise TypeError(msg)
+    CAST_DISPATCHER[expected_type] = cast_func
+
+
+def cast_value(value, expected_type):
+    """Cast a value to a type using the registered cast function.
+
+    Parameters
+    ----------
+    value : obj
+        Value to be cast.
+    expected_type : type
+        Type the value should be cast to.
+
+    Returns
+    -------
+    obj
+        The value cast to `expected_type`. If no cast function has been
+        registered for the type then the type is called with the value.
+
+    """
+    try:
+        cast_func = CAST_DISPATCHER[expected_type]
+    except KeyError:
+        if not _numpy_casts_registered[0]:
+            _numpy_casts_registered[0] = register_numpy_casts()
+        cast_func = CAST_DISPATCHER.get(expected_type, expected_type)
+    return cast_func(value)
+
+
+def has_default_cast(expected_type):
+    """Whether values are cast to a type by the package's default cast.
+
+    This is `False` if a different cast has been registered for the type with
+    :func:`register_cast`. Types without a registered cast, including Numpy
+    types, are cast by calling the type by default.
+
+    """
+    cast_func = CAST_DISPATCHER.get(expected_type, expected_type)
+    return cast_func is DEFAULT_CAST_DISPATCHER.get(expected_type, expected_type)
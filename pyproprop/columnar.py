@@ -0,0 +1,434 @@
+"""Columnar storage of many records of a processed property class.
+
+Holding a large number of small instances of a class whose attributes are
+processed properties has a significant per-instance memory and iteration
+cost. :class:`ProcessedPropertyArray` instead stores each processed property
+of a class as a Numpy column, with rows appended or columns assigned in bulk
+and checked with the same processed property checks:
+
+- Properties with a numeric `type` (`bool`, `int`, `float` or `complex`), and
+  whose only other checks are `cast`, `min`, `max` and relational checks, are
+  stored in columns of the equivalent dtype and checked vectorised over the
+  whole column.
+- Properties with `options` are stored as integer codes indexing
+  :meth:`ProcessedPropertyArray.categories`. Each distinct value is only
+  checked once.
+- All other properties are stored in object columns and each value is checked
+  individually.
+
+Relational checks between properties are made vectorised between columns.
+
+"""
+
+from .lazy_import import LazyModule
+from .processed_property import (
+    COMPARISON_CHECKS,
+    check_array_dtype,
+    check_expected_type,
+    check_max,
+    check_min,
+    check_options,
+    compare,
+    comparison_error_message,
+    get_processed_properties,
+    trusted,
+)
+from .utils import format_for_output
+
+np = LazyModule("numpy")
+
+__all__ = ["ProcessedPropertyArray"]
+
+NUMERIC_COLUMN_KEYWORD = "numeric"
+OPTIONS_COLUMN_KEYWORD = "options"
+OBJECT_COLUMN_KEYWORD = "object"
+
+# Numpy dtypes of the columns for numeric types
+NUMERIC_COLUMN_DTYPES = {
+    bool: "bool",
+    int: "int64",
+    float: "float64",
+    complex: "complex128",
+}
+
+# Checks that can be made vectorised over a numeric column
+NUMERIC_COLUMN_CHECKS = {check_expected_type, check_min, check_max, *COMPARISON_CHECKS}
+
+INITIAL_CAPACITY = 16
+
+
+class Column:
+    """Storage and checks for a single processed property.
+
+    Attributes
+    ----------
+    kind : str
+        One of `"numeric"`, `"options"` or `"object"`.
+    data : :py:class:`numpy.ndarray`
+        Backing array, with capacity for more rows than are in use.
+    categories : list
+        For options columns, the values indexed by the stored codes.
+
+    """
+
+    def __init__(self, attr_name, prop):
+        self.attr_name = attr_name
+        self.prop = prop
+        self.categories = None
+        self.kind, dtype = self.column_kind(prop)
+        if self.kind == OPTIONS_COLUMN_KEYWORD:
+            self.codes = {option: i for i, option in enumerate(self.categories)}
+        self.data = np.empty(INITIAL_CAPACITY, dtype=dtype)
+
+    def column_kind(self, prop):
+        """Kind and dtype of the column used to store a processed property."""
+        steps = prop.setter_dispatcher
+        if check_expected_type in steps:
+            (
+                iterable_allowed,
+                expected_type,
+                _,
+                optional,
+                _,
+                _,
+            ) = steps[check_expected_type][0]
+            if (
+                expected_type in NUMERIC_COLUMN_DTYPES
+                and not iterable_allowed
+                and not optional
+                and set(steps) <= NUMERIC_COLUMN_CHECKS
+            ):
+                return NUMERIC_COLUMN_KEYWORD, NUMERIC_COLUMN_DTYPES[expected_type]
+        if check_options in steps:
+            valid_options = steps[check_options][0][2]
+            try:
+                {option: None for option in valid_options}
+            except TypeError:
+                pass
+            else:
+                self.categories = list(valid_options)
+                return OPTIONS_COLUMN_KEYWORD, "int64"
+        return OBJECT_COLUMN_KEYWORD, object
+
+    def process(self, values):
+        """Check new values, returning them in the column's storage form.
+
+        Parameters
+        ----------
+        values : Iterable
+            Values to be stored in the column.
+
+        Returns
+        -------
+        :py:class:`numpy.ndarray`
+            One-dimensional array of the processed values, or of their codes
+            for options columns.
+
+        Raises
+        ------
+        TypeError, ValueError
+            As raised by the processed property's checks.
+
+        """
+        if self.kind == NUMERIC_COLUMN_KEYWORD:
+            return self.process_numeric(values)
+        if self.kind == OPTIONS_COLUMN_KEYWORD:
+            return self.process_options(values)
+        validator = self.prop.validator
+        processed = np.empty(len(values), dtype=object)
+        for i, value in enumerate(values):
+            processed[i] = validator(None, value)
+        return processed
+
+    def process_numeric(self, values):
+        """Check new values of a numeric column vectorised."""
+        array = np.asarray(values)
+        if array.ndim != 1:
+            msg = (
+                f"Values of {repr(self.attr_name)} must be one-dimensional, "
+                f"instead got shape {array.shape}."
+            )
+            raise ValueError(msg)
+        if not array.size:
+            return np.empty(0, dtype=self.data.dtype)
+        for method, (args, _) in self.prop.setter_dispatcher.items():
+            if method is check_expected_type:
+                _, expected_type, name_str, _, cast_to_type, _ = args
+                if array.dtype == object:
+                    array = np.array(array.tolist())
+                if expected_type is int and array.dtype == bool:
+                    # Like the setter, as `bool` is a subclass of `int`
+                    array = array.astype(self.data.dtype)
+                array = check_array_dtype(array, expected_type, name_str, cast_to_type)
+            elif method in (check_min, check_max):
+                method(array, *args)
+        return array.astype(self.data.dtype, copy=False)
+
+    def process_options(self, values):
+        """Check each distinct new value of an options column once."""
+        validator = self.prop.validator
+        codes_by_value = {}
+        codes = np.empty(len(values), dtype=self.data.dtype)
+        for i, value in enumerate(values):
+            try:
+                code = codes_by_value[value]
+            except KeyError:
+                processed = validator(None, value)
+                code = self.codes.get(processed)
+                if code is None:
+                    code = self.codes[processed] = len(self.categories)
+                    self.categories.append(processed)
+                codes_by_value[value] = code
+            except TypeError:
+                # Unhashable values are checked individually
+                processed = validator(None, value)
+                code = self.codes[processed]
+            codes[i] = code
+        return codes
+
+    def decode(self, data):
+        """Values of the column from stored data."""
+        if self.kind == OPTIONS_COLUMN_KEYWORD:
+            categories = np.empty(len(self.categories), dtype=object)
+            categories[:] = self.categories
+            return categories[data]
+        return data
+
+    def reserve(self, capacity):
+        """Grow the backing array to hold at least `capacity` rows."""
+        if capacity > len(self.data):
+            new_capacity = max(capacity, 2 * len(self.data))
+            data = np.empty(new_capacity, dtype=self.data.dtype)
+            data[: len(self.data)] = self.data
+            self.data = data
+
+
+class ProcessedPropertyArray:
+    """Columnar container of records of a processed property class.
+
+    Parameters
+    ----------
+    cls : type
+        Class whose processed properties define the columns.
+
+    Example
+    -------
+    >>> records = ProcessedPropertyArray(Bounds)
+    >>> records.extend(lower=[0.0, 1.0], upper=[1.0, 2.0])
+    >>> records["upper"]
+    array([1., 2.])
+
+    """
+
+    def __init__(self, cls):
+        self.cls = cls
+        self._columns = {
+            attr_name: Column(attr_name, prop)
+            for attr_name, prop in get_processed_properties(cls).items()
+        }
+        self._len = 0
+
+    def __len__(self):
+        return self._len
+
+    @property
+    def columns(self):
+        """Names of the columns, in definition order."""
+        return tuple(self._columns)
+
+    def column_kind(self, name):
+        """Kind of a column: `"numeric"`, `"options"` or `"object"`."""
+        return self.column(name).kind
+
+    def categories(self, name):
+        """Values indexed by the codes of an options column."""
+        column = self.column(name)
+        if column.kind != OPTIONS_COLUMN_KEYWORD:
+            msg = f"{repr(name)} is not an options column."
+            raise ValueError(msg)
+        return tuple(column.categories)
+
+    def codes(self, name):
+        """Read-only view of the stored data of a column.
+
+        For options columns these are the codes indexing
+        :meth:`categories`, for other columns the values themselves.
+
+        """
+        data = self.column(name).data[: self._len]
+        data.flags.writeable = False
+        return data
+
+    def column(self, name):
+        """The :class:`Column` storing a processed property."""
+        try:
+            return self._columns[name]
+        except KeyError:
+            msg = (
+                f"{repr(name)} not a processed property of "
+                f"{repr(self.cls.__name__)}."
+            )
+            raise AttributeError(msg) from None
+
+    def __getitem__(self, name):
+        """Values of a column as a read-only array."""
+        column = self.column(name)
+        values = column.decode(self.codes(name))
+        values.flags.writeable = False
+        return values
+
+    def __setitem__(self, name, values):
+        """Check and replace all values of a column.
+
+        Raises
+        ------
+        ValueError
+            If the number of values is not the number of rows, if any value
+            fails the processed property's checks, or if any relation with
+            another column does not hold.
+
+        """
+        column = self.column(name)
+        if len(values) != self._len:
+            msg = (
+                f"{repr(name)} must be assigned {self._len} values, instead "
+                f"got {len(values)}."
+            )
+            raise ValueError(msg)
+        processed = column.process(values)
+        new = {
+            other_name: other.decode(self.codes(other_name))
+            for other_name, other in self._columns.items()
+        }
+        new[name] = column.decode(processed)
+        self.check_relations(new, {name})
+        column.data[: self._len] = processed
+
+    def append(self, **values):
+        """Check and add a single record.
+
+        Parameters
+        ----------
+        **values
+            Value of each processed property keyed by name.
+
+        """
+        self.extend(**{name: [value] for name, value in values.items()})
+
+    def extend(self, **columns):
+        """Check and add many records at once.
+
+        Either all records are added or, if any check fails, none are.
+
+        Parameters
+        ----------
+        **columns
+            Sequence of values of each processed property keyed by name. All
+            processed properties must be given, with the same number of
+            values.
+
+        Raises
+        ------
+        AttributeError
+            If any name is not a processed property of the class.
+        ValueError
+            If any processed property is missing, if the sequences have
+            different lengths, if any value fails its processed property's
+            checks, or if any relation between the new values does not hold.
+
+        """
+        invalids = [name for name in columns if name not in self._columns]
+        if invalids:
+            msg = (
+                f"{format_for_output(invalids)} not processed properties of "
+                f"{repr(self.cls.__name__)}."
+            )
+            raise AttributeError(msg)
+        missing = [name for name in self._columns if name not in columns]
+        if missing:
+            msg = f"Values must be given for {format_for_output(missing)}."
+            raise ValueError(msg)
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            msg = "All processed properties must be given the same number of values."
+            raise ValueError(msg)
+        num_new = lengths.pop() if lengths else 0
+        processed = {
+            name: column.process(columns[name])
+            for name, column in self._columns.items()
+        }
+        self.check_relations(
+            {
+                name: column.decode(processed[name])
+                for name, column in self._columns.items()
+            },
+            set(self._columns),
+        )
+        start = self._len
+        stop = start + num_new
+        for name, column in self._columns.items():
+            column.reserve(stop)
+            column.data[start:stop] = processed[name]
+        self._len = stop
+
+    def check_relations(self, values, changed):
+        """Check each relation touching a changed column, vectorised.
+
+        Parameters
+        ----------
+        values : dict
+            Arrays of values keyed by column name.
+        changed : set
+            Names of the columns whose values have changed.
+
+        Raises
+        ------
+        ValueError
+            If any relation does not hold for any row.
+
+        """
+        for name, column in self._columns.items():
+            relations = getattr(column.prop, "relations", None)
+            if relations is None:
+                continue
+            for relation in relations.declared:
+                other = relation.other
+                if other not in values or not ({name, other} & changed):
+                    continue
+                value = values[name]
+                other_value = values[other]
+                if not len(value) or compare(
+                    relation.comparison_func, value, other_value
+                ):
+                    continue
+                msg = comparison_error_message(
+                    value,
+                    other_value,
+                    self.cls,
+                    other,
+                    relation.comparison_description,
+                    relation.comparison_func,
+                    relation.name,
+                    relation.description,
+                )
+                raise ValueError(msg)
+
+    def row(self, index):
+        """Record at an index as an instance of the class.
+
+        The instance is created without calling its `__init__` and its
+        processed properties are set without being checked again.
+
+        """
+        if not -self._len <= index < self._len:
+            msg = f"Index {index} is out of range for {self._len} records."
+            raise IndexError(msg)
+        index %= self._len
+        instance = self.cls.__new__(self.cls)
+        with trusted():
+            for name, column in self._columns.items():
+                value = column.decode(column.data[index : index + 1])[0]
+                if column.kind == NUMERIC_COLUMN_KEYWORD:
+                    value = value.item()
+                setattr(instance, name, value)
+        return instance
@@ -24,14 +24,20 @@ SUPPORTED_STR_FORMAT_OPTIONS : set
 FORMAT_STR_DISPATCHER : dict
     Dispatcher mapping string format identifier keywords to formatting
     functions.
+FORMAT_STR_CACHE_SIZE : int
+    Maximum number of results kept by :func:`cached_format_str_case`, after
+    which the least recently used is evicted.
 
 """
 
 import re
+from functools import lru_cache
 
-import titlecase
+from .lazy_import import LazyModule
 
-__all__ = ["format_str_case"]
+titlecase = LazyModule("titlecase")
+
+__all__ = ["format_str_case", "format_str_case_many"]
 
 
 LOWER_STR_CASE_FORMAT_KEYWORD = "lower"
@@ -51,9 +57,20 @@ SUPPORTED_STR_FORMAT_OPTIONS = {
     PASCAL_STR_CASE_FORMAT_KEYWORD,
     HYPHEN_STR_CASE_FORMAT_KEYWORD,
 }
+FORMAT_STR_CACHE_SIZE = 4096
+
+# Regular expressions are compiled once rather than looked up in the `re`
+# module's cache on every call
+MULTIPLE_SPACES_REGEX = re.compile(" +")
+MISSING_SPACE_AFTER_PUNCTUATION_REGEX = re.compile(r"([,.!?])([^ 0-9])")
+PUNCTUATION_REGEX = re.compile(r"[,'!?\"'#$£%&\()*+./:;<=>?@\[\\\]^`{|}~]")
+SEPARATORS_REGEX = re.compile(r"[ \-_]+")
+TRAILING_UNDERSCORE_REGEX = re.compile(r"_$")
+TRAILING_SPACE_REGEX = re.compile(r" $")
+TRAILING_HYPHEN_REGEX = re.compile(r"-$")
 
 
-def format_str_case(item, case, process=False):
+def format_str_case(item, case, process=False, cache=False):
     """Format the given string to a specified formatting case.
 
     Options for formatting cases are: lower, upper, title, snake and pascal.
@@ -69,6 +86,10 @@ def format_str_case(item, case, process=False):
     process : :py:obj:`bool`
         If `True`, whitespace is converted to a single space, whitespace is
         inserted after [,.!?], and leading/trailing whitespace is stripped.
+    cache : :py:obj:`bool`
+        If `True`, the result is looked up in, or added to, a bounded cache
+        keyed by `(item, case, process)`. Useful when the same strings are
+        formatted repeatedly. `item` must be hashable.
 
     Returns
     -------
@@ -76,17 +97,97 @@ def format_str_case(item, case, process=False):
         The string item passed as a parameter in formatted form.
 
     """
+    if cache:
+        return cached_format_str_case(item, case, process)
     if process:
-        # Convert whitespace to single space
-        item = re.sub(" +", " ", item)
-        # Insert whitespace after [,.!?]
-        item = re.sub(r"([,.!?])([^ 0-9])", r"\1 \2", item)
-        # Strip trailing or leading whitespace
-        item = item.strip()
-        # Dispatch specialised case format method
+        item = process_str(item)
+    # Dispatch specialised case format method
     return FORMAT_STR_DISPATCHER[case](item)
 
 
+def format_str_case_many(items, case, process=False, deduplicate=False, lazy=False):
+    """Format many strings to the same specified formatting case.
+
+    Equivalent to calling :func:`format_str_case` on each item, but the
+    formatting function is only looked up once.
+
+    Parameters
+    ----------
+    items : Iterable[str]
+        The string objects to be formatted.
+    case : str or :py:obj:`None`
+        The keyword identifier for which formatting method is to be used.
+    process : :py:obj:`bool`
+        If `True`, each item is processed as by :func:`format_str_case`
+        before formatting.
+    deduplicate : :py:obj:`bool`
+        If `True`, each distinct item is only formatted once and the result
+        reused for any repeats. Useful when `items` contains many duplicates.
+    lazy : :py:obj:`bool`
+        If `True`, an iterator is returned which formats each item as it is
+        consumed, rather than a list.
+
+    Returns
+    -------
+    list or Iterator[str]
+        The formatted strings, in the same order as `items`.
+
+    Raises
+    ------
+    KeyError
+        If `case` is not a supported formatting case.
+
+    """
+    formatter = FORMAT_STR_DISPATCHER[case]
+    if process:
+        base_formatter = formatter
+
+        def formatter(item):
+            return base_formatter(process_str(item))
+
+    if deduplicate:
+        formatted = {}
+
+        def format_item(item):
+            try:
+                return formatted[item]
+            except KeyError:
+                formatted_item = formatted[item] = formatter(item)
+                return formatted_item
+
+    else:
+        format_item = formatter
+    if lazy:
+        return map(format_item, items)
+    return list(map(format_item, items))
+
+
+@lru_cache(maxsize=FORMAT_STR_CACHE_SIZE)
+def cached_format_str_case(item, case, process):
+    """Format a string as :func:`format_str_case`, caching the result.
+
+    Cache statistics are available from `cached_format_str_case.cache_info()`
+    and the cache can be emptied with `cached_format_str_case.cache_clear()`.
+
+    """
+    return format_str_case(item, case, process)
+
+
+def process_str(item):
+    """Normalise whitespace and punctuation spacing in a string.
+
+    Whitespace is converted to a single space, whitespace is inserted after
+    [,.!?], and leading/trailing whitespace is stripped.
+
+    """
+    # Convert whitespace to single space
+    item = MULTIPLE_SPACES_REGEX.sub(" ", item)
+    # Insert whitespace after [,.!?]
+    item = MISSING_SPACE_AFTER_PUNCTUATION_REGEX.sub(r"\1 \2", item)
+    # Strip trailing or leading whitespace
+    return item.strip()
+
+
 def format_str_lower_case(item):
     """Format the given string to lower case.
 
@@ -266,13 +367,11 @@ def format_str_snake_case(item):
 
     """
     # Strip punctuation
-    item = re.sub(r"[,'!?\"'#$£%&\()*+./:;<=>?@\[\\\]^`{|}~]", r"", item)
-    # Replace separators with underscores
-    item = re.sub(r"[ \-_]", r"_", item)
-    # Replace more than one consecutive underscore with single underscore
-    item = re.sub(r"_+", r"_", item)
+    item = PUNCTUATION_REGEX.sub("", item)
+    # Replace consecutive separators with a single underscore
+    item = SEPARATORS_REGEX.sub("_", item)
     # Strip underscore from end of string
-    item = re.sub(r"_$", r"", item)
+    item = TRAILING_UNDERSCORE_REGEX.sub("", item)
     # Return lower case
     return item.lower()
 
@@ -309,19 +408,15 @@ def format_str_pascal_case(item):
 
     """
     # Strip punctuation
-    item = re.sub(r"[,'!?\"'#$£%&\()*+./:;<=>?@\[\\\]^`{|}~]", r"", item)
-    # Replace separators with underscores
-    item = re.sub(r"[ \-_]", r" ", item)
-    # Replace more than one consecutive underscore with single underscore
-    item = re.sub(r" +", r" ", item)
-    # Strip underscore from end of string
-    item = re.sub(r" $", r"", item)
+    item = PUNCTUATION_REGEX.sub("", item)
+    # Replace consecutive separators with a single space
+    item = SEPARATORS_REGEX.sub(" ", item)
+    # Strip space from end of string
+    item = TRAILING_SPACE_REGEX.sub("", item)
     # Format title case
     item = titlecase.titlecase(item)
-    # Iterate over words and ensure all start uppercase
-    item = "".join(f"{word[0].capitalize()}{word[1:]}" for word in item.split())
-    # Return with underscores removed
-    return re.sub(r" ", r"", item)
+    # Iterate over words and ensure all start uppercase, joining without spaces
+    return "".join(f"{word[0].capitalize()}{word[1:]}" for word in item.split())
 
 
 def format_str_hyphen_case(item):
@@ -356,13 +451,11 @@ def format_str_hyphen_case(item):
 
     """
     # Strip punctuation
-    item = re.sub(r"[,'!?\"'#$£%&\()*+./:;<=>?@\[\\\]^`{|}~]", r"", item)
-    # Replace separators with hyphens
-    item = re.sub(r"[ \-_]", r"-", item)
-    # Replace more than one consecutive hyphen with single hyphen
-    item = re.sub(r"-+", r"-", item)
+    item = PUNCTUATION_REGEX.sub("", item)
+    # Replace consecutive separators with a single hyphen
+    item = SEPARATORS_REGEX.sub("-", item)
     # Strip hyphen from end of string
-    item = re.sub(r"-$", r"", item)
+    item = TRAILING_HYPHEN_REGEX.sub("", item)
     # Return lower case
     return item.lower()
 
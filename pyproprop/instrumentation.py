@@ -0,0 +1,162 @@
+"""Opt-in instrumentation of processed property setters.
+
+While instrumentation is enabled, every processed property setter records,
+per class and property, the number of times it has been set, the number of
+those sets that failed by exception type, and the cumulative time taken by
+each of its checks. Checks are named after the :func:`processed_property`
+kwarg that enables them, e.g. `"type"` (which includes any casting),
+`"options"`, `"min"`, `"less_than"` and `"method"`. Relational checks
+declared by other properties against the value being set are timed as
+`"reverse_relations"`. The check that fails a set is timed up to when it
+raised.
+
+When instrumentation is disabled setters make no additional checks, so it
+has no cost. Values validated by :func:`pyproprop.update` are not recorded.
+
+"""
+
+import copy
+import json
+from contextlib import contextmanager
+
+from .processed_property import active_setter_states, instrumentation_state
+
+__all__ = [
+    "disable_instrumentation",
+    "enable_instrumentation",
+    "export_instrumentation",
+    "instrumentation_snapshot",
+    "instrumented",
+    "reset_instrumentation",
+]
+
+JSON_EXPORT_KEYWORD = "json"
+TEXT_EXPORT_KEYWORD = "text"
+SUPPORTED_EXPORT_FORMATS = {JSON_EXPORT_KEYWORD, TEXT_EXPORT_KEYWORD}
+
+
+def enable_instrumentation():
+    """Start recording statistics in all processed property setters."""
+    with instrumentation_state.lock:
+        if instrumentation_state.enabled:
+            return
+        instrumentation_state.enabled = True
+    active_setter_states.update(1)
+
+
+def disable_instrumentation():
+    """Stop recording statistics. Those already recorded are kept."""
+    with instrumentation_state.lock:
+        if not instrumentation_state.enabled:
+            return
+        instrumentation_state.enabled = False
+    active_setter_states.update(-1)
+
+
+def reset_instrumentation():
+    """Discard all recorded statistics."""
+    with instrumentation_state.lock:
+        instrumentation_state.stats.clear()
+
+
+@contextmanager
+def instrumented(reset=False):
+    """Context manager enabling instrumentation within its scope.
+
+    Parameters
+    ----------
+    reset : bool
+        If `True`, previously recorded statistics are discarded on entry.
+
+    Example
+    -------
+    >>> with instrumented():
+    ...     run_model()
+    >>> export_instrumentation("instrumentation.json")
+
+    """
+    was_enabled = instrumentation_state.enabled
+    if reset:
+        reset_instrumentation()
+    enable_instrumentation()
+    try:
+        yield
+    finally:
+        if not was_enabled:
+            disable_instrumentation()
+
+
+def instrumentation_snapshot():
+    """Copy of the statistics recorded so far.
+
+    Returns
+    -------
+    dict
+        Mapping of class names, qualified by module, to mappings of
+        processed property names to dicts of their statistics. These have the
+        keys `"sets"` (number of sets), `"failures"` (mapping of exception
+        type names to the number of sets that raised them) and `"step_times"`
+        (mapping of check names to the cumulative time in seconds spent
+        making them).
+
+    """
+    with instrumentation_state.lock:
+        stats = copy.deepcopy(instrumentation_state.stats)
+    snapshot = {}
+    for (cls, name), prop_stats in stats.items():
+        cls_name = f"{cls.__module__}.{cls.__qualname__}"
+        snapshot.setdefault(cls_name, {})[name] = prop_stats
+    return snapshot
+
+
+def export_instrumentation(file, format=JSON_EXPORT_KEYWORD):
+    """Write the statistics recorded so far to a file.
+
+    Parameters
+    ----------
+    file : Union[str, os.PathLike, TextIO]
+        Path of the file to write, or an open text file.
+    format : str
+        Either `"json"`, in which case the output of
+        :func:`instrumentation_snapshot` is written as JSON, or `"text"`, in
+        which case a plain-text report is written.
+
+    Raises
+    ------
+    ValueError
+        If `format` is not supported.
+
+    """
+    if format not in SUPPORTED_EXPORT_FORMATS:
+        msg = (
+            f"{repr(format)} is not a valid export format. Please choose one "
+            f"of: {repr(JSON_EXPORT_KEYWORD)} or {repr(TEXT_EXPORT_KEYWORD)}."
+        )
+        raise ValueError(msg)
+    snapshot = instrumentation_snapshot()
+    if format == JSON_EXPORT_KEYWORD:
+        output = json.dumps(snapshot, indent=2, sort_keys=True) + "\n"
+    else:
+        output = format_text_report(snapshot)
+    if hasattr(file, "write"):
+        file.write(output)
+    else:
+        with open(file, "w") as opened_file:
+            opened_file.write(output)
+
+
+def format_text_report(snapshot):
+    """Plain-text report of a snapshot from :func:`instrumentation_snapshot`."""
+    lines = []
+    for cls_name, props in sorted(snapshot.items()):
+        lines.append(cls_name)
+        for name, prop_stats in sorted(props.items()):
+            num_failures = sum(prop_stats["failures"].values())
+            lines.append(
+                f"  {name}: {prop_stats['sets']} sets, {num_failures} failures"
+            )
+            for error_name, count in sorted(prop_stats["failures"].items()):
+                lines.append(f"    {error_name}: {count}")
+            for step, step_time in prop_stats["step_times"].items():
+                lines.append(f"    {step}: {step_time:.6f}s")
+    return "\n".join(lines) + "\n"
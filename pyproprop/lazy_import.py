@@ -0,0 +1,43 @@
+"""Deferred importing of Pyproprop's heavier dependencies.
+
+Numpy, Sympy and Titlecase together take a significant proportion of a second
+to import, but are only needed by some Pyproprop functionality. Modules that
+use them bind a :class:`LazyModule` in place of the module so that it is only
+imported when one of its attributes is first used.
+
+Code that only needs to check whether a value is an instance of a type from
+one of these modules, e.g. a :py:class:`numpy.ndarray`, should first check
+whether the module is in :py:data:`sys.modules`. If it has never been imported
+then no value can be an instance of its types, and the import is avoided.
+
+"""
+
+import importlib
+
+
+class LazyModule:
+    """Module proxy that imports the module on first attribute access.
+
+    Attributes are cached on the proxy once looked up so that subsequent
+    accesses are ordinary instance attribute lookups.
+
+    """
+
+    def __init__(self, name):
+        """
+        Parameters
+        ----------
+        name : str
+            Absolute name of the module to be imported, e.g. `"numpy"`.
+
+        """
+        self._lazy_module_name = name
+
+    def __getattr__(self, attr):
+        module = importlib.import_module(self._lazy_module_name)
+        value = getattr(module, attr)
+        setattr(self, attr, value)
+        return value
+
+    def __repr__(self):
+        return f"<lazily-imported module {repr(self._lazy_module_name)}>"
@@ -0,0 +1,243 @@
+"""Streaming construction of many instances of a processed property class.
+
+Constructing instances one at a time and setting each processed property
+through its setter repeats the lookup of the class's processed properties,
+and a single invalid row aborts loading a whole table. :func:`load_many`
+instead looks up the processed properties to be set once per call, then
+reads rows lazily in chunks, checks each row's values as :func:`update`
+does and stores them directly in new instances. Rows failing their checks can
+be reported without stopping the stream.
+
+"""
+
+import csv
+from collections.abc import Mapping
+from itertools import islice
+
+from .processed_property import (
+    compare,
+    comparison_error_message,
+    get_processed_properties,
+    setter_state,
+)
+from .utils import format_for_output
+
+__all__ = ["load_csv", "load_many"]
+
+DEFAULT_CHUNK_SIZE = 1024
+
+
+def load_many(cls, rows, fields=None, chunk_size=DEFAULT_CHUNK_SIZE, on_error=None):
+    """Lazily create validated instances of a class from rows of values.
+
+    Instances are created without calling the class's `__init__`. Each row's
+    values are checked by their processed properties, then each relational
+    check between the row's values is made, before the values are stored.
+
+    Parameters
+    ----------
+    cls : type
+        Class of the instances to create.
+    rows : Iterable[Union[Mapping, Sequence]]
+        Rows of values. Mappings are keyed by processed property name and
+        sequences hold values in the order of `fields`. Rows are read
+        `chunk_size` at a time, so `rows` can be a lazy iterator such as a
+        :py:class:`csv.DictReader`.
+    fields : Optional[Iterable[str]]
+        Names of the processed properties set by sequence rows. Defaults to
+        every processed property of the class, in definition order.
+    chunk_size : int
+        Number of rows read from `rows` at a time.
+    on_error : Optional[Callable]
+        Called as `on_error(index, row, error)` for each row failing a check,
+        after which loading continues with the next row. If `None`, the error
+        is raised.
+
+    Yields
+    ------
+    obj
+        An instance for each valid row, in order.
+
+    Raises
+    ------
+    AttributeError
+        If any of `fields` is not a processed property of the class.
+    ValueError
+        If `chunk_size` is not a positive integer.
+
+    Example
+    -------
+    >>> errors = []
+    >>> rows = [{"lower": 0, "upper": 10}, (10, 20)]
+    >>> on_error = lambda *error: errors.append(error)
+    >>> for bounds in load_many(Bounds, rows, on_error=on_error):
+    ...     model.add(bounds)
+
+    """
+    props = get_processed_properties(cls)
+    fields = tuple(props) if fields is None else tuple(fields)
+    invalids = [name for name in fields if name not in props]
+    if invalids:
+        msg = (
+            f"{format_for_output(invalids)} not processed properties of "
+            f"{repr(cls.__name__)}."
+        )
+        raise AttributeError(msg)
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        msg = f"Chunk size must be a positive integer, instead got {repr(chunk_size)}."
+        raise ValueError(msg)
+    return _load_chunks(cls, props, fields, iter(rows), chunk_size, on_error)
+
+
+def _load_chunks(cls, props, fields, rows, chunk_size, on_error):
+    """Generator behind :func:`load_many`, so arguments are checked eagerly."""
+    plans = {}
+    index = 0
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        for row in chunk:
+            try:
+                instance = load_row(cls, props, fields, plans, row)
+            except (AttributeError, TypeError, ValueError) as error:
+                if on_error is None:
+                    raise
+                on_error(index, row, error)
+            else:
+                yield instance
+            index += 1
+
+
+def load_plan(cls, props, names):
+    """Setting plan for rows setting the named processed properties.
+
+    Returns
+    -------
+    tuple
+        Tuple of a tuple of `(name, validator, storage_name, store)` for each
+        named processed property and a tuple of `(name, relation)` for each
+        relation between them to be checked, where `relation` is a
+        :class:`pyproprop.processed_property.Relation`.
+
+    Raises
+    ------
+    AttributeError
+        If any name is not a processed property of the class.
+
+    """
+    invalids = [name for name in names if name not in props]
+    if invalids:
+        msg = (
+            f"{format_for_output(invalids)} not processed properties of "
+            f"{repr(cls.__name__)}."
+        )
+        raise AttributeError(msg)
+    setters = tuple(
+        (name, props[name].validator, props[name].storage_name, props[name].store)
+        for name in names
+    )
+    # A new instance has no stored values, so only relations between values
+    # in the row can be checked
+    relations = tuple(
+        (name, relation)
+        for name in names
+        for relation in props[name].relations.declared
+        if relation.other in names
+    )
+    return setters, relations
+
+
+def load_row(cls, props, fields, plans, row):
+    """Create an instance of a class from a single row of values."""
+    if isinstance(row, Mapping):
+        names = tuple(row)
+        values = row.values()
+    else:
+        names = fields
+        values = tuple(row)
+        if len(values) != len(fields):
+            msg = f"Row must have {len(fields)} values, instead got {len(values)}."
+            raise ValueError(msg)
+    try:
+        setters, relations = plans[names]
+    except KeyError:
+        setters, relations = plans[names] = load_plan(cls, props, names)
+    instance = cls.__new__(cls)
+    processed = {
+        name: validator(instance, value)
+        for (name, validator, _, _), value in zip(setters, values)
+    }
+    if relations and setter_state.level is None:
+        check_row_relations(cls, relations, processed)
+    for name, _, storage_name, store in setters:
+        if store is None:
+            setattr(instance, storage_name, processed[name])
+        else:
+            store(instance, processed[name])
+    return instance
+
+
+def check_row_relations(cls, relations, processed):
+    """Check the relations between the processed values of a row."""
+    for name, relation in relations:
+        value = processed[name]
+        other_value = processed[relation.other]
+        if not compare(relation.comparison_func, value, other_value):
+            msg = comparison_error_message(
+                value,
+                other_value,
+                cls,
+                relation.other,
+                relation.comparison_description,
+                relation.comparison_func,
+                relation.name,
+                relation.description,
+            )
+            raise ValueError(msg)
+
+
+def load_csv(cls, file, chunk_size=DEFAULT_CHUNK_SIZE, on_error=None, **kwargs):
+    """Lazily create validated instances of a class from a CSV file.
+
+    The file's header row names the processed property of each column. As
+    all values are read as strings, processed properties with a non-`str`
+    `type` need `cast=True`. Empty values are read as `None`.
+
+    Parameters
+    ----------
+    cls : type
+        Class of the instances to create.
+    file : Union[str, os.PathLike, TextIO]
+        Path of the CSV file, which is opened when the first instance is
+        requested and closed when the iterator is exhausted or closed, or an
+        open text file.
+    chunk_size : int
+        Number of rows read from the file at a time.
+    on_error : Optional[Callable]
+        As for :func:`load_many`. The row passed is the dict of the row's
+        values.
+    **kwargs
+        Passed to :py:class:`csv.DictReader`, e.g. `delimiter`.
+
+    Yields
+    ------
+    obj
+        An instance for each valid row, in order.
+
+    """
+    if hasattr(file, "read"):
+        yield from _load_csv_rows(cls, file, chunk_size, on_error, kwargs)
+    else:
+        with open(file, newline="") as opened_file:
+            yield from _load_csv_rows(cls, opened_file, chunk_size, on_error, kwargs)
+
+
+def _load_csv_rows(cls, file, chunk_size, on_error, reader_kwargs):
+    """Load instances from the rows of an open CSV file."""
+    reader = csv.DictReader(file, **reader_kwargs)
+    rows = (
+        {name: (value if value != "" else None) for name, value in row.items()}
+        for row in reader
+    )
+    yield from load_many(cls, rows, chunk_size=chunk_size, on_error=on_error)
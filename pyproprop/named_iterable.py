@@ -7,13 +7,30 @@ Note
 ----
 Docstrings need improving.
 
+Attributes
+----------
+NAMED_TUPLE_CLASS_CACHE_SIZE : int
+    Maximum number of generated named tuple classes kept by
+    :func:`named_tuple_class`, after which the least recently used is
+    evicted.
+SYMPIFY_CACHE_SIZE : int
+    Maximum number of sympified entries kept by :func:`cached_sympify`, after
+    which the least recently used is evicted.
+
 """
 
 from collections import namedtuple
+from functools import lru_cache
+
+from .lazy_import import LazyModule
 
-import sympy as sym
+# Sympy is slow to import and only needed when sympifying
+sym = LazyModule("sympy")
 
-__all__ = ["named_iterable"]
+__all__ = ["clear_sympify_cache", "named_iterable"]
+
+NAMED_TUPLE_CLASS_CACHE_SIZE = 256
+SYMPIFY_CACHE_SIZE = 1024
 
 
 def named_iterable(iterable, use_named=True, named_keys=None, sympify=False):
@@ -38,13 +55,15 @@ def named_iterable(iterable, use_named=True, named_keys=None, sympify=False):
     """
     iterable, named_keys = make_iterable(iterable, named_keys)
     if sympify:
-        entries = [sym.sympify(entry) for entry in iterable]
+        entries = [sympify_entry(entry) for entry in iterable]
     else:
         entries = list(iterable)
     if use_named:
         if named_keys is None:
             named_keys = [str(entry) for entry in entries]
-        NamedTuple = namedtuple("NamedTuple", named_keys)
+        if not isinstance(named_keys, str):
+            named_keys = tuple(map(str, named_keys))
+        NamedTuple = named_tuple_class(named_keys)
         formatted_entries = NamedTuple(*entries)
     else:
         formatted_entries = tuple(entries)
@@ -52,6 +71,60 @@ def named_iterable(iterable, use_named=True, named_keys=None, sympify=False):
     return formatted_entries
 
 
+@lru_cache(maxsize=NAMED_TUPLE_CLASS_CACHE_SIZE)
+def named_tuple_class(field_names):
+    """Named tuple class with the given field names.
+
+    Generating a named tuple class is expensive compared to instantiating one,
+    so classes are cached by their field names. Cache statistics are available
+    from `named_tuple_class.cache_info()` and the cache can be emptied with
+    `named_tuple_class.cache_clear()`.
+
+    Parameters
+    ----------
+    field_names : Union[str, Tuple[str, ...]]
+        Field names of the named tuple, as accepted by
+        :py:func:`collections.namedtuple`.
+
+    Returns
+    -------
+    type
+        Subclass of `tuple` named `NamedTuple` with the given fields.
+
+    """
+    return namedtuple("NamedTuple", field_names)
+
+
+def sympify_entry(entry):
+    """Convert an entry to a Sympy object, reusing previous conversions.
+
+    Hashable entries are converted using :func:`cached_sympify`. Unhashable
+    entries, e.g. lists, are always converted afresh.
+
+    """
+    try:
+        return cached_sympify(entry)
+    except TypeError:
+        return sym.sympify(entry)
+
+
+@lru_cache(maxsize=SYMPIFY_CACHE_SIZE, typed=True)
+def cached_sympify(entry):
+    """Sympy object for a hashable entry, cached by the entry.
+
+    Entries are cached by type as well as value so that e.g. `1` and `1.0`
+    are converted to a Sympy integer and float respectively. Cache statistics
+    are available from `cached_sympify.cache_info()`.
+
+    """
+    return sym.sympify(entry)
+
+
+def clear_sympify_cache():
+    """Empty the cache of entries sympified by :func:`named_iterable`."""
+    cached_sympify.cache_clear()
+
+
 def make_iterable(iterable, named_keys):
     """
     Parameters
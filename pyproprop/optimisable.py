@@ -0,0 +1,170 @@
+"""Collection of the free optimisable parameters of many instances.
+
+Processed properties with `optimisable=True` hold either a fixed
+:py:class:`numbers.Real` or a `(lower, upper)` tuple of bounds, in which case
+the parameter is free to be optimised. :class:`OptimisableParameters` gathers
+the free parameters of one or more instances in to contiguous Numpy vectors of
+lower and upper bounds, and writes a solution vector back to the instances.
+
+"""
+
+import weakref
+
+from .lazy_import import LazyModule
+from .processed_property import (
+    MISSING,
+    get_processed_properties,
+    process_optimisable,
+    trusted,
+)
+
+np = LazyModule("numpy")
+
+__all__ = ["OptimisableParameters"]
+
+# Optimisable processed properties of each class, see `optimisable_properties`
+_optimisable_properties = weakref.WeakKeyDictionary()
+
+
+def optimisable_properties(cls):
+    """Attribute and storage names of a class's optimisable properties.
+
+    Looked up once for each class and cached.
+
+    Returns
+    -------
+    tuple of tuples
+        Tuples of `(attr_name, storage_name)` in definition order.
+
+    """
+    try:
+        return _optimisable_properties[cls]
+    except KeyError:
+        pass
+    props = tuple(
+        (attr_name, prop.storage_name)
+        for attr_name, prop in get_processed_properties(cls).items()
+        if process_optimisable in prop.setter_dispatcher
+    )
+    _optimisable_properties[cls] = props
+    return props
+
+
+class OptimisableParameters:
+    """Free optimisable parameters of one or more instances.
+
+    Parameters are ordered by the order the instances are supplied in, then
+    by the order their optimisable processed properties are defined in.
+    Optimisable properties holding a fixed value, or without a value, are not
+    free and are not included.
+
+    Parameters
+    ----------
+    *instances : obj
+        Instances with optimisable processed properties.
+
+    Attributes
+    ----------
+    lower : :py:class:`numpy.ndarray`
+        Lower bound of each free parameter.
+    upper : :py:class:`numpy.ndarray`
+        Upper bound of each free parameter.
+    parameters : tuple
+        Tuples of `(instance, attr_name)` for each free parameter, in the same
+        order as :attr:`lower` and :attr:`upper`.
+
+    Example
+    -------
+    >>> parameters = OptimisableParameters(phase_1, phase_2)
+    >>> solution = optimise(parameters.lower, parameters.upper)
+    >>> parameters.set_solution(solution)
+
+    """
+
+    def __init__(self, *instances):
+        parameters = []
+        lower = []
+        upper = []
+        props_by_class = {}
+        for instance in instances:
+            cls = type(instance)
+            props = props_by_class.get(cls)
+            if props is None:
+                props = props_by_class[cls] = optimisable_properties(cls)
+            for attr_name, storage_name in props:
+                value = getattr(instance, storage_name, MISSING)
+                if isinstance(value, tuple):
+                    parameters.append((instance, attr_name))
+                    lower.append(value[0])
+                    upper.append(value[1])
+        self.parameters = tuple(parameters)
+        self.lower = np.array(lower, dtype=float)
+        self.upper = np.array(upper, dtype=float)
+        self._index_map = {
+            (id(instance), attr_name): i
+            for i, (instance, attr_name) in enumerate(self.parameters)
+        }
+
+    def __len__(self):
+        return len(self.parameters)
+
+    def index(self, instance, attr_name):
+        """Index of an instance's free parameter in the bound vectors.
+
+        Raises
+        ------
+        KeyError
+            If the property is not one of the free parameters.
+
+        """
+        try:
+            return self._index_map[(id(instance), attr_name)]
+        except KeyError:
+            msg = (
+                f"{repr(attr_name)} of {repr(instance)} is not a free "
+                f"optimisable parameter."
+            )
+            raise KeyError(msg) from None
+
+    def set_solution(self, solution):
+        """Set each free parameter to its value in a solution vector.
+
+        Each value is stored as the parameter's fixed value, with any
+        `method` post-processing applied, so the parameters are no longer
+        free.
+
+        Parameters
+        ----------
+        solution : array_like
+            Value of each free parameter, in the same order as :attr:`lower`
+            and :attr:`upper`.
+
+        Raises
+        ------
+        ValueError
+            If `solution` is not a vector with a value for each free
+            parameter, or if any value lies outside its bounds.
+
+        """
+        solution = np.asarray(solution, dtype=float)
+        if solution.shape != self.lower.shape:
+            msg = (
+                f"Solution must have shape {self.lower.shape}, instead got "
+                f"{solution.shape}."
+            )
+            raise ValueError(msg)
+        invalid = (solution < self.lower) | (solution > self.upper)
+        if invalid.any():
+            i = int(np.argmax(invalid))
+            instance, attr_name = self.parameters[i]
+            msg = (
+                f"Solution value `{solution[i]}` at index `{i}` for "
+                f"{repr(attr_name)} must lie within its bounds "
+                f"({self.lower[i]}, {self.upper[i]})."
+            )
+            raise ValueError(msg)
+        with trusted("keep_method"):
+            for (instance, attr_name), value in zip(
+                self.parameters, solution.tolist()
+            ):
+                setattr(instance, attr_name, value)
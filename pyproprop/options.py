@@ -14,11 +14,57 @@ designed with use alongside processed properties in mind.
 __all__ = ["Options"]
 
 from collections.abc import Sequence
+from types import MappingProxyType
 from typing import Callable, Union
 
 from .utils import format_as_iterable, format_for_output
 
 
+def index_options(options):
+    """Index a collection of options for fast membership tests.
+
+    Parameters
+    ----------
+    options : Iterable
+        Collection of options to be indexed.
+
+    Returns
+    -------
+    frozenset or tuple
+        A frozenset of the options if they are all hashable, giving O(1)
+        membership tests. Otherwise a tuple of the options so that membership
+        is tested by a linear scan.
+
+    """
+    try:
+        return frozenset(options)
+    except TypeError:
+        return tuple(options)
+
+
+def is_option(value, options_index):
+    """Test whether a value is in an options index.
+
+    Parameters
+    ----------
+    value : obj
+        Value to be tested for membership.
+    options_index : frozenset or tuple
+        Options index as returned by :func:`index_options`.
+
+    Returns
+    -------
+    bool
+        True if the value is an option. Unhashable values are never members
+        of a hash-indexed collection of options.
+
+    """
+    try:
+        return value in options_index
+    except TypeError:
+        return False
+
+
 class Options:
     """Implements options with a default, unsupported options and dispatchers."""
 
@@ -56,6 +102,8 @@ class Options:
         else:
             self._unordered_options = False
         self._options = tuple(options)
+        self._options_index = index_options(self._options)
+        self._dispatcher = None
 
     @property
     def default(self) -> object:
@@ -64,7 +112,7 @@ class Options:
 
     @default.setter
     def default(self, default):
-        if default is not None and default not in self.options:
+        if default is not None and not is_option(default, self._options_index):
             msg = (
                 f"{format_for_output(default)} is not a valid choice of "
                 f"default as it is not an option. Please choose one of: "
@@ -86,7 +134,11 @@ class Options:
         if unsupported is None:
             unsupported = ()
         unsupported = format_as_iterable(unsupported)
-        invalids = [option for option in unsupported if option not in self.options]
+        invalids = [
+            option
+            for option in unsupported
+            if not is_option(option, self._options_index)
+        ]
         if invalids:
             if len(invalids) == 1:
                 msg = (
@@ -102,12 +154,24 @@ class Options:
                     f"{format_for_output(self.options)}."
                 )
             raise ValueError(msg)
-        if set(unsupported) == set(self.options):
+        unsupported_index = index_options(unsupported)
+        if all(is_option(option, unsupported_index) for option in self.options):
             msg = (
                 f"All options ({format_for_output(self.options)}) are " f"unsupported."
             )
             raise ValueError(msg)
         self._unsupported = unsupported
+        self._unsupported_index = unsupported_index
+
+    @property
+    def options_index(self) -> Union[frozenset, tuple]:
+        """Options indexed for fast membership tests."""
+        return self._options_index
+
+    @property
+    def unsupported_index(self) -> Union[frozenset, tuple]:
+        """Unsupported options indexed for fast membership tests."""
+        return self._unsupported_index
 
     @property
     def handles(self) -> Union[Callable, Sequence]:
@@ -126,8 +190,53 @@ class Options:
             )
             raise TypeError(msg)
         self._handles = tuple(handles)
+        self._dispatcher = None
 
     @property
-    def dispatcher(self) -> dict:
-        """Mapping of options to handles."""
-        return dict(zip(self.options, self.handles))
+    def dispatcher(self) -> MappingProxyType:
+        """Read-only mapping of options to handles.
+
+        The mapping is built on first access and cached until either the
+        options or the handles are changed.
+
+        """
+        if self._dispatcher is None:
+            self._dispatcher = MappingProxyType(dict(zip(self.options, self.handles)))
+        return self._dispatcher
+
+    def dispatch(self, option, *args, **kwargs):
+        """Call the handle linked to an option.
+
+        Parameters
+        ----------
+        option : obj
+            Option whose handle should be called.
+        *args
+            Positional arguments passed to the handle.
+        **kwargs
+            Keyword arguments passed to the handle.
+
+        Returns
+        -------
+        obj
+            The return value of the handle.
+
+        Raises
+        ------
+        ValueError
+            If the option does not have a handle.
+
+        """
+        dispatcher = self._dispatcher
+        if dispatcher is None:
+            dispatcher = self.dispatcher
+        try:
+            handle = dispatcher[option]
+        except (KeyError, TypeError):
+            msg = (
+                f"{format_for_output(option)} does not have a handle. Please "
+                f"choose one of: "
+                f"{format_for_output(tuple(dispatcher), with_or=True)}."
+            )
+            raise ValueError(msg) from None
+        return handle(*args, **kwargs)
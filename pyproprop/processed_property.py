@@ -6,21 +6,265 @@ generation etc. from user-supplied values in a manner that minimises code
 reuse.
 
 """
+import math
+import operator
+import sys
+import threading
+import time
+import weakref
+from collections import namedtuple
+from contextlib import contextmanager
+from functools import lru_cache
 from numbers import Real
 from typing import Iterable
 
-import numpy as np
-
+from .cast import cast_value, has_default_cast
 from .format_str_case import SUPPORTED_STR_FORMAT_OPTIONS, format_str_case
-from .options import Options
-from .utils import format_for_output, generate_name_description_error_message
+from .lazy_import import LazyModule
+from .options import Options, index_options, is_option
+from .utils import (
+    format_as_iterable,
+    format_for_output,
+    generate_name_description_error_message,
+)
+
+# Numpy is only imported when first needed. Values are only checked for being
+# arrays if Numpy has already been imported, as otherwise none can be.
+np = LazyModule("numpy")
+
+__all__ = [
+    "check_bounds_many",
+    "processed_property",
+    "processed_property_slots",
+    "processed_property_trusted",
+    "trusted",
+]
+
+STORE_ONLY_TRUST_KEYWORD = "store_only"
+KEEP_METHOD_TRUST_KEYWORD = "keep_method"
+SUPPORTED_TRUST_OPTIONS = {STORE_ONLY_TRUST_KEYWORD, KEEP_METHOD_TRUST_KEYWORD}
+
+
+class SetterState(threading.local):
+    """Per-thread state read by every processed property setter.
+
+    Attributes
+    ----------
+    active : bool
+        Whether either a trust level is set or a transaction is open in this
+        thread.
+    level : Optional[str]
+        Trust level set by :func:`trusted`.
+    transactions : Optional[dict]
+        Mapping of `id` of instances with an open transaction to the pending
+        values set on them, see :func:`pyproprop.transaction`.
+
+    """
+
+    active = False
+    level = None
+    transactions = None
+
+    def update_active(self):
+        """Recompute whether setters need to check the state further."""
+        active = self.level is not None or bool(self.transactions)
+        if active != self.active:
+            self.active = active
+            active_setter_states.update(1 if active else -1)
+
+
+class ActiveSetterStates:
+    """Count of threads with an active :class:`SetterState`.
+
+    Reading thread-local attributes is comparatively slow, so setters only
+    read their thread's :class:`SetterState` if any thread has one active.
+
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def update(self, change):
+        with self.lock:
+            self.count += change
 
-__all__ = ["processed_property"]
+
+class InstrumentationState:
+    """Statistics recorded by processed property setters when instrumented.
+
+    While :attr:`enabled`, :data:`active_setter_states` is incremented so
+    that setters divert to their instrumented versions, which record the
+    number of sets, failures by exception type, and the time taken by each
+    check. See :mod:`pyproprop.instrumentation`.
+
+    Attributes
+    ----------
+    enabled : bool
+        Whether setters record statistics.
+    stats : dict
+        Mapping of `(class, property name)` tuples to dicts of statistics
+        with keys `"sets"`, `"failures"` and `"step_times"`.
+
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.stats = {}
+        self.lock = threading.Lock()
+
+    def record(self, cls, name, steps, times, error):
+        """Record a single set of a processed property.
+
+        Parameters
+        ----------
+        cls : type
+            Class of the instance that was set.
+        name : str
+            Name of the processed property that was set.
+        steps : tuple of str
+            Names of the checks made by the setter.
+        times : list of float
+            Time in seconds taken by each check in `steps`. Checks not reached
+            because an earlier check failed have a time of zero.
+        error : Optional[Exception]
+            Exception raised by the setter, if it failed.
+
+        """
+        with self.lock:
+            stats = self.stats.get((cls, name))
+            if stats is None:
+                stats = {"sets": 0, "failures": {}, "step_times": {}}
+                self.stats[(cls, name)] = stats
+            stats["sets"] += 1
+            if error is not None:
+                error_name = type(error).__name__
+                failures = stats["failures"]
+                failures[error_name] = failures.get(error_name, 0) + 1
+            step_times = stats["step_times"]
+            for step, step_time in zip(steps, times):
+                step_times[step] = step_times.get(step, 0.0) + step_time
+
+
+setter_state = SetterState()
+active_setter_states = ActiveSetterStates()
+instrumentation_state = InstrumentationState()
 
 
 class property(property):
     """Subclass in-built property type so attributes can be set."""
 
+    def __set_name__(self, owner, attr_name):
+        """Index the relations touching a processed property in its class."""
+        if getattr(self, "relations", None) is not None:
+            index_relations(owner, attr_name, self)
+
+
+# Relational check declared by a processed property with one of the
+# `less_than`, `greater_than`, `at_least`, `at_most` or `equal_to` kwargs
+Relation = namedtuple(
+    "Relation",
+    [
+        "name",
+        "storage_name",
+        "description",
+        "other",
+        "other_storage_name",
+        "comparison_description",
+        "comparison_func",
+    ],
+)
+
+
+class Relations:
+    """Index of the relational checks touching a single processed property.
+
+    Attributes
+    ----------
+    declared : tuple of :class:`Relation`
+        Relations declared by the processed property itself, which are made
+        by its setter dispatcher.
+    reverse : tuple
+        Tuples of `(attr_name, relations, relation)` for relations declared by
+        other processed properties comparing against this one, where
+        `attr_name` is the attribute name of the declaring property and
+        `relations` is its :class:`Relations`. Added to by
+        :func:`index_relations` when classes using the property are created.
+
+    """
+
+    def __init__(self, declared):
+        self.declared = declared
+        self.reverse = ()
+        self._reverse = {}
+        self._reverse_by_class = weakref.WeakKeyDictionary()
+
+    def add_reverse(self, attr_name, relations, relation):
+        """Add a relation declared by another processed property."""
+        key = (attr_name, id(relations), relation)
+        if key not in self._reverse:
+            self._reverse[key] = (attr_name, relations, relation)
+            self.reverse = tuple(self._reverse.values())
+            self._reverse_by_class.clear()
+
+    def reverse_for(self, cls):
+        """Reverse relations declared by processed properties of a class.
+
+        A reverse relation only applies to instances of classes whose
+        attribute `attr_name` is the declaring processed property. The
+        applicable relations are cached for each class.
+
+        Returns
+        -------
+        tuple of :class:`Relation`
+
+        """
+        try:
+            return self._reverse_by_class[cls]
+        except KeyError:
+            pass
+        reverse = tuple(
+            relation
+            for attr_name, relations, relation in self.reverse
+            if getattr(getattr(cls, attr_name, None), "relations", None)
+            is relations
+        )
+        self._reverse_by_class[cls] = reverse
+        return reverse
+
+
+def index_relations(owner, attr_name, prop):
+    """Register the relations between a processed property and its class's.
+
+    Called when a class using the processed property is created. Each
+    relation declared by the property is registered as a reverse relation of
+    the property it compares against, and each relation declared by another
+    processed property of the class comparing against this property is
+    registered as one of its reverse relations. Setting either property then
+    checks the relation.
+
+    Parameters
+    ----------
+    owner : type
+        Class the processed property has been assigned to.
+    attr_name : str
+        Attribute name the processed property has been assigned to.
+    prop : property
+        The processed property.
+
+    """
+    props = get_processed_properties(owner)
+    for relation in prop.relations.declared:
+        other_prop = props.get(relation.other)
+        if other_prop is not None:
+            other_prop.relations.add_reverse(attr_name, prop.relations, relation)
+    for other_attr_name, other_prop in props.items():
+        for relation in other_prop.relations.declared:
+            if relation.other == attr_name:
+                prop.relations.add_reverse(
+                    other_attr_name, other_prop.relations, relation
+                )
+
 
 def processed_property(name, **kwargs):
     """Main function for creating a processed property within a class.
@@ -93,8 +337,12 @@ def processed_property(name, **kwargs):
         """
         if isinstance(options, Options):
             return options.options, options.unsupported
-        if (options is None and unsupported_options) or (
-            set(unsupported_options).difference(set(options))
+        unsupported_options = tuple(unsupported_options)
+        if options is not None:
+            options = tuple(options)
+            options_index = index_options(options)
+        if (options is None and unsupported_options) or any(
+            not is_option(option, options_index) for option in unsupported_options
         ):
             msg = (
                 f"{name_str} does not have any supported options. Check "
@@ -102,19 +350,20 @@ def processed_property(name, **kwargs):
                 f"{format_for_output(unsupported_options)}."
             )
             raise ValueError(msg)
-        if not set(options).symmetric_difference(set(unsupported_options)):
+        unsupported_index = index_options(unsupported_options)
+        if all(is_option(option, unsupported_index) for option in options):
             msg = (
                 f"{name_str} does not have any supported options from: "
                 f"{format_for_output(options)}."
             )
             raise ValueError(msg)
-        return tuple(options), tuple(unsupported_options)
+        return options, unsupported_options
 
     def generate_setter_dispatcher():
         setter_dispatcher = {}
         if read_only:
             args = (storage_name, name_str)
-            kwargs = {"instance": True}
+            kwargs = {"instance": INSTANCE}
             setter_dispatcher.update({check_read_only: (args, kwargs)})
             setattr(property, "is_read_only", read_only)
         if expected_type is not None:
@@ -129,36 +378,54 @@ def processed_property(name, **kwargs):
             setter_dispatcher.update({check_expected_type: (args, {})})
         if str_format:
             args = (str_format,)
-            kwargs = {"process": True}
+            kwargs = {"process": True, "cache": True}
             setter_dispatcher.update({format_str_case: (args, kwargs)})
         if options is not None:
-            args = (options, unsupported_options, name_str, name, description)
+            if isinstance(options_kwarg, Options):
+                options_index = options_kwarg.options_index
+                unsupported_index = options_kwarg.unsupported_index
+            else:
+                options_index = index_options(options)
+                unsupported_index = index_options(unsupported_options)
+            valid_options = tuple(
+                option
+                for option in options
+                if not is_option(option, unsupported_index)
+            )
+            args = (
+                options_index,
+                unsupported_index,
+                valid_options,
+                name_str,
+                name,
+                description,
+            )
             setter_dispatcher.update({check_options: (args, {})})
         if min_value is not None:
-            args = (name, description, exclusive, min_value)
+            args = (name_str_start, exclusive, min_value)
             setter_dispatcher.update({check_min: (args, {})})
         if max_value is not None:
-            args = (name, description, exclusive, max_value)
+            args = (name_str_start, exclusive, max_value)
             setter_dispatcher.update({check_max: (args, {})})
         if less_than is not None:
-            args = (less_than, name, description)
-            kwargs = {"instance": True}
+            args = (less_than, "_" + less_than, name, description)
+            kwargs = {"instance": INSTANCE}
             setter_dispatcher.update({check_less_than: (args, kwargs)})
         if greater_than is not None:
-            args = (greater_than, name, description)
-            kwargs = {"instance": True}
+            args = (greater_than, "_" + greater_than, name, description)
+            kwargs = {"instance": INSTANCE}
             setter_dispatcher.update({check_greater_than: (args, kwargs)})
         if at_least is not None:
-            args = (at_least, name, description)
-            kwargs = {"instance": True}
+            args = (at_least, "_" + at_least, name, description)
+            kwargs = {"instance": INSTANCE}
             setter_dispatcher.update({check_at_least: (args, kwargs)})
         if at_most is not None:
-            args = (at_most, name, description)
-            kwargs = {"instance": True}
+            args = (at_most, "_" + at_most, name, description)
+            kwargs = {"instance": INSTANCE}
             setter_dispatcher.update({check_at_most: (args, kwargs)})
         if equal_to is not None:
-            args = (equal_to, name, description)
-            kwargs = {"instance": True}
+            args = (equal_to, "_" + equal_to, name, description)
+            kwargs = {"instance": INSTANCE}
             setter_dispatcher.update({check_equal_to: (args, kwargs)})
         if len_sequence is not None:
             args = (len_sequence, name_str)
@@ -176,6 +443,7 @@ def processed_property(name, **kwargs):
     description = kwargs.get("description")
     expected_type = kwargs.get("type")
     options = kwargs.get("options", None)
+    options_kwarg = options
     unsupported_options = kwargs.get("unsupported_options", [])
     optional = kwargs.get("optional", False)
     default = kwargs.get("default", None)
@@ -199,6 +467,9 @@ def processed_property(name, **kwargs):
 
     # Additional error checking of kwargs
     name_str = generate_name_description_error_message(name, description)
+    name_str_start = generate_name_description_error_message(
+        name, description, is_sentence_start=True
+    )
     if options or unsupported_options:
         options, unsupported_options = error_check_option_kwarg(
             options, unsupported_options
@@ -219,26 +490,626 @@ def processed_property(name, **kwargs):
         """
         return getattr(self, storage_name)
 
-    @prop.setter
-    def prop(self, value):
-        """Setter method for the property object.
+    relations = Relations(
+        tuple(
+            Relation(
+                name,
+                storage_name,
+                description,
+                *args[:2],
+                *COMPARISON_CHECKS[method],
+            )
+            for method, (args, _) in setter_dispatcher.items()
+            if method in COMPARISON_CHECKS
+        )
+    )
+    prop = prop.setter(
+        compile_setter(setter_dispatcher, storage_name, name, relations=relations)
+    )
+    prop.name = name
+    prop.storage_name = storage_name
+    prop.description = description
+    prop.setter_dispatcher = setter_dispatcher
+    prop.relations = relations
+    prop.validator = compile_validator(
+        without_comparison_checks(setter_dispatcher), name
+    )
+    prop.store = None
 
-        Sequentially passes through a number of utility methods which enforce/
-        apply the options specified when the processed property was created.
+    return prop
 
-        Parameters
-        ----------
-        value : obj
-            Property object value for setting.
-        """
-        for (method, (args, kwargs)) in setter_dispatcher.items():
-            if kwargs.get("instance") is not None:
-                kwargs["instance"] = self
-            value = method(value, *args, **kwargs)
-        setattr(self, storage_name, value)
-        setattr(self, f"{storage_name}_dir", {"name": name, "description": description})
 
-    return prop
+def processed_property_slots(cls):
+    """Class decorator storing processed properties in `__slots__`.
+
+    By default processed properties store their values in the instance
+    `__dict__`. Decorating a class with this replaces the processed properties
+    defined in the class body with equivalent properties whose values are held
+    in slots, so instances of the class do not need a `__dict__`. Getters and
+    setters read and write the slot descriptors directly.
+
+    Any other instance attributes must be declared in the class's own
+    `__slots__`. Processed properties inherited from base classes are not
+    converted, and a base class without `__slots__` will still give instances
+    a `__dict__`.
+
+    Parameters
+    ----------
+    cls : type
+        Class with processed properties defined in its body.
+
+    Returns
+    -------
+    type
+        New class with the same name, bases and attributes, but with the
+        processed properties' storage in `__slots__`.
+
+    Example
+    -------
+    >>> @processed_property_slots
+    ... class Point:
+    ...     x = processed_property("x", type=float, cast=True)
+    ...     y = processed_property("y", type=float, cast=True)
+
+    """
+    cls_dict = dict(cls.__dict__)
+    processed_properties = {
+        attr_name: prop
+        for attr_name, prop in cls_dict.items()
+        if hasattr(prop, "setter_dispatcher")
+    }
+    slots = list(format_as_iterable(cls_dict.get("__slots__", ())))
+    for prop in processed_properties.values():
+        slots.append(prop.storage_name)
+    cls_dict["__slots__"] = tuple(slots)
+    for slot in slots:
+        cls_dict.pop(slot, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    for attr_name, prop in processed_properties.items():
+        slot = slotted_cls.__dict__[prop.storage_name]
+        setter = compile_setter(
+            prop.setter_dispatcher,
+            prop.storage_name,
+            prop.name,
+            store=slot.__set__,
+            relations=prop.relations,
+        )
+        slotted_prop = property(slot.__get__, setter, None, prop.__doc__)
+        slotted_prop.__dict__.update(prop.__dict__)
+        slotted_prop.store = slot.__set__
+        setattr(slotted_cls, attr_name, slotted_prop)
+    # Methods using zero-argument `super()` reference the original class
+    for member in cls_dict.values():
+        closure = getattr(getattr(member, "__func__", member), "__closure__", None)
+        for cell in closure or ():
+            try:
+                if cell.cell_contents is cls:
+                    cell.cell_contents = slotted_cls
+            except ValueError:
+                pass
+    return slotted_cls
+
+
+def processed_property_trusted(cls=None, *, level=STORE_ONLY_TRUST_KEYWORD):
+    """Class decorator permanently skipping a class's processed property checks.
+
+    Intended for classes whose processed property values are only ever set by
+    trusted code, such as within the inner loops of a solver. The setters of
+    the processed properties defined in the class body are recompiled without
+    any checks, as if always set within :func:`trusted`.
+
+    Parameters
+    ----------
+    cls : type
+        Class with processed properties defined in its body.
+    level : str
+        Either `"store_only"`, in which case values are stored directly, or
+        `"keep_method"`, in which case any `method` post-processing is still
+        applied.
+
+    Returns
+    -------
+    type
+        The decorated class.
+
+    Example
+    -------
+    >>> @processed_property_trusted(level="keep_method")
+    ... class Iterate:
+    ...     x = processed_property("x", type=float, method=abs)
+
+    """
+    check_trust_level(level)
+
+    def decorate(cls):
+        for attr_name, prop in list(cls.__dict__.items()):
+            if not hasattr(prop, "setter_dispatcher"):
+                continue
+            trusted_dispatcher = {}
+            if level == KEEP_METHOD_TRUST_KEYWORD:
+                trusted_dispatcher = {
+                    method: step
+                    for method, step in prop.setter_dispatcher.items()
+                    if method is apply_method
+                }
+            setter = compile_setter(
+                trusted_dispatcher, prop.storage_name, prop.name, store=prop.store
+            )
+            trusted_prop = prop.setter(setter)
+            trusted_prop.__dict__.update(prop.__dict__)
+            trusted_prop.validator = compile_validator(trusted_dispatcher, prop.name)
+            setattr(cls, attr_name, trusted_prop)
+        return cls
+
+    if cls is None:
+        return decorate
+    return decorate(cls)
+
+
+def check_trust_level(level):
+    """Ensure a trust level is one of :py:const:`SUPPORTED_TRUST_OPTIONS`."""
+    if level not in SUPPORTED_TRUST_OPTIONS:
+        formatted_options = format_for_output(
+            sorted(SUPPORTED_TRUST_OPTIONS), with_or=True
+        )
+        msg = (
+            f"{repr(level)} is not a valid trust level. Please choose one of: "
+            f"{formatted_options}."
+        )
+        raise ValueError(msg)
+
+
+@contextmanager
+def trusted(level=STORE_ONLY_TRUST_KEYWORD):
+    """Context manager skipping processed property checks within its scope.
+
+    Values set on any processed property in the current thread within the
+    context are assumed to already be valid and are stored without being
+    checked. This is intended for hot inner loops where the values being set
+    are known to be valid. Other threads are unaffected and contexts can be
+    nested.
+
+    Parameters
+    ----------
+    level : str
+        Either `"store_only"`, in which case values are stored directly, or
+        `"keep_method"`, in which case any `method` post-processing is still
+        applied.
+
+    Example
+    -------
+    >>> with trusted():
+    ...     for x in solution:
+    ...         iterate.x = x
+
+    """
+    check_trust_level(level)
+    previous_level = setter_state.level
+    setter_state.level = level
+    setter_state.update_active()
+    try:
+        yield
+    finally:
+        setter_state.level = previous_level
+        setter_state.update_active()
+
+
+# Maximum number of distinct compiled setter factories cached
+FUNCTION_FACTORY_CACHE_SIZE = 1024
+
+# Sentinel for a processed property without a stored value
+MISSING = object()
+
+# Placeholder in a setter dispatcher's kwargs for the instance being set. This
+# is substituted for `self` within the compiled setter so that no per-instance
+# state is ever written to the (class-wide) setter dispatcher.
+INSTANCE = object()
+
+SETTER_DOCSTRING = """Setter method for the property object.
+
+Sequentially passes through a number of utility methods which enforce/
+apply the options specified when the processed property was created.
+
+Parameters
+----------
+value : obj
+    Property object value for setting.
+"""
+
+
+def get_processed_properties(cls):
+    """Mapping of attribute names to the processed properties of a class.
+
+    Parameters
+    ----------
+    cls : type
+        Class to collect processed properties from, including those inherited
+        from base classes.
+
+    Returns
+    -------
+    dict
+        Processed properties keyed by attribute name, in definition order.
+
+    """
+    processed_properties = {}
+    for base in reversed(cls.__mro__):
+        for attr_name, attr in vars(base).items():
+            if hasattr(attr, "setter_dispatcher"):
+                processed_properties[attr_name] = attr
+            else:
+                processed_properties.pop(attr_name, None)
+    return processed_properties
+
+
+def without_comparison_checks(setter_dispatcher):
+    """Copy of a setter dispatcher excluding any relational checks."""
+    return {
+        method: step
+        for method, step in setter_dispatcher.items()
+        if method not in COMPARISON_CHECKS
+    }
+
+
+def compile_setter(setter_dispatcher, storage_name, name, store=None, relations=None):
+    """Generate a specialised setter function from a setter dispatcher.
+
+    Rather than looping over the setter dispatcher on every assignment, the
+    enabled checks are unrolled in to a straight-line function body at the
+    time the processed property is defined. Check methods and their arguments
+    are bound as closure variables of the generated function so no lookups of
+    the dispatcher or its argument tuples are needed when setting.
+
+    Parameters
+    ----------
+    setter_dispatcher : dict
+        Mapping of check methods to tuples of their positional and keyword
+        arguments, as generated within :func:`processed_property`. Keyword
+        arguments with the value :const:`INSTANCE` are passed the instance
+        whose property is being set.
+    storage_name : str
+        Name of the instance attribute that the value is stored under.
+    name : str
+        Attribute name that is used for the property.
+    store : Optional[Callable]
+        Function with signature `(instance, value)` used to store the
+        processed value, for example a slot descriptor's `__set__` method. By
+        default the value is set as the instance attribute `storage_name`.
+    relations : Optional[:class:`Relations`]
+        Index of the relations touching the property. If given, the reverse
+        relations registered with it when the setter is called are checked
+        after the setter dispatcher's methods.
+
+    Returns
+    -------
+    function
+        Setter function with signature `(self, value)`.
+
+    Note
+    ----
+    If any thread has an active :class:`SetterState`, the generated setter
+    first checks the current thread's state. If a transaction is open on the
+    instance the value is deferred to it. If a trust level is set (see
+    :func:`trusted`) all checks are skipped and the value is stored directly,
+    with the post method still applied at the `"keep_method"` level.
+
+    If instrumentation is enabled (see :class:`InstrumentationState`) the
+    value is instead passed to an instrumented version of the setter
+    generated by :func:`compile_instrumented_setter`. This is only compiled
+    the first time it is needed, see :func:`lazy_instrumented_setter`.
+
+    """
+    closure_vars = {
+        "_setattr": setattr,
+        "_store": store,
+        "_storage_name": storage_name,
+        "_name": name,
+        "_defer": defer_to_transaction,
+        "_active_setter_states": active_setter_states,
+        "_instrumentation_state": instrumentation_state,
+        "_instrumented": lazy_instrumented_setter(
+            setter_dispatcher, storage_name, name, store, relations
+        ),
+    }
+    store_line = (
+        "_setattr(self, _storage_name, value)"
+        if store is None
+        else "_store(self, value)"
+    )
+    body, trusted_body = generate_setter_body(
+        setter_dispatcher, closure_vars, relations=relations
+    )
+    body = [
+        "if _active_setter_states.count:",
+        "    if _instrumentation_state.enabled:",
+        "        return _instrumented(self, value)",
+        "    if _setter_state.active:",
+        "        if _defer(self, _name, value):",
+        "            return",
+        "        _trust_level = _setter_state.level",
+        "        if _trust_level is not None:",
+        *(f"            {line}" for line in trusted_body),
+        f"            {store_line}",
+        "            return",
+        *body,
+        store_line,
+    ]
+    setter = create_function("prop", body, closure_vars)
+    setter.__doc__ = SETTER_DOCSTRING
+    return setter
+
+
+def lazy_instrumented_setter(setter_dispatcher, storage_name, name, store, relations):
+    """Setter compiling an instrumented setter the first time it is called.
+
+    Instrumentation is opt-in, so compiling an instrumented setter for every
+    processed property when it is defined would slow definitions for nothing.
+    Arguments are as for :func:`compile_instrumented_setter`.
+
+    Returns
+    -------
+    function
+        Setter function with signature `(self, value)` delegating to the
+        instrumented setter, which is compiled once and then cached.
+
+    """
+    compiled = []
+
+    def instrumented_setter(self, value):
+        try:
+            setter = compiled[0]
+        except IndexError:
+            setter = compile_instrumented_setter(
+                setter_dispatcher, storage_name, name, store, relations
+            )
+            compiled.append(setter)
+        return setter(self, value)
+
+    return instrumented_setter
+
+
+def compile_instrumented_setter(
+    setter_dispatcher, storage_name, name, store, relations
+):
+    """Generate a setter that records statistics about each set.
+
+    The generated setter behaves as one generated by :func:`compile_setter`,
+    but times each check and records the set with
+    :meth:`InstrumentationState.record`. Values deferred to a transaction
+    are not recorded, as they are checked when the transaction is
+    committed.
+
+    Parameters
+    ----------
+    setter_dispatcher : dict
+        Mapping of check methods to tuples of their positional and keyword
+        arguments, as for :func:`compile_setter`.
+    storage_name : str
+        Name of the instance attribute that the value is stored under.
+    name : str
+        Attribute name that is used for the property.
+    store : Optional[Callable]
+        Function used to store the processed value, as for
+        :func:`compile_setter`.
+    relations : Optional[:class:`Relations`]
+        Index of the relations touching the property, as for
+        :func:`compile_setter`.
+
+    Returns
+    -------
+    function
+        Setter function with signature `(self, value)`.
+
+    """
+    steps = tuple(SETTER_STEP_NAMES[method] for method in setter_dispatcher)
+    # Reverse relations are only reported for properties that have them
+    reverse_steps = steps + (REVERSE_RELATIONS_STEP_NAME,)
+    closure_vars = {
+        "_setattr": setattr,
+        "_store": store,
+        "_storage_name": storage_name,
+        "_name": name,
+        "_defer": defer_to_transaction,
+        "_type": type,
+        "_perf_counter": time.perf_counter,
+        "_record": instrumentation_state.record,
+        "_steps": steps,
+        "_reverse_steps": reverse_steps,
+        "_no_times": (0.0,) * len(reverse_steps),
+    }
+    steps_var = "_steps" if relations is None else "_record_steps"
+    store_line = (
+        "_setattr(self, _storage_name, value)"
+        if store is None
+        else "_store(self, value)"
+    )
+    body, trusted_body = generate_setter_body(
+        setter_dispatcher, closure_vars, timed=True, relations=relations
+    )
+    body = [
+        "_times = list(_no_times)",
+        *(
+            ["_record_steps = _reverse_steps if _relations.reverse else _steps"]
+            if relations is not None
+            else []
+        ),
+        "try:",
+        "    if _setter_state.active:",
+        "        if _defer(self, _name, value):",
+        "            return",
+        "        _trust_level = _setter_state.level",
+        "        if _trust_level is not None:",
+        *(f"            {line}" for line in trusted_body),
+        f"            {store_line}",
+        f"            _record(_type(self), _name, {steps_var}, _times, None)",
+        "            return",
+        *(f"    {line}" for line in body),
+        f"    {store_line}",
+        "except Exception as error:",
+        f"    _record(_type(self), _name, {steps_var}, _times, error)",
+        "    raise",
+        f"_record(_type(self), _name, {steps_var}, _times, None)",
+    ]
+    return create_function("prop", body, closure_vars)
+
+
+def compile_validator(setter_dispatcher, name):
+    """Generate a function applying a setter dispatcher without storing.
+
+    Parameters
+    ----------
+    setter_dispatcher : dict
+        Mapping of check methods to tuples of their positional and keyword
+        arguments, as for :func:`compile_setter`.
+    name : str
+        Attribute name that is used for the property.
+
+    Returns
+    -------
+    function
+        Function with signature `(self, value)` returning the processed value
+        that the setter would store. Trust levels set with :func:`trusted`
+        are respected, but the value is never deferred to a transaction.
+
+    """
+    closure_vars = {}
+    body, trusted_body = generate_setter_body(setter_dispatcher, closure_vars)
+    closure_vars["_active_setter_states"] = active_setter_states
+    body = [
+        "_trust_level = _active_setter_states.count and _setter_state.level",
+        "if _trust_level:",
+        *(f"    {line}" for line in trusted_body),
+        "    return value",
+        *body,
+        "return value",
+    ]
+    return create_function("validate", body, closure_vars)
+
+
+def generate_setter_body(
+    setter_dispatcher, closure_vars, timed=False, relations=None
+):
+    """Generate source lines calling each method in a setter dispatcher.
+
+    Parameters
+    ----------
+    setter_dispatcher : dict
+        Mapping of check methods to tuples of their positional and keyword
+        arguments, as for :func:`compile_setter`.
+    closure_vars : dict
+        Mapping of names to values that the generated lines reference. Added
+        to in place with the methods and their arguments.
+    timed : bool
+        If `True`, the time taken by the `i`th method is stored in
+        `_times[i]`, using `_perf_counter` from the closure variables.
+    relations : Optional[:class:`Relations`]
+        If given, a line checking its reverse relations is added after the
+        methods.
+
+    Returns
+    -------
+    tuple of lists
+        Tuple of length two where the first element is the lines applying all
+        methods and the second is the lines to apply when in trusted mode.
+
+    """
+    closure_vars["_setter_state"] = setter_state
+    closure_vars["_keep_method"] = KEEP_METHOD_TRUST_KEYWORD
+    body = []
+    trusted_body = []
+    for i, (method, (args, kwargs)) in enumerate(setter_dispatcher.items()):
+        method_var = f"_method_{i}"
+        closure_vars[method_var] = method
+        call_args = ["value"]
+        for j, arg in enumerate(args):
+            arg_var = f"_arg_{i}_{j}"
+            closure_vars[arg_var] = arg
+            call_args.append(arg_var)
+        for kwarg_name, kwarg in kwargs.items():
+            if kwarg is INSTANCE:
+                call_args.append(f"{kwarg_name}=self")
+            else:
+                kwarg_var = f"_kwarg_{i}_{kwarg_name}"
+                closure_vars[kwarg_var] = kwarg
+                call_args.append(f"{kwarg_name}={kwarg_var}")
+        call_line = f"value = {method_var}({', '.join(call_args)})"
+        if timed:
+            body.extend(timed_lines(call_line, i))
+        else:
+            body.append(call_line)
+        if method is apply_method:
+            trusted_body.append(f"if _trust_level == _keep_method: {call_line}")
+    if relations is not None:
+        closure_vars["_relations"] = relations
+        closure_vars["_check_reverse_relations"] = check_reverse_relations
+        call_line = "_check_reverse_relations(value, _relations, self)"
+        if timed:
+            call_lines = timed_lines(call_line, len(setter_dispatcher))
+        else:
+            call_lines = [call_line]
+        body.append("if _relations.reverse:")
+        body.extend(f"    {line}" for line in call_lines)
+    return body, trusted_body
+
+
+def timed_lines(call_line, i):
+    """Source lines timing a call, including when it raises, in `_times[i]`."""
+    return [
+        "_start = _perf_counter()",
+        "try:",
+        f"    {call_line}",
+        "finally:",
+        f"    _times[{i}] = _perf_counter() - _start",
+    ]
+
+
+def create_function(func_name, body, closure_vars):
+    """Compile a function with signature `(self, value)` from source lines.
+
+    The function is created within a factory function whose parameters are
+    the closure variables, so that they are looked up as fast closure cells
+    rather than globals. The source only depends on the names of the closure
+    variables, so properties making the same checks share one compiled
+    factory.
+
+    """
+    func_src = "\n".join(f"        {line}" for line in body)
+    factory_src = (
+        f"def create({', '.join(closure_vars)}):\n"
+        f"    def {func_name}(self, value):\n"
+        f"{func_src}\n"
+        f"    return {func_name}\n"
+    )
+    return compile_factory(factory_src)(**closure_vars)
+
+
+@lru_cache(maxsize=FUNCTION_FACTORY_CACHE_SIZE)
+def compile_factory(factory_src):
+    """Compiled factory function defined by source, cached by source."""
+    namespace = {}
+    exec(compile(factory_src, "<processed_property>", "exec"), namespace)
+    return namespace["create"]
+
+
+def defer_to_transaction(instance, name, value):
+    """Record a value as pending if a transaction is open on the instance.
+
+    Returns
+    -------
+    bool
+        Whether the value was deferred to an open transaction.
+
+    """
+    transactions = setter_state.transactions
+    if not transactions:
+        return False
+    pending = transactions.get(id(instance))
+    if pending is None:
+        return False
+    pending[name] = value
+    return True
 
 
 def check_read_only(value, storage_name, name_str, *, instance):
@@ -255,14 +1126,11 @@ def check_expected_type(
     value, iterable_allowed, expected_type, name_str, optional, cast_to_type, default
 ):
     if iterable_allowed:
-        if isinstance(value, Iterable):
-            value = tuple(
-                [
-                    check_type(
-                        val, expected_type, name_str, optional, cast_to_type, default
-                    )
-                    for val in value
-                ]
+        if is_array_with_dtype(value, expected_type):
+            value = check_array_dtype(value, expected_type, name_str, cast_to_type)
+        elif isinstance(value, Iterable):
+            value = check_iterable_type(
+                value, expected_type, name_str, optional, cast_to_type, default
             )
         elif (value is None) and optional:
             if default is not None:
@@ -279,6 +1147,163 @@ def check_expected_type(
     return value
 
 
+def check_iterable_type(
+    value, expected_type, name_str, optional, cast_to_type, default
+):
+    """Ensure the type of each element of an iterable is as specified.
+
+    A single scan is first made to check whether every element is already of
+    the expected type. If so, a tuple is returned as-is and any other
+    sequence is copied to a tuple once, without the full type check being
+    made for each element.
+
+    Returns
+    -------
+    tuple
+        The elements of the iterable, each processed by :func:`check_type`.
+
+    """
+    if not isinstance(value, (tuple, list)):
+        value = tuple(value)
+    for val in value:
+        if not isinstance(val, expected_type):
+            break
+    else:
+        return value if type(value) is tuple else tuple(value)
+    return tuple(
+        [
+            check_type(val, expected_type, name_str, optional, cast_to_type, default)
+            for val in value
+        ]
+    )
+
+
+@lru_cache(maxsize=None)
+def array_dtype_dispatcher():
+    """Numpy abstract scalar types matching the Python types of elements."""
+    return {
+        bool: np.bool_,
+        int: np.integer,
+        float: np.floating,
+        complex: np.complexfloating,
+        str: np.str_,
+    }
+
+
+def is_array_with_dtype(value, expected_type):
+    """Whether a value is an array whose dtype can be checked as a whole.
+
+    Object arrays, and arrays where the expected type has no equivalent Numpy
+    dtype, have their elements checked individually instead.
+
+    """
+    if "numpy" not in sys.modules or not isinstance(value, np.ndarray):
+        return False
+    if value.dtype == object:
+        return False
+    return expected_type in array_dtype_dispatcher() or (
+        isinstance(expected_type, type) and issubclass(expected_type, np.generic)
+    )
+
+
+def check_array_dtype(value, expected_type, name_str, cast_to_type):
+    """Ensure the elements of an array are of the expected type.
+
+    Rather than checking the type of every element, the array's dtype is
+    checked once against the dtype corresponding to the expected type.
+
+    Parameters
+    ----------
+    value : :py:class:`numpy.ndarray`
+        Array value being set.
+    expected_type : type
+        Expected type of the array's elements.
+
+    Returns
+    -------
+    :py:class:`numpy.ndarray`
+        Read-only array with the array's elements if its dtype matches (see
+        :func:`read_only_array`), otherwise the array cast to the expected
+        type if casting is enabled (see :func:`cast_array`). This is read-only
+        and does not share memory with any writable array so that, like the
+        tuples stored for other iterables, its elements cannot be changed
+        without being checked.
+
+    Raises
+    ------
+    TypeError
+        If the dtype does not match and casting is not enabled.
+    ValueError
+        If the array cannot be cast.
+
+    """
+    dtype = array_dtype_dispatcher().get(expected_type, expected_type)
+    if np.issubdtype(value.dtype, dtype):
+        return read_only_array(value)
+    if cast_to_type:
+        try:
+            return read_only_view(cast_array(value, expected_type))
+        except (ValueError, TypeError, ArithmeticError):
+            msg = (
+                f"{name_str} must be a {repr(expected_type)}, instead got an "
+                f"array of dtype `{value.dtype}` which cannot be cast."
+            )
+            raise ValueError(msg)
+    msg = (
+        f"{name_str} must be a {repr(expected_type)}, instead got an array of "
+        f"dtype `{value.dtype}`."
+    )
+    raise TypeError(msg)
+
+
+# Numpy dtype kinds of strings, which are cast element by element
+STRING_DTYPE_KINDS = {"U", "S"}
+
+
+def cast_array(array, expected_type):
+    """Cast the elements of an array to a type.
+
+    Numeric arrays are cast as a whole with `astype`. Arrays of strings, and
+    arrays being cast to a type with a cast registered with
+    :func:`pyproprop.register_cast`, have each element cast with the
+    registered cast function, so that they are cast as the elements of other
+    iterables are.
+
+    """
+    if array.dtype.kind not in STRING_DTYPE_KINDS and has_default_cast(
+        expected_type
+    ):
+        return array.astype(expected_type)
+    cast_elements = [
+        cast_value(element, expected_type) for element in array.ravel().tolist()
+    ]
+    return np.array(cast_elements, dtype=expected_type).reshape(array.shape)
+
+
+def read_only_array(array):
+    """Read-only array holding the same elements as an array.
+
+    The array is only viewed, without copying its elements, if neither it nor
+    any array it is a view of can be written to. Otherwise it is copied once,
+    so that the caller cannot change the elements of the returned array
+    through the original.
+
+    """
+    base = array
+    while isinstance(base, np.ndarray):
+        if base.flags.writeable:
+            return read_only_view(array.copy())
+        base = base.base
+    return read_only_view(array)
+
+
+def read_only_view(array):
+    """View of an array that cannot be written to, sharing its memory."""
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
 def check_type(value, expected_type, name_str, optional, cast_to_type, default):
     """Ensure the type of the property value to be set is as specified.
 
@@ -328,31 +1353,28 @@ def cast_type(value, expected_type, name_str):
     Returns
     -------
     obj
-        Supplied value cast to the specified type
+        Supplied value cast to the specified type using the cast function
+        registered in :py:const:`CAST_DISPATCHER`.
 
     Raises
     ------
     ValueError
         If the casting fails.
-    TypeError
-        If the casting fails.
 
     """
-    if expected_type == np.ndarray:
-        return np.array(value)
-    cast_str = f"processed_value = {expected_type.__name__}({value})"
     try:
-        exec(cast_str)
-    except (ValueError, TypeError):
+        return cast_value(value, expected_type)
+    except (ValueError, TypeError, ArithmeticError):
         msg = (
             f"{name_str} must be a {repr(expected_type)}, instead got "
             f"a {repr(type(value))} which cannot be cast."
         )
         raise ValueError(msg)
-    return locals()["processed_value"]
 
 
-def check_options(value, options, unsupported_options, name_str, name, description):
+def check_options(
+    value, options, unsupported_options, valid_options, name_str, name, description
+):
     """Ensure user-supplied value is a valid option.
 
     Options for property can fall in to two camps: valid options and
@@ -371,10 +1393,21 @@ def check_options(value, options, unsupported_options, name_str, name, descripti
     ValueError
         If value trying to be set is not a valid option or is an
         unsupported option.
+
+    Note
+    ----
+    Error messages are only formatted if the value is not valid. Membership
+    tests use the indexes built by :func:`index_options` so are O(1) for
+    hashable options.
+
     """
-    valid_options = [option for option in options if option not in unsupported_options]
-    formatted_valid_options = format_for_output(valid_options, with_or=True)
-    if value in unsupported_options:
+    try:
+        is_valid = value in options
+    except TypeError:
+        # Unhashable values cannot be members of hash-indexed options
+        is_valid = False
+    if is_valid and unsupported_options and is_option(value, unsupported_options):
+        formatted_valid_options = format_for_output(valid_options, with_or=True)
         formatted_unsupported_option = format_for_output(value, with_verb=True)
         formatted_description = generate_name_description_error_message(
             name, description, with_preposition=True
@@ -385,7 +1418,8 @@ def check_options(value, options, unsupported_options, name_str, name, descripti
             f"{formatted_valid_options}."
         )
         raise ValueError(msg)
-    elif value not in options:
+    elif not is_valid:
+        formatted_valid_options = format_for_output(valid_options, with_or=True)
         formatted_value = format_for_output(value, with_verb=True)
         msg = (
             f"{formatted_value} not a valid option of {name_str}. "
@@ -395,7 +1429,7 @@ def check_options(value, options, unsupported_options, name_str, name, descripti
     return value
 
 
-def check_min(value, name, description, exclusive, min_value):
+def check_min(value, name_str, exclusive, min_value):
     """Ensure the numerical value of property being set is greater than
     specified minimum.
 
@@ -403,6 +1437,9 @@ def check_min(value, name, description, exclusive, min_value):
     ----------
     value : float
         Property object value for setting.
+    name_str : str
+        Name and description of the property formatted for the start of an
+        error message sentence.
 
     Raises
     ------
@@ -415,10 +1452,15 @@ def check_min(value, name, description, exclusive, min_value):
     Use function from py:mod:`utils` to format repr values with backticks.
 
     """
-    name_str = generate_name_description_error_message(
-        name, description, is_sentence_start=True
-    )
-    if exclusive:
+    if "numpy" in sys.modules and isinstance(value, np.ndarray):
+        invalid = value <= min_value if exclusive else value < min_value
+        if invalid.any():
+            comparison = "greater than" if exclusive else "greater than or equal to"
+            msg = array_bound_error_message(
+                value, invalid, name_str, comparison, min_value
+            )
+            raise ValueError(msg)
+    elif exclusive:
         if value <= min_value:
             msg = (
                 f"{name_str} must be greater than `{repr(min_value)}`. "
@@ -435,7 +1477,7 @@ def check_min(value, name, description, exclusive, min_value):
     return value
 
 
-def check_max(value, name, description, exclusive, max_value):
+def check_max(value, name_str, exclusive, max_value):
     """Ensure the numerical value of property being set is less than
     specified maximum.
 
@@ -443,6 +1485,9 @@ def check_max(value, name, description, exclusive, max_value):
     ----------
     value : float
         Property object value for setting.
+    name_str : str
+        Name and description of the property formatted for the start of an
+        error message sentence.
 
     Raises
     ------
@@ -455,10 +1500,15 @@ def check_max(value, name, description, exclusive, max_value):
     Use function from py:mod:`utils` to format repr values with backticks.
 
     """
-    name_str = generate_name_description_error_message(
-        name, description, is_sentence_start=True
-    )
-    if exclusive:
+    if "numpy" in sys.modules and isinstance(value, np.ndarray):
+        invalid = value >= max_value if exclusive else value > max_value
+        if invalid.any():
+            comparison = "less than" if exclusive else "less than or equal to"
+            msg = array_bound_error_message(
+                value, invalid, name_str, comparison, max_value
+            )
+            raise ValueError(msg)
+    elif exclusive:
         if value >= max_value:
             msg = (
                 f"{name_str} must be less than `{repr(max_value)}`. "
@@ -475,90 +1525,275 @@ def check_max(value, name, description, exclusive, max_value):
     return value
 
 
-def check_less_than(value, less_than, name, description, *, instance):
-    def less_than_lambda(val_1, val_2):
-        return val_1 < val_2
+def array_bound_error_message(value, invalid, name_str, comparison, bound):
+    """Error message reporting the first element of an array out of bounds.
+
+    Parameters
+    ----------
+    value : :py:class:`numpy.ndarray`
+        Array value being set.
+    invalid : :py:class:`numpy.ndarray`
+        Boolean array of the same shape flagging invalid elements.
+    name_str : str
+        Name and description of the property formatted for the start of an
+        error message sentence.
+    comparison : str
+        Description of the bound, e.g. "less than".
+    bound : :py:class:`numbers.Real`
+        Value of the bound.
+
+    Returns
+    -------
+    str
+        Formatted error message.
+
+    """
+    index = first_true_index(invalid)
+    invalid_value = value[index].item()
+    return (
+        f"{name_str} must be {comparison} `{repr(bound)}`. "
+        f"`{repr(invalid_value)}` at index `{repr(index)}` is invalid."
+    )
+
+
+def first_true_index(array):
+    """Index of the first `True` element of a boolean array.
+
+    Returns
+    -------
+    Union[int, tuple]
+        Integer index for a 1-dimensional array, otherwise a tuple of indices.
 
+    """
+    flat_index = int(np.argmax(array))
+    if array.ndim == 1:
+        return flat_index
+    return tuple(int(i) for i in np.unravel_index(flat_index, array.shape))
+
+
+def check_less_than(
+    value, less_than, less_than_storage_name, name, description, *, instance
+):
     check_comparison(
-        value, instance, less_than, "less than", less_than_lambda, name, description
+        value,
+        instance,
+        less_than_storage_name,
+        less_than,
+        "less than",
+        operator.lt,
+        name,
+        description,
     )
     return value
 
 
-def check_greater_than(value, greater_than, name, description, *, instance):
-    def greater_than_lambda(val_1, val_2):
-        return val_1 > val_2
-
+def check_greater_than(
+    value, greater_than, greater_than_storage_name, name, description, *, instance
+):
     check_comparison(
         value,
         instance,
+        greater_than_storage_name,
         greater_than,
         "greater than",
-        greater_than_lambda,
+        operator.gt,
         name,
         description,
     )
     return value
 
 
-def check_at_least(value, at_least, name, description, *, instance):
-    def at_least_lambda(val_1, val_2):
-        return val_1 >= val_2
-
+def check_at_least(
+    value, at_least, at_least_storage_name, name, description, *, instance
+):
     check_comparison(
-        value, instance, at_least, "at least", at_least_lambda, name, description
+        value,
+        instance,
+        at_least_storage_name,
+        at_least,
+        "at least",
+        operator.ge,
+        name,
+        description,
     )
     return value
 
 
-def check_at_most(value, at_most, name, description, *, instance):
-    def at_most_lambda(val_1, val_2):
-        return val_1 <= val_2
-
+def check_at_most(
+    value, at_most, at_most_storage_name, name, description, *, instance
+):
     check_comparison(
-        value, instance, at_most, "at most", at_most_lambda, name, description
+        value,
+        instance,
+        at_most_storage_name,
+        at_most,
+        "at most",
+        operator.le,
+        name,
+        description,
     )
     return value
 
 
-def check_equal_to(value, equal_to, name, description, *, instance):
-    def equal_to_lambda(val_1, val_2):
-        return val_1 == val_2
-
+def check_equal_to(
+    value, equal_to, equal_to_storage_name, name, description, *, instance
+):
     check_comparison(
-        value, instance, equal_to, "equal to", equal_to_lambda, name, description
+        value,
+        instance,
+        equal_to_storage_name,
+        equal_to,
+        "equal to",
+        operator.eq,
+        name,
+        description,
     )
     return value
 
 
 def check_comparison(
-    value, instance, other, comparison_description, comparison_func, name, description
+    value,
+    instance,
+    other_storage_name,
+    other,
+    comparison_description,
+    comparison_func,
+    name,
+    description,
 ):
-    try:
-        other_value = getattr(instance, ("_" + other))
-    except AttributeError:
-        pass
-    else:
-        if not comparison_func(value, other_value):
-            other_dir = getattr(instance, f"_{other}_dir")
-            other_name = other_dir["name"]
-            other_description = other_dir["description"]
-            name_str = generate_name_description_error_message(
-                name, description, is_sentence_start=True
-            )
-            other_name_str = generate_name_description_error_message(
-                other_name, other_description
+    other_value = getattr(instance, other_storage_name, MISSING)
+    if other_value is not MISSING:
+        if not compare(comparison_func, value, other_value):
+            msg = comparison_error_message(
+                value,
+                other_value,
+                type(instance),
+                other,
+                comparison_description,
+                comparison_func,
+                name,
+                description,
             )
-            value_formatted = format_for_output(value)
-            other_value_formatted = format_for_output(other_value)
-            msg = (
-                f"{name_str} with value {value_formatted} must be "
-                f"{comparison_description} {other_name_str} with "
-                f"value {other_value_formatted}."
+            raise ValueError(msg)
+
+
+def check_reverse_relations(value, relations, instance):
+    """Check relations declared by other properties against a new value.
+
+    Parameters
+    ----------
+    value : obj
+        Processed value of the property being set.
+    relations : :class:`Relations`
+        Index of the relations touching the property being set.
+    instance : obj
+        Instance whose property is being set.
+
+    Raises
+    ------
+    ValueError
+        If a relation does not hold between the value and the declaring
+        property's stored value.
+
+    """
+    cls = type(instance)
+    for relation in relations.reverse_for(cls):
+        declared_value = getattr(instance, relation.storage_name, MISSING)
+        if declared_value is MISSING:
+            continue
+        if not compare(relation.comparison_func, declared_value, value):
+            msg = comparison_error_message(
+                declared_value,
+                value,
+                cls,
+                relation.other,
+                relation.comparison_description,
+                relation.comparison_func,
+                relation.name,
+                relation.description,
             )
             raise ValueError(msg)
 
 
+def compare(comparison_func, value, other_value):
+    """Compare two values, requiring all elements to compare for arrays."""
+    result = comparison_func(value, other_value)
+    if "numpy" in sys.modules and isinstance(result, np.ndarray):
+        return bool(result.all())
+    return result
+
+
+def comparison_error_message(
+    value,
+    other_value,
+    cls,
+    other,
+    comparison_description,
+    comparison_func,
+    name,
+    description,
+):
+    """Error message for a failed comparison between two processed properties.
+
+    Parameters
+    ----------
+    value : obj
+        Value of the property declaring the comparison.
+    other_value : obj
+        Value of the property being compared against.
+    cls : type
+        Class holding the processed properties.
+    other : str
+        Name of the property being compared against.
+    comparison_description : str
+        Description of the comparison, e.g. "less than".
+    comparison_func : Callable
+        Function comparing the values. If this compares elementwise the
+        first pair of elements failing the comparison is reported.
+    name : str
+        Name of the property declaring the comparison.
+    description : Optional[str]
+        Description of the property declaring the comparison.
+
+    Returns
+    -------
+    str
+        Formatted error message.
+
+    """
+    # Name and description are held once by the class's property
+    other_prop = getattr(cls, other, None)
+    other_description = getattr(other_prop, "description", None)
+    name_str = generate_name_description_error_message(
+        name, description, is_sentence_start=True
+    )
+    other_name_str = generate_name_description_error_message(other, other_description)
+    result = comparison_func(value, other_value)
+    index_formatted = ""
+    if "numpy" in sys.modules and isinstance(result, np.ndarray):
+        index = first_true_index(~result)
+        value = np.broadcast_to(value, result.shape)[index].item()
+        other_value = np.broadcast_to(other_value, result.shape)[index].item()
+        index_formatted = f" at index `{repr(index)}`"
+    value_formatted = format_for_output(value)
+    other_value_formatted = format_for_output(other_value)
+    return (
+        f"{name_str} with value {value_formatted}{index_formatted} must be "
+        f"{comparison_description} {other_name_str} with "
+        f"value {other_value_formatted}."
+    )
+
+
+# Mapping of relational checks to their descriptions and comparison functions
+COMPARISON_CHECKS = {
+    check_less_than: ("less than", operator.lt),
+    check_greater_than: ("greater than", operator.gt),
+    check_at_least: ("at least", operator.ge),
+    check_at_most: ("at most", operator.le),
+    check_equal_to: ("equal to", operator.eq),
+}
+
+
 def check_len(value, len_sequence, name_str):
     """Enforces the set sequence length to be equal to a specified value.
 
@@ -628,13 +1863,13 @@ def process_optimisable(value, name_str):
     if isinstance(value, Iterable):
         check_len(value, 2, name_str)
         bounds = []
-        msg = (
-            f"Both {name_str} bounds must be of type {Real}, instead "
-            f"got {value[0]} at index 0 (type {type(value[0])}) and "
-            f"{value[1]} at index 1 (type {type(value[1])})."
-        )
         for bound in value:
             if not isinstance(bound, Real):
+                msg = (
+                    f"Both {name_str} bounds must be of type {Real}, instead "
+                    f"got {value[0]} at index 0 (type {type(value[0])}) and "
+                    f"{value[1]} at index 1 (type {type(value[1])})."
+                )
                 raise TypeError(msg)
             bounds.append(bound)
         bounds = check_bounds(bounds)
@@ -646,9 +1881,27 @@ def process_optimisable(value, name_str):
     raise TypeError(msg)
 
 
+# Range of integers that can be represented as a signed 64-bit number
+INT64_MIN = -(2**63)
+INT64_MAX = 2**63 - 1
+
+# Default tolerances of :py:func:`numpy.isclose`
+ISCLOSE_RTOL = 1e-05
+ISCLOSE_ATOL = 1e-08
+
+BOUNDS_OVERFLOW_ERROR_MSG = (
+    "Individual bounds must be able to be represented as a "
+    "signed 64-bit number, and hence must lie in the range "
+    "(-9223372036854775808, 9223372036854775807)."
+)
+
+
 def check_bounds(bounds):
     """Validates bounds for `optimisable` processed property.
 
+    Python `int` and `float` bounds are validated without using Numpy. Other
+    bounds, e.g. Numpy integers, are checked for overflow by Numpy.
+
     Parameters
     ----------
     bounds : Iterable
@@ -672,17 +1925,8 @@ def check_bounds(bounds):
     """
     lower_bound = bounds[0]
     upper_bound = bounds[1]
-    try:
-        # Test if both bounds can be represented as signed 64-bit number.
-        np.asarray(bounds, dtype=np.int64)
-    except OverflowError:
-        msg = (
-            "Individual bounds must be able to be represented as a "
-            "signed 64-bit number, and hence must lie in the range "
-            "(-9223372036854775808, 9223372036854775807)."
-        )
-        raise ValueError(msg)
-    if np.isclose(lower_bound, upper_bound):
+    check_int64(bounds)
+    if isclose(lower_bound, upper_bound):
         return lower_bound
     if lower_bound > upper_bound:
         msg = (
@@ -691,3 +1935,140 @@ def check_bounds(bounds):
         )
         raise ValueError(msg)
     return tuple(bounds)
+
+
+def check_int64(bounds):
+    """Ensure bounds can be represented as signed 64-bit numbers.
+
+    Python `int` and `float` bounds are compared against the range directly.
+    As when converted by Numpy, floats that are not finite are invalid.
+
+    Raises
+    ------
+    ValueError
+        If any bound is outside the signed 64-bit range.
+
+    """
+    for bound in bounds:
+        if isinstance(bound, (int, float)):
+            if INT64_MIN <= bound <= INT64_MAX:
+                continue
+            raise ValueError(BOUNDS_OVERFLOW_ERROR_MSG)
+        try:
+            np.asarray(bounds, dtype=np.int64)
+        except OverflowError:
+            raise ValueError(BOUNDS_OVERFLOW_ERROR_MSG)
+        return
+
+
+def check_int64_array(array):
+    """Vectorised equivalent of :func:`check_int64` for a Numpy array."""
+    kind = array.dtype.kind
+    if kind == "f":
+        in_range = (array >= float(INT64_MIN)) & (array < -float(INT64_MIN))
+        out_of_range = not in_range.all()
+    elif kind == "u":
+        out_of_range = (array > INT64_MAX).any()
+    elif kind == "O":
+        try:
+            np.asarray(array.tolist(), dtype=np.int64)
+        except (OverflowError, ValueError):
+            out_of_range = True
+        else:
+            out_of_range = False
+    else:
+        out_of_range = False
+    if out_of_range:
+        raise ValueError(BOUNDS_OVERFLOW_ERROR_MSG)
+
+
+def isclose(value, other_value):
+    """Scalar equivalent of :py:func:`numpy.isclose` with default tolerances."""
+    value = float(value)
+    other_value = float(other_value)
+    if value == other_value:
+        return True
+    if math.isinf(value) or math.isinf(other_value):
+        return False
+    return abs(value - other_value) <= ISCLOSE_ATOL + ISCLOSE_RTOL * abs(other_value)
+
+
+def check_bounds_many(bounds):
+    """Validate many pairs of bounds for `optimisable` parameters at once.
+
+    Vectorised equivalent of calling :func:`check_bounds` on each pair.
+
+    Parameters
+    ----------
+    bounds : array_like
+        Bound pairs with shape `(N, 2)`, where the first column holds the
+        lower bounds and the second the upper bounds.
+
+    Returns
+    -------
+    list
+        For each pair, the lower bound if the bounds are equal, otherwise a
+        tuple of the lower and upper bound. Bounds are converted to Python
+        numbers from the array's dtype, so for example all are floats if any
+        input bound is a float.
+
+    Raises
+    ------
+    ValueError
+        If `bounds` does not have shape `(N, 2)`, if any integer bound is
+        outside 64-bit range, or if any lower bound exceeds its upper bound.
+
+    Example
+    -------
+    >>> check_bounds_many([[0, 1], [2, 2]])
+    [(0, 1), 2]
+
+    """
+    array = np.asarray(bounds)
+    if array.ndim != 2 or array.shape[1] != 2:
+        msg = f"Bounds must have shape (N, 2), instead got {array.shape}."
+        raise ValueError(msg)
+    check_int64_array(array)
+    lower_bounds = array[:, 0]
+    upper_bounds = array[:, 1]
+    if array.dtype == object:
+        lower_bounds = lower_bounds.astype(float)
+        upper_bounds = upper_bounds.astype(float)
+    equal = np.isclose(lower_bounds, upper_bounds)
+    invalid = ~equal & (lower_bounds > upper_bounds)
+    if invalid.any():
+        index = first_true_index(invalid)
+        lower_bound, upper_bound = array[index].tolist()
+        msg = (
+            f"Lower bound ({lower_bound}) at index 0 must be less than upper "
+            f"bound ({upper_bound}) at index 1 for bounds at index {index}."
+        )
+        raise ValueError(msg)
+    return [
+        lower_bound if is_equal else (lower_bound, upper_bound)
+        for (lower_bound, upper_bound), is_equal in zip(
+            array.tolist(), equal.tolist()
+        )
+    ]
+
+
+# Mapping of setter dispatcher methods to the names their times are recorded
+# under by instrumented setters
+REVERSE_RELATIONS_STEP_NAME = "reverse_relations"
+
+SETTER_STEP_NAMES = {
+    check_read_only: "read_only",
+    check_expected_type: "type",
+    format_str_case: "str_format",
+    check_options: "options",
+    check_min: "min",
+    check_max: "max",
+    check_less_than: "less_than",
+    check_greater_than: "greater_than",
+    check_at_least: "at_least",
+    check_at_most: "at_most",
+    check_equal_to: "equal_to",
+    check_len: "len",
+    process_optimisable: "optimisable",
+    apply_method: "method",
+}
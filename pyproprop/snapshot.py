@@ -0,0 +1,297 @@
+"""Snapshots of processed property values restored without being checked.
+
+Values stored by processed properties have already been checked, so
+rebuilding an instance by setting them again through the setters repeats
+every check for nothing. :func:`snapshot` captures the stored values of an
+instance's processed properties in a compact tuple and :func:`restore` writes
+them straight back to storage. The :func:`processed_property_picklable` class
+decorator uses these to pickle instances.
+
+Array values are held in snapshots as they are, so pickling with protocol 5
+and a `buffer_callback` passes their data out-of-band without it being
+copied.
+
+"""
+
+import operator
+import sys
+import weakref
+from collections import namedtuple
+
+from .lazy_import import LazyModule
+from .processed_property import (
+    MISSING,
+    check_expected_type,
+    get_processed_properties,
+    read_only_view,
+)
+from .utils import format_as_iterable
+
+np = LazyModule("numpy")
+
+__all__ = ["UNSET", "processed_property_picklable", "restore", "snapshot"]
+
+
+class Unset:
+    """Type of :data:`UNSET`, which pickles as a reference to itself."""
+
+    __slots__ = ()
+
+    def __repr__(self):
+        return "UNSET"
+
+    def __reduce__(self):
+        return "UNSET"
+
+
+# Marker in a snapshot for a processed property without a stored value
+UNSET = Unset()
+
+# Storage of each class's processed properties, see `storage_layout`
+_storage_layouts = weakref.WeakKeyDictionary()
+
+StorageLayout = namedtuple(
+    "StorageLayout",
+    [
+        "storage_names",
+        "stores",
+        "read_only_arrays",
+        "get_values",
+        "in_dict",
+        "other_slots",
+    ],
+)
+StorageLayout.__doc__ = """Storage of a class's processed properties.
+
+Attributes
+----------
+storage_names : tuple
+    Storage name of each processed property in definition order.
+stores : tuple
+    Function storing each processed property's value, or `None` if values
+    are stored with `setattr`.
+read_only_arrays : tuple
+    Whether each processed property stores arrays as read-only views, which
+    are only made for properties with `iterable_allowed=True`.
+get_values : Callable
+    Function returning a tuple of an instance's stored values, raising
+    :py:class:`AttributeError` if any is not set.
+in_dict : bool
+    Whether all values are stored in the instance `__dict__`.
+other_slots : tuple
+    Names of the class's slots not holding processed property values.
+
+"""
+
+
+def storage_layout(cls):
+    """Storage of a class's processed properties, cached for each class."""
+    try:
+        return _storage_layouts[cls]
+    except KeyError:
+        pass
+    props = get_processed_properties(cls).values()
+    storage_names = tuple(prop.storage_name for prop in props)
+    stores = tuple(prop.store for prop in props)
+    read_only_arrays = tuple(stores_read_only_arrays(prop) for prop in props)
+    if len(storage_names) == 1:
+        get_single_value = operator.attrgetter(*storage_names)
+
+        def get_values(instance):
+            return (get_single_value(instance),)
+
+    elif storage_names:
+        get_values = operator.attrgetter(*storage_names)
+    else:
+
+        def get_values(instance):
+            return ()
+
+    other_slots = tuple(
+        slot
+        for base in cls.__mro__
+        for slot in format_as_iterable(base.__dict__.get("__slots__", ()))
+        if slot not in storage_names and slot not in ("__dict__", "__weakref__")
+    )
+    layout = StorageLayout(
+        storage_names,
+        stores,
+        read_only_arrays,
+        get_values,
+        all(store is None for store in stores),
+        other_slots,
+    )
+    _storage_layouts[cls] = layout
+    return layout
+
+
+def stores_read_only_arrays(prop):
+    """Whether a processed property stores arrays as read-only views."""
+    try:
+        args, _ = prop.setter_dispatcher[check_expected_type]
+    except KeyError:
+        return False
+    iterable_allowed = args[0]
+    return iterable_allowed
+
+
+def snapshot(instance):
+    """Stored values of an instance's processed properties.
+
+    Parameters
+    ----------
+    instance : obj
+        Instance whose processed property values are captured.
+
+    Returns
+    -------
+    tuple
+        Stored value of each processed property of the instance's class in
+        definition order, or :data:`UNSET` for those without a value. Values
+        are not copied.
+
+    Example
+    -------
+    >>> state = snapshot(solver)
+    >>> solver.tolerance = 1e-8
+    >>> restore(solver, state)
+
+    """
+    return snapshot_values(instance, storage_layout(type(instance)))
+
+
+def snapshot_values(instance, layout):
+    """Snapshot of an instance given its class's :class:`StorageLayout`."""
+    try:
+        return layout.get_values(instance)
+    except AttributeError:
+        pass
+    values = []
+    for storage_name in layout.storage_names:
+        value = getattr(instance, storage_name, MISSING)
+        values.append(UNSET if value is MISSING else value)
+    return tuple(values)
+
+
+def restore(instance, state):
+    """Store the values of a snapshot without checking them again.
+
+    Parameters
+    ----------
+    instance : obj
+        Instance of the class the snapshot was taken from.
+    state : tuple
+        Snapshot returned by :func:`snapshot`. Processed properties that
+        were :data:`UNSET` have any value they now hold deleted.
+
+    Raises
+    ------
+    ValueError
+        If the snapshot does not have a value for each processed property of
+        the instance's class.
+
+    """
+    restore_values(instance, state, storage_layout(type(instance)))
+
+
+def restore_values(instance, state, layout):
+    """Restore a snapshot given the class's :class:`StorageLayout`."""
+    if len(state) != len(layout.storage_names):
+        msg = (
+            f"Snapshot must have {len(layout.storage_names)} values for "
+            f"{repr(type(instance).__name__)}, instead got {len(state)}."
+        )
+        raise ValueError(msg)
+    ndarray = np.ndarray if "numpy" in sys.modules else ()
+    if layout.in_dict:
+        for value, read_only in zip(state, layout.read_only_arrays):
+            if value is UNSET or (read_only and isinstance(value, ndarray)):
+                break
+        else:
+            # Values can be stored directly as none need special handling
+            instance.__dict__.update(zip(layout.storage_names, state))
+            return
+    for storage_name, store, read_only, value in zip(
+        layout.storage_names, layout.stores, layout.read_only_arrays, state
+    ):
+        if value is UNSET:
+            if hasattr(instance, storage_name):
+                delattr(instance, storage_name)
+            continue
+        if read_only and isinstance(value, ndarray) and value.flags.writeable:
+            # Arrays unpickled in-band are writable copies
+            value = read_only_view(value)
+        if store is None:
+            setattr(instance, storage_name, value)
+        else:
+            store(instance, value)
+
+
+def processed_property_picklable(cls):
+    """Class decorator pickling instances from snapshots of their values.
+
+    Adds `__getstate__` and `__setstate__` methods to the class so that the
+    values of its processed properties are pickled as a :func:`snapshot` and
+    are unpickled with :func:`restore`, without being checked again. Any other
+    attributes held in the instance `__dict__` or in `__slots__` are pickled
+    as normal. Can be combined with :func:`processed_property_slots`.
+
+    Example
+    -------
+    >>> @processed_property_picklable
+    ... class Solver:
+    ...     tolerance = processed_property("tolerance", type=float, min=0)
+    >>> checkpoint = pickle.dumps(solver, protocol=5)
+
+    """
+    cls.__getstate__ = getstate
+    cls.__setstate__ = setstate
+    return cls
+
+
+def other_attributes(instance, layout):
+    """Attributes of an instance not held by its processed properties."""
+    instance_dict = getattr(instance, "__dict__", None)
+    if instance_dict is None:
+        attributes = {}
+    elif layout.in_dict:
+        storage_names = layout.storage_names
+        attributes = {
+            name: value
+            for name, value in instance_dict.items()
+            if name not in storage_names
+        }
+    else:
+        attributes = dict(instance_dict)
+    for slot in layout.other_slots:
+        value = getattr(instance, slot, MISSING)
+        if value is not MISSING:
+            attributes[slot] = value
+    return attributes
+
+
+def getstate(self):
+    """State of an instance as a snapshot and its other attributes."""
+    layout = storage_layout(type(self))
+    try:
+        values = layout.get_values(self)
+    except AttributeError:
+        return snapshot_values(self, layout), other_attributes(self, layout)
+    instance_dict = getattr(self, "__dict__", None)
+    if (
+        layout.in_dict
+        and not layout.other_slots
+        and instance_dict is not None
+        and len(instance_dict) == len(values)
+    ):
+        # Every attribute is a processed property's stored value
+        return values, {}
+    return values, other_attributes(self, layout)
+
+
+def setstate(self, state):
+    """Restore an instance's state from :func:`getstate`."""
+    values, attributes = state
+    restore_values(self, values, storage_layout(type(self)))
+    for name, value in attributes.items():
+        object.__setattr__(self, name, value)
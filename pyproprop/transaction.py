@@ -0,0 +1,194 @@
+"""Transactional assignment of many processed properties at once.
+
+Setting related processed properties one at a time makes relational checks
+(`less_than`, `greater_than`, `at_least`, `at_most` and `equal_to`) depend on
+the order the properties are set in, and repeats comparisons as each partner
+property arrives. This module allows many processed properties of an instance
+to be updated together: the per-property checks are run for each value, then
+each relation touching an updated property is checked once against the final
+values. Either all values are stored or, if any check fails, none are.
+
+"""
+
+from contextlib import contextmanager
+
+from .processed_property import (
+    MISSING,
+    compare,
+    comparison_error_message,
+    get_processed_properties,
+    setter_state,
+)
+from .utils import format_for_output
+
+__all__ = ["transaction", "update"]
+
+
+def update(instance, **values):
+    """Validate and set many processed properties of an instance at once.
+
+    Parameters
+    ----------
+    instance : obj
+        Instance whose processed properties are to be set.
+    **values
+        Values keyed by the name of the processed property to set.
+
+    Raises
+    ------
+    AttributeError
+        If any name is not a processed property of the instance's class, or
+        if a read-only property has already been set.
+    TypeError
+        If any value fails a processed property's type checks.
+    ValueError
+        If any value fails a processed property's checks, or if the final
+        values fail any relational check between processed properties.
+
+    Example
+    -------
+    >>> update(bounds, lower=10, upper=20)
+
+    """
+    props = get_processed_properties(type(instance))
+    invalids = [name for name in values if name not in props]
+    if invalids:
+        msg = (
+            f"{format_for_output(invalids)} not processed properties of "
+            f"{repr(type(instance).__name__)}."
+        )
+        raise AttributeError(msg)
+    processed = {
+        name: props[name].validator(instance, value) for name, value in values.items()
+    }
+    if setter_state.level is None:
+        check_relations(instance, props, processed)
+    commit(instance, props, processed)
+
+
+@contextmanager
+def transaction(instance):
+    """Context manager deferring processed property assignments on an instance.
+
+    Values set on processed properties of the instance within the context are
+    not checked or stored immediately. When the context exits they are all
+    passed to :func:`update`, so either all are stored or none are. Until
+    then, getting a property returns its previously stored value. If an
+    exception is raised within the context the pending values are discarded.
+
+    Parameters
+    ----------
+    instance : obj
+        Instance whose processed property assignments are to be deferred.
+
+    Example
+    -------
+    >>> with transaction(bounds):
+    ...     bounds.upper = 20
+    ...     bounds.lower = 10
+
+    """
+    transactions = setter_state.transactions
+    if transactions is None:
+        transactions = setter_state.transactions = {}
+    key = id(instance)
+    if key in transactions:
+        # Nested transactions on the same instance are committed by the outer
+        yield
+        return
+    pending = transactions[key] = {}
+    setter_state.update_active()
+    try:
+        yield
+    finally:
+        del transactions[key]
+        setter_state.update_active()
+    update(instance, **pending)
+
+
+def stored_value(instance, prop):
+    """Currently stored value of a processed property, or `MISSING`."""
+    return getattr(instance, prop.storage_name, MISSING)
+
+
+def check_relations(instance, props, processed):
+    """Check each relation touching an updated property once.
+
+    Only the relations indexed against the updated properties (see
+    :class:`pyproprop.processed_property.Relations`) are checked.
+
+    Parameters
+    ----------
+    instance : obj
+        Instance whose processed properties are being updated.
+    props : dict
+        Processed properties of the instance's class keyed by name.
+    processed : dict
+        Processed values pending being stored keyed by name.
+
+    Raises
+    ------
+    ValueError
+        If any relation between the final values does not hold.
+
+    """
+    checked = set()
+    for name in processed:
+        relations = props[name].relations
+        touching = [(name, relation) for relation in relations.declared]
+        touching.extend(
+            (attr_name, relation)
+            for attr_name, declaring, relation in relations.reverse
+            if attr_name in props and props[attr_name].relations is declaring
+        )
+        for attr_name, relation in touching:
+            if (attr_name, relation) in checked:
+                continue
+            checked.add((attr_name, relation))
+            value = processed.get(attr_name, MISSING)
+            if value is MISSING:
+                value = stored_value(instance, props[attr_name])
+            other = relation.other
+            other_value = processed.get(other, MISSING)
+            if other_value is MISSING and other in props:
+                other_value = stored_value(instance, props[other])
+            if value is MISSING or other_value is MISSING:
+                continue
+            if not compare(relation.comparison_func, value, other_value):
+                msg = comparison_error_message(
+                    value,
+                    other_value,
+                    type(instance),
+                    other,
+                    relation.comparison_description,
+                    relation.comparison_func,
+                    relation.name,
+                    relation.description,
+                )
+                raise ValueError(msg)
+
+
+def store_value(instance, prop, value):
+    """Store an already processed value of a processed property."""
+    if prop.store is None:
+        setattr(instance, prop.storage_name, value)
+    else:
+        prop.store(instance, value)
+
+
+def commit(instance, props, processed):
+    """Store processed values, restoring previous values if storing fails."""
+    previous = {}
+    try:
+        for name, value in processed.items():
+            prop = props[name]
+            previous[name] = stored_value(instance, prop)
+            store_value(instance, prop, value)
+    except BaseException:
+        for name, value in previous.items():
+            prop = props[name]
+            if value is MISSING:
+                delattr(instance, prop.storage_name)
+            else:
+                store_value(instance, prop, value)
+        raise
@@ -145,3 +145,52 @@ def test_type_error_handles_with_unordered_options():
     )
     with pytest.raises(TypeError, match=expected_error_msg):
         _ = Options(set(options_tuple), handles=[ClassA, ClassB, ClassC])
+
+
+def test_options_indexed_for_membership():
+    options_tuple = (OPTION_1_KEYWORD, OPTION_2_KEYWORD, OPTION_3_KEYWORD)
+    options = Options(options_tuple, unsupported=OPTION_3_KEYWORD)
+    assert options.options_index == frozenset(options_tuple)
+    assert options.unsupported_index == frozenset((OPTION_3_KEYWORD,))
+
+
+def test_unhashable_options():
+    options_tuple = ([1, 2], [3, 4], [5, 6])
+    options = Options(options_tuple, default=[3, 4], unsupported=[[5, 6]])
+    assert options.options_index == options_tuple
+    assert options.default == [3, 4]
+    assert options.unsupported == [[5, 6]]
+    expected_error_msg = "is not a valid choice of default"
+    with pytest.raises(ValueError, match=expected_error_msg):
+        _ = Options(options_tuple, default=[7, 8])
+
+
+def test_dispatcher_cached_until_options_or_handles_change():
+    options_tuple = (OPTION_1_KEYWORD, OPTION_2_KEYWORD, OPTION_3_KEYWORD)
+    options = Options(options_tuple, handles=[ClassA, ClassB, ClassC])
+    dispatcher = options.dispatcher
+    assert options.dispatcher is dispatcher
+    with pytest.raises(TypeError):
+        dispatcher[OPTION_1_KEYWORD] = ClassB
+    options.handles = [ClassC, ClassB, ClassA]
+    assert options.dispatcher is not dispatcher
+    assert options.dispatcher[OPTION_1_KEYWORD] is ClassC
+    options.options = (OPTION_4_KEYWORD, OPTION_5_KEYWORD, OPTION_3_KEYWORD)
+    assert options.dispatcher == {
+        OPTION_4_KEYWORD: ClassC,
+        OPTION_5_KEYWORD: ClassB,
+        OPTION_3_KEYWORD: ClassA,
+    }
+
+
+def test_dispatch():
+    options_tuple = (OPTION_1_KEYWORD, OPTION_2_KEYWORD)
+    options = Options(options_tuple, handles=[lambda x: x + 1, lambda x, y=2: x * y])
+    assert options.dispatch(OPTION_1_KEYWORD, 1) == 2
+    assert options.dispatch(OPTION_2_KEYWORD, 3, y=3) == 9
+    expected_error_msg = re.escape(
+        "`'option_3'` does not have a handle. Please choose one of: "
+        "`'option_1'` or `'option_2'`."
+    )
+    with pytest.raises(ValueError, match=expected_error_msg):
+        options.dispatch(OPTION_3_KEYWORD)
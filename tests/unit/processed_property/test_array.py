@@ -0,0 +1,174 @@
+"""Tests for processed properties holding Numpy arrays."""
+
+import re
+
+import numpy as np
+import pytest
+
+from pyproprop import processed_property, register_cast, update
+from pyproprop.cast import DEFAULT_CAST_DISPATCHER
+
+
+class ClassWithArrayProperties:
+    """Dummy class with processed properties that hold arrays.
+
+    Attributes
+    ----------
+    bounded : :py:property:
+        Float elements with a minimum and maximum.
+    exclusive : :py:property:
+        Float elements with exclusive minimum and maximum.
+    cast_int : :py:property:
+        Int elements, cast if the dtype does not match.
+    lower : :py:property:
+        Array that must be elementwise less than `upper`.
+    upper : :py:property:
+        Array compared against.
+
+    """
+
+    bounded = processed_property(
+        "bounded", type=float, iterable_allowed=True, min=0, max=10
+    )
+    exclusive = processed_property(
+        "exclusive", type=float, iterable_allowed=True, min=0, max=10, exclusive=True
+    )
+    cast_int = processed_property(
+        "cast_int", type=int, iterable_allowed=True, cast=True
+    )
+    lower = processed_property("lower", type=np.ndarray, less_than="upper")
+    upper = processed_property("upper", type=np.ndarray)
+
+
+@pytest.fixture
+def test_fixture():
+    """Fixture for easy instantiation of class with array properties."""
+    return ClassWithArrayProperties()
+
+
+def test_valid_array_stored_without_copying_elements(test_fixture):
+    """Arrays with a matching dtype are stored as arrays."""
+    value = np.linspace(0, 10, 11)
+    test_fixture.bounded = value
+    assert isinstance(test_fixture.bounded, np.ndarray)
+    np.testing.assert_array_equal(test_fixture.bounded, value)
+
+
+def test_writable_array_copied(test_fixture):
+    """Changing a writable array after it is set does not change the value."""
+    value = np.arange(3.0)
+    test_fixture.bounded = value
+    value[0] = -100.0
+    np.testing.assert_array_equal(test_fixture.bounded, [0.0, 1.0, 2.0])
+    assert not test_fixture.bounded.flags.writeable
+    with pytest.raises(ValueError):
+        test_fixture.bounded[0] = -100.0
+
+
+def test_read_only_array_not_copied(test_fixture):
+    """Arrays that cannot be written to are stored without being copied."""
+    value = np.arange(3.0)
+    value.flags.writeable = False
+    test_fixture.bounded = value
+    assert np.shares_memory(test_fixture.bounded, value)
+    view = np.arange(3.0).view()
+    view.flags.writeable = False
+    test_fixture.bounded = view
+    assert not np.shares_memory(test_fixture.bounded, view)
+
+
+@pytest.mark.parametrize(
+    "name, value, expected_error_msg",
+    [
+        (
+            "bounded",
+            np.array([1.0, -1.0, -2.0]),
+            "`bounded` must be greater than or equal to `0`. `-1.0` at index "
+            "`1` is invalid.",
+        ),
+        (
+            "bounded",
+            np.array([[1.0, 2.0], [11.0, 3.0]]),
+            "`bounded` must be less than or equal to `10`. `11.0` at index "
+            "`(1, 0)` is invalid.",
+        ),
+        (
+            "exclusive",
+            np.array([0.0, 1.0]),
+            "`exclusive` must be greater than `0`. `0.0` at index `0` is invalid.",
+        ),
+        (
+            "exclusive",
+            np.array([1.0, 10.0]),
+            "`exclusive` must be less than `10`. `10.0` at index `1` is invalid.",
+        ),
+    ],
+)
+def test_array_bounds_report_first_invalid_index(
+    test_fixture, name, value, expected_error_msg
+):
+    """Bounds are checked elementwise and the first invalid index reported."""
+    with pytest.raises(ValueError, match=re.escape(expected_error_msg)):
+        setattr(test_fixture, name, value)
+
+
+def test_array_dtype_checked(test_fixture):
+    """Array dtypes are checked rather than each element's type."""
+    expected_error_msg = re.escape(
+        "`bounded` must be a <class 'float'>, instead got an array of dtype " "`int64`."
+    )
+    with pytest.raises(TypeError, match=expected_error_msg):
+        test_fixture.bounded = np.arange(3, dtype=np.int64)
+    test_fixture.bounded = np.arange(3, dtype=np.float32)
+
+
+def test_array_cast_to_dtype(test_fixture):
+    """Arrays are cast as a whole when their dtype does not match."""
+    test_fixture.cast_int = np.array([1.0, 2.0])
+    assert np.issubdtype(test_fixture.cast_int.dtype, np.integer)
+    np.testing.assert_array_equal(test_fixture.cast_int, [1, 2])
+    with pytest.raises(ValueError, match="cannot be cast"):
+        test_fixture.cast_int = np.array(["a", "b"])
+
+
+def test_string_array_cast_with_registered_cast():
+    """Arrays of strings are cast element by element like other iterables."""
+
+    class ClassWithBoolArray:
+        flags = processed_property(
+            "flags", type=bool, iterable_allowed=True, cast=True
+        )
+
+    instance = ClassWithBoolArray()
+    instance.flags = ["False", "0", "True"]
+    from_iterable = instance.flags
+    instance.flags = np.array(["False", "0", "True"])
+    np.testing.assert_array_equal(instance.flags, from_iterable)
+    np.testing.assert_array_equal(instance.flags, [False, False, True])
+    assert instance.flags.dtype == np.bool_
+
+
+def test_array_cast_uses_registered_cast(test_fixture):
+    """Casts registered for a type are used to cast arrays to it."""
+    register_cast(int, lambda value: int(round(float(value))))
+    try:
+        test_fixture.cast_int = np.array([1.6, 2.2])
+    finally:
+        register_cast(int, DEFAULT_CAST_DISPATCHER[int])
+    np.testing.assert_array_equal(test_fixture.cast_int, [2, 2])
+    test_fixture.cast_int = np.array([1.6, 2.2])
+    np.testing.assert_array_equal(test_fixture.cast_int, [1, 2])
+
+
+def test_array_comparison_reports_first_invalid_index(test_fixture):
+    """Relational checks between arrays report the first invalid index."""
+    test_fixture.upper = np.ones(3)
+    expected_error_msg = re.escape(
+        "`lower` with value `2.0` at index `1` must be less than `upper` with "
+        "value `1.0`."
+    )
+    with pytest.raises(ValueError, match=expected_error_msg):
+        test_fixture.lower = np.array([0.5, 2.0, 3.0])
+    with pytest.raises(ValueError, match=expected_error_msg):
+        update(test_fixture, lower=np.array([0.5, 2.0, 3.0]))
+    test_fixture.lower = np.zeros(3)
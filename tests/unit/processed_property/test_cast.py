@@ -7,6 +7,8 @@ circumstances including when the :py:meth:`__bool__` method does not return
 a boolean, or when the class is a weak reference.
 
 """
+from decimal import Decimal
+
 import numpy as np
 import pytest
 
@@ -46,3 +48,38 @@ def test_casting_to_numpy_array(test_fixture, test_input, expected):
     test_fixture.cast_prop = test_input
     assert type(test_fixture.cast_prop) == type(expected)
     assert np.array_equal(test_fixture.cast_prop, expected)
+
+
+class ClassWithCastProperties:
+    """Dummy class with properties casting to several types."""
+
+    int_prop = processed_property("int_prop", type=int, cast=True)
+    str_prop = processed_property("str_prop", type=str, cast=True)
+    decimal_prop = processed_property("decimal_prop", type=Decimal, cast=True)
+
+
+@pytest.mark.parametrize(
+    "name, test_input, expected",
+    [
+        ("int_prop", "42", 42),
+        ("str_prop", "not valid source", "not valid source"),
+        ("str_prop", [1, 2], "[1, 2]"),
+        ("decimal_prop", "0.1", Decimal("0.1")),
+    ],
+)
+def test_casting_values_with_non_source_repr(name, test_input, expected):
+    """Values are cast without being evaluated as Python source."""
+    instance = ClassWithCastProperties()
+    setattr(instance, name, test_input)
+    assert getattr(instance, name) == expected
+
+
+@pytest.mark.parametrize(
+    "name, test_input",
+    [("int_prop", "forty-two"), ("int_prop", None), ("decimal_prop", "abc")],
+)
+def test_failed_cast_raises_value_error(name, test_input):
+    """ValueError raised if the value cannot be cast."""
+    instance = ClassWithCastProperties()
+    with pytest.raises(ValueError, match="which cannot be cast"):
+        setattr(instance, name, test_input)
@@ -372,3 +372,109 @@ def test_invalid_equal_int_comparison_raises_error(compare_equal_int_fixture):
     )
     with pytest.raises(ValueError, match=expected_error_msg):
         test_fixture.some_prop_max = test_max_value
+
+
+class ClassWithDescribedComparisonProperties:
+    """Dummy class with described processed properties that are compared."""
+
+    upper = processed_property("upper", description="upper value", type=int)
+    lower = processed_property(
+        "lower", description="lower value", type=int, less_than="upper"
+    )
+
+
+def test_comparison_error_uses_class_metadata():
+    """Error messages use the other property's description from the class."""
+    test_fixture = ClassWithDescribedComparisonProperties()
+    test_fixture.upper = 1
+    expected_error_msg = re.escape(
+        "Lower value (`lower`) with value `2` must be less than upper value "
+        "(`upper`) with value `1`."
+    )
+    with pytest.raises(ValueError, match=expected_error_msg):
+        test_fixture.lower = 2
+
+
+def test_no_per_instance_metadata_stored():
+    """Setting a property stores only its value on the instance."""
+    test_fixture = ClassWithDescribedComparisonProperties()
+    test_fixture.upper = 2
+    test_fixture.lower = 1
+    assert vars(test_fixture) == {"_upper": 2, "_lower": 1}
+
+
+def test_setting_compared_property_checks_relation():
+    """Setting the property compared against also checks the relation."""
+    test_fixture = ClassWithDescribedComparisonProperties()
+    test_fixture.upper = 2
+    test_fixture.lower = 1
+    expected_error_msg = re.escape(
+        "Lower value (`lower`) with value `1` must be less than upper value "
+        "(`upper`) with value `0`."
+    )
+    with pytest.raises(ValueError, match=expected_error_msg):
+        test_fixture.upper = 0
+    assert test_fixture.upper == 2
+
+
+def test_compared_property_defined_first_or_last():
+    """Relations are indexed regardless of the order properties are defined."""
+
+    class LowerFirst:
+        lower = processed_property("lower", type=int, less_than="upper")
+        upper = processed_property("upper", type=int)
+
+    test_fixture = LowerFirst()
+    test_fixture.lower = 1
+    with pytest.raises(ValueError):
+        test_fixture.upper = 1
+    test_fixture.upper = 2
+
+
+class SubclassWithComparisonToBase(ClassWithDescribedComparisonProperties):
+    """Subclass declaring a relation with a base class's property."""
+
+    middle = processed_property("middle", type=int, at_most="upper")
+
+
+def test_subclass_relation_with_base_property():
+    """Relations declared in a subclass only apply to its instances."""
+    test_fixture = SubclassWithComparisonToBase()
+    test_fixture.upper = 5
+    test_fixture.middle = 5
+    with pytest.raises(ValueError, match="must be at most"):
+        test_fixture.upper = 4
+    base_fixture = ClassWithDescribedComparisonProperties()
+    base_fixture.upper = 4
+
+
+class SubclassOverridingDeclaringProperty(ClassWithDescribedComparisonProperties):
+    """Subclass overriding the declaring property without a relation."""
+
+    lower = processed_property("lower", type=int)
+
+
+def test_overridden_relation_not_checked():
+    test_fixture = SubclassOverridingDeclaringProperty()
+    test_fixture.lower = 5
+    test_fixture.upper = 1
+    assert test_fixture.upper == 1
+
+
+def test_many_related_properties():
+    """Each property is indexed with only the relations touching it."""
+    num_bounds = 100
+    namespace = {}
+    for i in range(num_bounds):
+        namespace[f"x{i}"] = processed_property(
+            f"x{i}", type=int, less_than=f"x{i + 1}" if i < num_bounds - 1 else None
+        )
+    ChainOfBounds = type("ChainOfBounds", (), namespace)
+    test_fixture = ChainOfBounds()
+    for i in range(num_bounds):
+        setattr(test_fixture, f"x{i}", i)
+    assert len(ChainOfBounds.x0.relations.reverse) == 0
+    assert len(ChainOfBounds.x50.relations.declared) == 1
+    assert len(ChainOfBounds.x50.relations.reverse) == 1
+    with pytest.raises(ValueError):
+        test_fixture.x50 = 48
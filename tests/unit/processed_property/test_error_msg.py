@@ -0,0 +1,73 @@
+"""Test error messages are only formatted when a check fails."""
+import re
+import sys
+
+import pytest
+
+from pyproprop import processed_property
+
+processed_property_module = sys.modules["pyproprop.processed_property"]
+
+
+class ClassWithCheckedProperties:
+    """Dummy class with processed properties with several checks enabled."""
+
+    upper = processed_property(
+        "upper",
+        description="upper value",
+        type=float,
+        cast=True,
+        min=0,
+        max=10,
+    )
+    lower = processed_property(
+        "lower",
+        description="lower value",
+        type=float,
+        cast=True,
+        less_than="upper",
+    )
+    choice = processed_property(
+        "choice",
+        options=("a", "b", "c"),
+        unsupported_options=("c",),
+    )
+    bounds = processed_property("bounds", optimisable=True)
+
+
+@pytest.fixture
+def no_message_formatting(monkeypatch):
+    """Make any formatting of error messages fail the test."""
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Error message formatted on success path.")
+
+    monkeypatch.setattr(processed_property_module, "format_for_output", fail)
+    monkeypatch.setattr(
+        processed_property_module, "generate_name_description_error_message", fail
+    )
+
+
+@pytest.mark.usefixtures("no_message_formatting")
+def test_no_message_formatting_on_success():
+    """Valid values are set without formatting any error messages."""
+    instance = ClassWithCheckedProperties()
+    instance.upper = 5
+    instance.lower = 1
+    instance.choice = "a"
+    instance.bounds = (1, 2)
+    assert instance.upper == 5.0
+    assert instance.lower == 1.0
+    assert instance.choice == "a"
+    assert instance.bounds == (1, 2)
+
+
+def test_precomputed_name_in_min_max_error_message():
+    """Sentence-start name fragments are still used in error messages."""
+    instance = ClassWithCheckedProperties()
+    expected_error_msg = re.escape(
+        "Upper value (`upper`) must be less than or equal to `10`. "
+        "`11.0` is invalid."
+    )
+    with pytest.raises(ValueError, match=expected_error_msg):
+        instance.upper = 11
@@ -1,6 +1,7 @@
 """Tests for processed properties that allow iterables.
 
 """
+import numpy as np
 import pytest
 
 from pyproprop import processed_property
@@ -46,3 +47,68 @@ def test_casting_with_iterable(test_fixture, test_input, expected):
     assert type(test_fixture.cast_prop) is tuple
     for val in test_fixture.cast_prop:
         assert type(val) is float
+
+
+@pytest.fixture
+def typed_fixture():
+    class ClassWithIterableAllowedTypedProperties:
+        """Dummy class for fixtures with property that checks floats
+
+        Attributes
+        ----------
+        typed_prop : processed_prop
+            Processed property that enforces floats without casting.
+
+        """
+
+        typed_prop = processed_property(
+            "typed_prop",
+            type=float,
+            iterable_allowed=True,
+        )
+
+    return ClassWithIterableAllowedTypedProperties()
+
+
+def test_valid_tuple_stored_as_is(typed_fixture):
+    """Tuples already of the expected type are not copied"""
+    test_input = (1.0, 2.0, 3.0)
+    typed_fixture.typed_prop = test_input
+    assert typed_fixture.typed_prop is test_input
+
+
+@pytest.mark.parametrize(
+    "test_input", [[1.0, 2.0], (val for val in (1.0, 2.0)), {1.0: 0, 2.0: 0}]
+)
+def test_valid_iterables_stored_as_tuple(typed_fixture, test_input):
+    """Other iterables of the expected type are stored as tuples"""
+    typed_fixture.typed_prop = test_input
+    assert typed_fixture.typed_prop == (1.0, 2.0)
+    assert type(typed_fixture.typed_prop) is tuple
+
+
+def test_invalid_element_raises(typed_fixture):
+    """Elements not of the expected type raise a TypeError"""
+    with pytest.raises(TypeError):
+        typed_fixture.typed_prop = (1.0, 2)
+
+
+def test_array_stored_as_read_only_array(typed_fixture):
+    """Arrays are stored read-only, only sharing memory with read-only input"""
+    test_input = np.array([1.0, 2.0])
+    typed_fixture.typed_prop = test_input
+    assert not np.shares_memory(typed_fixture.typed_prop, test_input)
+    with pytest.raises(ValueError):
+        typed_fixture.typed_prop[0] = -1.0
+    test_input[0] = -1.0
+    assert typed_fixture.typed_prop[0] == 1.0
+    test_input.flags.writeable = False
+    typed_fixture.typed_prop = test_input
+    assert np.shares_memory(typed_fixture.typed_prop, test_input)
+
+
+def test_cast_array_is_read_only(test_fixture):
+    """Arrays cast to the expected type are read-only"""
+    test_fixture.cast_prop = np.array([1, 2])
+    assert test_fixture.cast_prop.dtype == np.float64
+    assert not test_fixture.cast_prop.flags.writeable
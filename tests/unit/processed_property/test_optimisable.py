@@ -1,8 +1,10 @@
 """Test optimisable processed properties."""
 
+import numpy as np
 import pytest
 
-from pyproprop import processed_property
+from pyproprop import check_bounds_many, processed_property
+from pyproprop.processed_property import check_bounds
 
 
 class ClassWithOptimisableProperty:
@@ -35,3 +37,73 @@ def test_optimisable_property_has_is_optimisable_attr():
     """Optimisable processed property has `is_optimisable` attr."""
     assert hasattr(ClassWithOptimisableProperty.optimisable_prop, "is_optimisable")
     assert ClassWithOptimisableProperty.optimisable_prop.is_optimisable is True
+
+
+@pytest.mark.parametrize(
+    "bounds, expected",
+    [
+        ((1, 2), (1, 2)),
+        ((1.0, 1.0 + 1e-10), 1.0),
+        ((-(2**63), 2**63 - 1), (-(2**63), 2**63 - 1)),
+        ((np.int64(1), np.int64(2)), (1, 2)),
+    ],
+)
+def test_check_bounds(bounds, expected):
+    assert check_bounds(bounds) == expected
+
+
+@pytest.mark.parametrize(
+    "bounds",
+    [(2**63, 2**64), (-(2**63) - 1, 0), (0.0, 2.0**63), (float("inf"), 1.0)],
+)
+def test_check_bounds_overflow(bounds):
+    with pytest.raises(ValueError, match="signed 64-bit number"):
+        check_bounds(bounds)
+
+
+def test_check_bounds_does_not_use_numpy(monkeypatch):
+    """Python numbers are checked without converting them to arrays."""
+    monkeypatch.setattr(np, "asarray", None)
+    monkeypatch.setattr(np, "isclose", None)
+    assert check_bounds((1, 2.5)) == (1, 2.5)
+
+
+@pytest.mark.parametrize(
+    "bounds",
+    [
+        [[1, 2], [3, 3], [-5, 5]],
+        [[1.0, 2.0], [3.0, 3.0 + 1e-10], [-5.0, 5.0]],
+        np.array([[0, 1], [2, 2]], dtype=np.uint8),
+    ],
+)
+def test_check_bounds_many_matches_check_bounds(bounds):
+    expected = [check_bounds(pair) for pair in np.asarray(bounds).tolist()]
+    assert check_bounds_many(bounds) == expected
+
+
+def test_check_bounds_many_invalid_pair():
+    expected_error_msg = (
+        r"Lower bound \(3\) at index 0 must be less than upper bound \(2\) at "
+        r"index 1 for bounds at index 1\."
+    )
+    with pytest.raises(ValueError, match=expected_error_msg):
+        check_bounds_many([[0, 1], [3, 2]])
+
+
+@pytest.mark.parametrize(
+    "bounds",
+    [
+        [[0, 2**63]],
+        [[0.0, 2.0**63]],
+        [[float("nan"), 1.0]],
+        np.array([[0, 2**63]], dtype=np.uint64),
+    ],
+)
+def test_check_bounds_many_overflow(bounds):
+    with pytest.raises(ValueError, match="signed 64-bit number"):
+        check_bounds_many(bounds)
+
+
+def test_check_bounds_many_invalid_shape():
+    with pytest.raises(ValueError, match=r"must have shape \(N, 2\)"):
+        check_bounds_many([1, 2, 3])
@@ -18,7 +18,7 @@ import re
 
 import pytest
 
-from pyproprop import processed_property
+from pyproprop import Options, processed_property
 
 OPTION_1_KEYWORD = "option_1"
 OPTION_2_KEYWORD = "option_2"
@@ -248,3 +248,45 @@ def test_option_creation_from_dict_keys():
         self.option_from_dict_keys_prop = OPTION_1_KEYWORD
 
     _ = ClassWithMultipleOptionAllUnsupportedOptionProperties()
+
+
+def test_options_from_options_instance_with_many_options():
+    options = Options(range(1000), unsupported=(999,))
+
+    class ClassWithManyOptions:
+
+        many_option_prop = processed_property(
+            "many_option_prop",
+            type=int,
+            options=options,
+        )
+
+    instance = ClassWithManyOptions()
+    instance.many_option_prop = 500
+    assert instance.many_option_prop == 500
+    with pytest.raises(ValueError, match="not currently supported"):
+        instance.many_option_prop = 999
+    with pytest.raises(ValueError, match="not a valid option"):
+        instance.many_option_prop = 1000
+
+
+def test_unhashable_values_and_options():
+    class ClassWithUnhashableOptions:
+
+        hashable_option_prop = processed_property(
+            "hashable_option_prop",
+            options=(OPTION_1_KEYWORD, OPTION_2_KEYWORD),
+        )
+        unhashable_option_prop = processed_property(
+            "unhashable_option_prop",
+            options=([1, 2], [3, 4]),
+            unsupported_options=([3, 4],),
+        )
+
+    instance = ClassWithUnhashableOptions()
+    with pytest.raises(ValueError, match="not a valid option"):
+        instance.hashable_option_prop = [OPTION_1_KEYWORD]
+    instance.unhashable_option_prop = [1, 2]
+    assert instance.unhashable_option_prop == [1, 2]
+    with pytest.raises(ValueError, match="not currently supported"):
+        instance.unhashable_option_prop = [3, 4]
@@ -0,0 +1,97 @@
+"""Test processed properties stored in `__slots__`."""
+
+import re
+
+import pytest
+
+from pyproprop import processed_property, processed_property_slots
+
+
+class Base:
+    """Dummy base class for checking zero-argument `super()` calls."""
+
+    __slots__ = ("initialised",)
+
+    def __init__(self):
+        self.initialised = True
+
+
+@processed_property_slots
+class ClassWithSlottedProperties(Base):
+    """Dummy class with processed properties stored in slots.
+
+    Attributes
+    ----------
+    upper : :py:property:
+        Float property with a minimum value.
+    lower : :py:property:
+        Float property that must be less than `upper`.
+    once : :py:property:
+        Read-only property.
+
+    """
+
+    __slots__ = ("other",)
+
+    upper = processed_property("upper", type=float, cast=True, min=0)
+    lower = processed_property("lower", type=float, cast=True, less_than="upper")
+    once = processed_property("once", read_only=True)
+
+    def __init__(self, upper, lower):
+        super().__init__()
+        self.upper = upper
+        self.lower = lower
+
+
+@pytest.fixture
+def test_fixture():
+    """Fixture for easy instantiation of class with slotted properties."""
+    return ClassWithSlottedProperties(2, 1)
+
+
+def test_values_stored_in_slots(test_fixture):
+    """Processed property values are set and retrieved from slots."""
+    assert test_fixture.upper == 2.0
+    assert test_fixture.lower == 1.0
+    assert {"_upper", "_lower", "_once", "other"} <= set(
+        ClassWithSlottedProperties.__slots__
+    )
+    assert not hasattr(test_fixture, "__dict__")
+
+
+def test_undeclared_attribute_raises(test_fixture):
+    """Attributes not declared as slots cannot be set."""
+    test_fixture.other = 1
+    with pytest.raises(AttributeError):
+        test_fixture.undeclared = 1
+
+
+def test_zero_argument_super_calls_slotted_class(test_fixture):
+    """Methods using `super()` still work on the new slotted class."""
+    assert test_fixture.initialised is True
+
+
+def test_checks_still_applied(test_fixture):
+    """Processed property checks are applied to slotted properties."""
+    with pytest.raises(ValueError):
+        test_fixture.upper = -1
+    with pytest.raises(ValueError):
+        test_fixture.lower = 3
+
+
+def test_unset_property_raises_attribute_error():
+    """Getting a slotted property before it has been set raises."""
+    instance = ClassWithSlottedProperties(2, 1)
+    with pytest.raises(AttributeError):
+        _ = instance.once
+
+
+def test_read_only_slotted_property(test_fixture):
+    """Read-only slotted properties can only be set once."""
+    test_fixture.once = 1
+    expected_error_msg = re.escape(
+        "`once` is a read-only property and cannot be reset after "
+        "it has been initialised."
+    )
+    with pytest.raises(AttributeError, match=expected_error_msg):
+        test_fixture.once = 2
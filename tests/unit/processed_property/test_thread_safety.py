@@ -0,0 +1,84 @@
+"""Test processed property setters are safe to use from multiple threads."""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pyproprop import processed_property
+
+NUM_THREADS = 8
+NUM_SETS = 2000
+
+
+class ClassWithRelatedProperties:
+    """Dummy class with properties whose checks depend on the instance.
+
+    Attributes
+    ----------
+    upper : :py:property:
+        Upper value that `lower` is compared against.
+    lower : :py:property:
+        Lower value that must be less than `upper`.
+    once : :py:property:
+        Read-only property that can only be set once.
+
+    """
+
+    upper = processed_property("upper", type=int)
+    lower = processed_property("lower", type=int, less_than="upper")
+    once = processed_property("once", read_only=True)
+
+
+@pytest.fixture
+def short_switch_interval():
+    """Encourage frequent thread switches so races are more likely."""
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(switch_interval)
+
+
+def set_lower_repeatedly(offset):
+    """Set `lower` on an instance only valid relative to its own `upper`."""
+    instance = ClassWithRelatedProperties()
+    instance.upper = 10 * offset + 5
+    for i in range(NUM_SETS):
+        instance.lower = 10 * offset + i % 5
+    return instance.lower
+
+
+def set_read_only_once(offset):
+    """Set a read-only property once on each of many fresh instances."""
+    for _ in range(NUM_SETS):
+        instance = ClassWithRelatedProperties()
+        instance.once = offset
+    return instance.once
+
+
+@pytest.mark.usefixtures("short_switch_interval")
+def test_comparison_checked_against_own_instance():
+    """Relational checks in concurrent threads use the instance being set."""
+    with ThreadPoolExecutor(max_workers=NUM_THREADS) as executor:
+        results = list(executor.map(set_lower_repeatedly, range(NUM_THREADS)))
+    assert results == [
+        10 * offset + (NUM_SETS - 1) % 5 for offset in range(NUM_THREADS)
+    ]
+
+
+@pytest.mark.usefixtures("short_switch_interval")
+def test_read_only_checked_against_own_instance():
+    """Read-only checks in concurrent threads use the instance being set."""
+    with ThreadPoolExecutor(max_workers=NUM_THREADS) as executor:
+        results = list(executor.map(set_read_only_once, range(NUM_THREADS)))
+    assert results == list(range(NUM_THREADS))
+
+
+def test_setter_dispatcher_not_mutated_by_set():
+    """Setting a property does not write the instance in to shared state."""
+    instance = ClassWithRelatedProperties()
+    instance.upper = 2
+    instance.lower = 1
+    setter_dispatcher = ClassWithRelatedProperties.lower.setter_dispatcher
+    for _, kwargs in setter_dispatcher.values():
+        assert instance not in kwargs.values()
@@ -0,0 +1,107 @@
+"""Test skipping processed property checks in trusted mode."""
+import threading
+
+import pytest
+
+from pyproprop import processed_property, processed_property_trusted, trusted
+
+
+class ClassWithCheckedProperties:
+    """Dummy class with processed properties with checks and a post method.
+
+    Attributes
+    ----------
+    bounded : :py:property:
+        Float property with a minimum and an `abs` post method.
+    once : :py:property:
+        Read-only property.
+
+    """
+
+    bounded = processed_property("bounded", type=float, min=0, method=abs)
+    once = processed_property("once", read_only=True)
+
+
+@processed_property_trusted
+class ClassWithTrustedProperties:
+    """Dummy class opted in to skipping all processed property checks."""
+
+    bounded = processed_property("bounded", type=float, min=0, method=abs)
+
+
+@processed_property_trusted(level="keep_method")
+class ClassWithTrustedPropertiesKeepingMethod:
+    """Dummy class opted in to skipping checks but applying post methods."""
+
+    bounded = processed_property("bounded", type=float, min=0, method=abs)
+
+
+@pytest.fixture
+def test_fixture():
+    """Fixture for easy instantiation of class with checked properties."""
+    return ClassWithCheckedProperties()
+
+
+def test_checks_skipped_in_trusted_mode(test_fixture):
+    """Invalid values are stored unchecked within a trusted context."""
+    with trusted():
+        test_fixture.bounded = -1.0
+        test_fixture.once = 1
+        test_fixture.once = 2
+    assert test_fixture.bounded == -1
+    assert test_fixture.once == 2
+
+
+def test_method_applied_at_keep_method_level(test_fixture):
+    """Post methods are still applied at the `"keep_method"` level."""
+    with trusted("keep_method"):
+        test_fixture.bounded = -1.0
+    assert test_fixture.bounded == 1
+
+
+def test_checks_restored_after_trusted_mode(test_fixture):
+    """Checks are applied again once the trusted context exits."""
+    with trusted():
+        with trusted("keep_method"):
+            pass
+        test_fixture.bounded = -1.0
+    with pytest.raises(ValueError):
+        test_fixture.bounded = -1.0
+    with pytest.raises(TypeError):
+        test_fixture.bounded = "a"
+
+
+def test_trusted_mode_is_thread_local(test_fixture):
+    """Checks are still applied in other threads during a trusted context."""
+    errors = []
+
+    def set_invalid():
+        try:
+            ClassWithCheckedProperties().bounded = -1.0
+        except ValueError as error:
+            errors.append(error)
+
+    with trusted():
+        thread = threading.Thread(target=set_invalid)
+        thread.start()
+        thread.join()
+    assert len(errors) == 1
+
+
+def test_invalid_trust_level_raises():
+    """ValueError raised for an unsupported trust level."""
+    with pytest.raises(ValueError, match="not a valid trust level"):
+        with trusted("invalid"):
+            pass
+    with pytest.raises(ValueError, match="not a valid trust level"):
+        processed_property_trusted(level="invalid")
+
+
+def test_class_level_trusted_properties():
+    """Classes opted in to trust skip checks outside a trusted context."""
+    instance = ClassWithTrustedProperties()
+    instance.bounded = -1.0
+    assert instance.bounded == -1
+    instance = ClassWithTrustedPropertiesKeepingMethod()
+    instance.bounded = -1.0
+    assert instance.bounded == 1
@@ -0,0 +1,99 @@
+"""Tests for the registry of cast functions."""
+
+from decimal import Decimal
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from pyproprop import processed_property, register_cast
+from pyproprop.cast import CAST_DISPATCHER, cast_value
+
+
+class Celsius:
+    """Dummy type for registering a custom cast function."""
+
+    def __init__(self, degrees):
+        self.degrees = float(degrees)
+
+
+@pytest.fixture
+def registered_celsius_cast():
+    """Register a custom cast for :class:`Celsius` for a single test."""
+    register_cast(Celsius, lambda value: Celsius(str(value).rstrip("C")))
+    yield
+    del CAST_DISPATCHER[Celsius]
+
+
+@pytest.mark.parametrize(
+    "value, expected_type, expected",
+    [
+        ("3", int, 3),
+        ("3.0", int, 3),
+        ("3.5", int, 3),
+        ("1e3", int, 1000),
+        (2.7, int, 2),
+        ("1.5", float, 1.5),
+        (1.5, str, "1.5"),
+        ("abc def", str, "abc def"),
+        (1, bool, True),
+        ("True", bool, True),
+        ("false", bool, False),
+        ("False", bool, False),
+        ("0", bool, False),
+        (" 1 ", bool, True),
+        ("1+2j", complex, 1 + 2j),
+        ("0.1", Decimal, Decimal("0.1")),
+        ("1/3", Fraction, Fraction(1, 3)),
+        (1.5, np.float32, np.float32(1.5)),
+        (2, np.int64, np.int64(2)),
+    ],
+)
+def test_builtin_casts(value, expected_type, expected):
+    """Built-in casts do not depend on the value's repr being valid source."""
+    cast = cast_value(value, expected_type)
+    assert type(cast) is expected_type
+    assert cast == expected
+
+
+def test_unregistered_type_falls_back_to_type():
+    """Types without a registered cast are called directly."""
+    cast = cast_value(5, Celsius)
+    assert isinstance(cast, Celsius)
+    assert cast.degrees == 5.0
+
+
+@pytest.mark.usefixtures("registered_celsius_cast")
+def test_registered_cast_used():
+    """User-registered casts are used in place of calling the type."""
+    cast = cast_value("21C", Celsius)
+    assert cast.degrees == 21.0
+
+
+def test_register_cast_error_handling():
+    """Casts can only be registered for types with a callable."""
+    with pytest.raises(TypeError):
+        register_cast("not a type", float)
+    with pytest.raises(TypeError):
+        register_cast(Celsius, "not callable")
+
+
+def test_bool_cast_parses_strings():
+    """Strings are parsed when cast to bool rather than tested for truthiness."""
+
+    class Flag:
+        enabled = processed_property("enabled", type=bool, cast=True)
+
+    flag = Flag()
+    flag.enabled = "False"
+    assert flag.enabled is False
+    flag.enabled = "1"
+    assert flag.enabled is True
+    with pytest.raises(ValueError, match="cannot be cast"):
+        flag.enabled = "maybe"
+
+
+def test_int_cast_invalid_string():
+    """Strings that are not numbers cannot be cast to int."""
+    with pytest.raises(ValueError):
+        cast_value("abc", int)
@@ -0,0 +1,126 @@
+"""Tests for columnar storage of many records of a processed property class."""
+
+import numpy as np
+import pytest
+
+from pyproprop import ProcessedPropertyArray, processed_property
+
+
+class Point:
+    """Dummy class with numeric, options and object processed properties."""
+
+    lower = processed_property("lower", type=float, cast=True, min=0)
+    upper = processed_property("upper", type=float, greater_than="lower")
+    mode = processed_property("mode", options=("fast", "slow"), str_format="lower")
+    label = processed_property("label", type=str)
+
+
+@pytest.fixture
+def records():
+    records = ProcessedPropertyArray(Point)
+    records.extend(
+        lower=[0, 1, 2],
+        upper=[1.0, 2.0, 3.0],
+        mode=["Fast", "slow", "fast"],
+        label=["a", "b", "c"],
+    )
+    return records
+
+
+def test_column_kinds():
+    records = ProcessedPropertyArray(Point)
+    assert records.columns == ("lower", "upper", "mode", "label")
+    assert records.column_kind("lower") == "numeric"
+    assert records.column_kind("upper") == "numeric"
+    assert records.column_kind("mode") == "options"
+    assert records.column_kind("label") == "object"
+
+
+def test_extend_and_getitem(records):
+    assert len(records) == 3
+    np.testing.assert_array_equal(records["lower"], [0.0, 1.0, 2.0])
+    assert records["lower"].dtype == np.float64
+    assert records["mode"].tolist() == ["fast", "slow", "fast"]
+    assert records["label"].tolist() == ["a", "b", "c"]
+    np.testing.assert_array_equal(records.codes("mode"), [0, 1, 0])
+    assert records.categories("mode") == ("fast", "slow")
+    with pytest.raises(ValueError):
+        records["lower"][0] = 10.0
+
+
+def test_append_grows_columns(records):
+    for i in range(20):
+        records.append(lower=3 + i, upper=4.0 + i, mode="slow", label="d")
+    assert len(records) == 23
+    assert records["lower"][-1] == 22.0
+
+
+@pytest.mark.parametrize(
+    "values, error, match",
+    [
+        ({"lower": [-1]}, ValueError, "greater than or equal to"),
+        ({"upper": [1]}, TypeError, "must be a"),
+        ({"upper": [0.5]}, ValueError, "must be greater than `lower`"),
+        ({"mode": ["medium"]}, ValueError, "not a valid option"),
+        ({"label": [1]}, TypeError, "must be a"),
+    ],
+)
+def test_extend_invalid_adds_nothing(records, values, error, match):
+    new = {"lower": [1], "upper": [2.0], "mode": ["fast"], "label": ["d"]}
+    new.update(values)
+    with pytest.raises(error, match=match):
+        records.extend(**new)
+    assert len(records) == 3
+
+
+def test_extend_invalid_names(records):
+    with pytest.raises(AttributeError, match="not processed properties"):
+        records.extend(lower=[1], upper=[2.0], mode=["fast"], label=["d"], x=[1])
+    with pytest.raises(ValueError, match="must be given for"):
+        records.extend(lower=[1], upper=[2.0], mode=["fast"])
+    with pytest.raises(ValueError, match="same number of values"):
+        records.extend(lower=[1, 2], upper=[2.0], mode=["fast"], label=["d"])
+
+
+class Counter:
+    """Dummy class with an integer processed property."""
+
+    count = processed_property("count", type=int, min=0)
+
+
+def test_extend_empty():
+    records = ProcessedPropertyArray(Counter)
+    records.extend(count=[])
+    assert len(records) == 0
+    assert records["count"].dtype == np.int64
+
+
+def test_int_column_accepts_bool():
+    records = ProcessedPropertyArray(Counter)
+    records.extend(count=[True, False])
+    records.extend(count=np.array([True]))
+    records.append(count=True)
+    np.testing.assert_array_equal(records["count"], [1, 0, 1, 1])
+    assert records["count"].dtype == np.int64
+
+
+def test_setitem(records):
+    records["upper"] = [5.0, 6.0, 7.0]
+    np.testing.assert_array_equal(records["upper"], [5.0, 6.0, 7.0])
+    with pytest.raises(ValueError, match="at index `1`"):
+        records["lower"] = [1, 10, 2]
+    np.testing.assert_array_equal(records["lower"], [0.0, 1.0, 2.0])
+    with pytest.raises(ValueError, match="must be assigned 3 values"):
+        records["upper"] = [1.0]
+
+
+def test_row(records):
+    point = records.row(-1)
+    assert isinstance(point, Point)
+    assert point.lower == 2.0
+    assert type(point.lower) is float
+    assert point.upper == 3.0
+    assert point.mode == "fast"
+    assert point.label == "c"
+    with pytest.raises(IndexError):
+        records.row(3)
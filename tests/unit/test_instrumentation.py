@@ -0,0 +1,146 @@
+"""Tests for instrumentation of processed property setters."""
+
+import io
+import json
+
+import pytest
+
+from pyproprop import (
+    disable_instrumentation,
+    enable_instrumentation,
+    export_instrumentation,
+    instrumentation_snapshot,
+    instrumented,
+    processed_property,
+    processed_property_slots,
+    reset_instrumentation,
+    transaction,
+    trusted,
+)
+
+CLASS_NAME = f"{__name__}.ClassWithInstrumentedProperties"
+
+
+class ClassWithInstrumentedProperties:
+    """Dummy class with processed properties to be instrumented."""
+
+    x = processed_property("x", type=float, cast=True, min=0)
+    y = processed_property("y", type=int, less_than="x", method=abs)
+
+    def __init__(self):
+        self.x = 10.0
+        self.y = 1
+
+
+@processed_property_slots
+class SlotsClassWithInstrumentedProperties:
+    """Dummy class with slots-stored processed properties."""
+
+    x = processed_property("x", type=float, cast=True)
+
+
+@pytest.fixture
+def instance():
+    """Instance created before instrumentation is enabled."""
+    instance = ClassWithInstrumentedProperties()
+    reset_instrumentation()
+    yield instance
+    disable_instrumentation()
+    reset_instrumentation()
+
+
+def test_not_recorded_when_disabled(instance):
+    instance.x = 5.0
+    assert instrumentation_snapshot() == {}
+
+
+def test_sets_and_step_times_recorded(instance):
+    with instrumented():
+        instance.x = 5.0
+        instance.x = "6"
+        instance.y = -1
+    x_stats = instrumentation_snapshot()[CLASS_NAME]["x"]
+    y_stats = instrumentation_snapshot()[CLASS_NAME]["y"]
+    assert x_stats["sets"] == 2
+    assert x_stats["failures"] == {}
+    assert list(x_stats["step_times"]) == ["type", "min", "reverse_relations"]
+    assert list(y_stats["step_times"]) == ["type", "less_than", "method"]
+    assert all(step_time >= 0 for step_time in x_stats["step_times"].values())
+    assert instance.x == 6.0
+    assert instance.y == 1
+
+
+def test_failures_recorded_by_exception_type(instance):
+    enable_instrumentation()
+    with pytest.raises(ValueError):
+        instance.x = "a"
+    with pytest.raises(ValueError):
+        instance.x = -1.0
+    with pytest.raises(TypeError):
+        instance.y = 1.0
+    snapshot = instrumentation_snapshot()
+    assert snapshot[CLASS_NAME]["x"]["failures"] == {"ValueError": 2}
+    assert snapshot[CLASS_NAME]["y"]["failures"] == {"TypeError": 1}
+    assert instance.x == 10.0
+
+
+def test_failing_checks_timed(instance):
+    with instrumented():
+        with pytest.raises(ValueError):
+            instance.y = 20
+        with pytest.raises(ValueError):
+            instance.x = 0.5
+    snapshot = instrumentation_snapshot()[CLASS_NAME]
+    assert snapshot["y"]["step_times"]["less_than"] > 0
+    assert snapshot["y"]["step_times"]["method"] == 0
+    assert snapshot["x"]["step_times"]["reverse_relations"] > 0
+
+
+def test_trusted_and_transaction_sets(instance):
+    with instrumented():
+        with trusted():
+            instance.x = -1.0
+        with transaction(instance):
+            instance.x = 5.0
+    assert instrumentation_snapshot()[CLASS_NAME]["x"]["sets"] == 1
+    assert instance.x == 5.0
+
+
+def test_slots_recorded():
+    instance = SlotsClassWithInstrumentedProperties()
+    with instrumented(reset=True):
+        instance.x = 1
+    cls_name = f"{__name__}.SlotsClassWithInstrumentedProperties"
+    assert instrumentation_snapshot()[cls_name]["x"]["sets"] == 1
+    reset_instrumentation()
+
+
+def test_instrumented_restores_disabled(instance):
+    with instrumented():
+        pass
+    instance.x = 5.0
+    assert instrumentation_snapshot() == {}
+
+
+@pytest.mark.parametrize("export_format", ["json", "text"])
+def test_export(instance, export_format, tmp_path):
+    with instrumented():
+        instance.x = 5.0
+    path = tmp_path / f"instrumentation.{export_format}"
+    export_instrumentation(path, format=export_format)
+    output = path.read_text()
+    if export_format == "json":
+        assert json.loads(output) == instrumentation_snapshot()
+    else:
+        assert output.startswith(f"{CLASS_NAME}\n  x: 1 sets, 0 failures\n")
+
+
+def test_export_to_file_object(instance):
+    file = io.StringIO()
+    export_instrumentation(file)
+    assert json.loads(file.getvalue()) == {}
+
+
+def test_export_invalid_format():
+    with pytest.raises(ValueError, match="not a valid export format"):
+        export_instrumentation(io.StringIO(), format="xml")
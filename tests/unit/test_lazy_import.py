@@ -0,0 +1,25 @@
+"""Tests for deferred importing of heavy dependencies."""
+
+import subprocess
+import sys
+
+import pytest
+
+from pyproprop.lazy_import import LazyModule
+
+
+@pytest.mark.parametrize("module_name", ["numpy", "sympy", "titlecase"])
+def test_import_does_not_import_heavy_dependency(module_name):
+    statement = f"import sys, pyproprop; assert {repr(module_name)} not in sys.modules"
+    subprocess.run([sys.executable, "-c", statement], check=True)
+
+
+def test_lazy_module_imports_on_attribute_access():
+    lazy_json = LazyModule("json")
+    assert lazy_json.dumps([1]) == "[1]"
+    assert "dumps" in vars(lazy_json)
+
+
+def test_lazy_module_missing_attribute():
+    with pytest.raises(AttributeError):
+        LazyModule("json").not_an_attribute
@@ -0,0 +1,99 @@
+"""Tests for streaming construction of many instances from rows."""
+
+import io
+
+import pytest
+
+from pyproprop import load_csv, load_many, processed_property
+
+
+class Bounds:
+    """Dummy class with related processed properties."""
+
+    lower = processed_property("lower", type=float, cast=True)
+    upper = processed_property("upper", type=float, cast=True, at_least="lower")
+    label = processed_property("label", type=str, optional=True, default="none")
+
+
+def test_load_mappings_and_sequences():
+    rows = [{"lower": 0, "upper": 1}, (1, 2, "b")]
+    first, second = load_many(Bounds, rows)
+    assert isinstance(first, Bounds)
+    assert (first.lower, first.upper) == (0.0, 1.0)
+    assert not hasattr(first, "_label")
+    assert (second.lower, second.upper, second.label) == (1.0, 2.0, "b")
+
+
+def test_load_fields():
+    (bounds,) = load_many(Bounds, [(2, 1)], fields=("upper", "lower"))
+    assert (bounds.lower, bounds.upper) == (1.0, 2.0)
+
+
+def test_load_is_lazy():
+    read = []
+
+    def rows():
+        for i in range(10):
+            read.append(i)
+            yield (i, i + 1, "x")
+
+    loaded = load_many(Bounds, rows(), chunk_size=4)
+    assert read == []
+    next(loaded)
+    assert read == [0, 1, 2, 3]
+
+
+def test_load_errors_reported():
+    errors = []
+    rows = [(0, 1, "a"), (2, 1, "b"), ("x", 1, "c"), (0, 1), {"x": 1}, (3, 4, "d")]
+    loaded = list(
+        load_many(Bounds, rows, on_error=lambda *error: errors.append(error))
+    )
+    assert [bounds.label for bounds in loaded] == ["a", "d"]
+    assert [index for index, _, _ in errors] == [1, 2, 3, 4]
+    assert [type(error) for _, _, error in errors] == [
+        ValueError,
+        ValueError,
+        ValueError,
+        AttributeError,
+    ]
+    assert errors[0][1] == (2, 1, "b")
+
+
+def test_load_errors_raised():
+    loaded = load_many(Bounds, [(0, 1, "a"), (2, 1, "b")])
+    next(loaded)
+    with pytest.raises(ValueError, match="must be at least `lower`"):
+        next(loaded)
+
+
+def test_load_invalid_arguments():
+    with pytest.raises(AttributeError, match="not processed properties"):
+        load_many(Bounds, [], fields=("lower", "x"))
+    with pytest.raises(ValueError, match="positive integer"):
+        load_many(Bounds, [], chunk_size=0)
+
+
+def test_load_csv(tmp_path):
+    text = "lower,upper,label\n0,1.5,a\n2,1,b\n3,4,\n"
+    errors = []
+    loaded = list(
+        load_csv(Bounds, io.StringIO(text), on_error=lambda *e: errors.append(e))
+    )
+    assert [(b.lower, b.upper, b.label) for b in loaded] == [
+        (0.0, 1.5, "a"),
+        (3.0, 4.0, "none"),
+    ]
+    assert errors[0][:2] == (1, {"lower": "2", "upper": "1", "label": "b"})
+    path = tmp_path / "bounds.csv"
+    path.write_text(text.replace(",", ";"))
+    loaded = load_csv(Bounds, path, delimiter=";", on_error=lambda *e: None)
+    assert len(list(loaded)) == 2
+
+
+def test_load_csv_int_columns():
+    class Counter:
+        count = processed_property("count", type=int, cast=True)
+
+    text = "count\n3\n3.0\n"
+    assert [c.count for c in load_csv(Counter, io.StringIO(text))] == [3, 3]
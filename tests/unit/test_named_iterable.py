@@ -8,6 +8,8 @@ import pytest
 from hypothesis import assume, given
 
 from pyproprop import named_iterable
+from pyproprop import clear_sympify_cache
+from pyproprop.named_iterable import cached_sympify, named_tuple_class
 
 
 @pytest.mark.usefixtures("_named_iterable_fixture")
@@ -93,3 +95,46 @@ def test_invalid_identifiers(keys, values):
     """Invalid identifiers raise ValueError."""
     with pytest.raises(ValueError):
         _ = named_iterable(dict(zip(keys, values)))
+
+
+def test_named_tuple_class_reused_for_same_keys():
+    named_tuple_class.cache_clear()
+    first = named_iterable([1, 2], named_keys=["x", "y"])
+    second = named_iterable({"x": 3, "y": 4})
+    assert type(first) is type(second)
+    assert second == (3, 4)
+    cache_info = named_tuple_class.cache_info()
+    assert cache_info.hits == 1
+    assert cache_info.misses == 1
+
+
+def test_named_tuple_class_different_keys():
+    first = named_iterable([1, 2], named_keys=["x", "y"])
+    second = named_iterable([1, 2], named_keys=["x", "z"])
+    assert type(first) is not type(second)
+    assert second.z == 2
+
+
+def test_sympify_reuses_sympified_entries():
+    clear_sympify_cache()
+    first = named_iterable(["x", "x + y"], named_keys=["x", "z"], sympify=True)
+    second = named_iterable(["x", "x + y"], named_keys=["x", "z"], sympify=True)
+    assert first.x is second.x
+    assert first.z is second.z
+    cache_info = cached_sympify.cache_info()
+    assert cache_info.hits == 2
+    assert cache_info.misses == 2
+
+
+def test_sympify_cache_distinguishes_types():
+    clear_sympify_cache()
+    ints = named_iterable([1], use_named=False, sympify=True)
+    floats = named_iterable([1.0], use_named=False, sympify=True)
+    assert ints[0].is_Integer
+    assert floats[0].is_Float
+
+
+def test_clear_sympify_cache():
+    named_iterable(["x"], sympify=True)
+    clear_sympify_cache()
+    assert cached_sympify.cache_info().currsize == 0
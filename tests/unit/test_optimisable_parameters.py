@@ -0,0 +1,99 @@
+"""Tests for collecting the free optimisable parameters of instances."""
+
+import numpy as np
+import pytest
+
+from pyproprop import (
+    OptimisableParameters,
+    processed_property,
+    processed_property_slots,
+)
+
+
+class Phase:
+    """Dummy class with several optimisable processed properties."""
+
+    initial_time = processed_property("initial_time", optimisable=True)
+    final_time = processed_property("final_time", optimisable=True)
+    name = processed_property("name", type=str)
+    mass = processed_property("mass", optimisable=True)
+    span = processed_property("span", type=tuple, len=2)
+
+    def __init__(self, initial_time, final_time, mass):
+        self.initial_time = initial_time
+        self.final_time = final_time
+        self.name = "phase"
+        self.mass = mass
+        self.span = (0, 1)
+
+
+@processed_property_slots
+class SlotsPhase:
+    """Dummy class storing an optimisable processed property in slots."""
+
+    duration = processed_property("duration", optimisable=True)
+
+    def __init__(self, duration):
+        self.duration = duration
+
+
+@pytest.fixture
+def phases():
+    return Phase(0, (1, 10), (-2.0, 3.0)), Phase((0, 5), 20, 1.0)
+
+
+def test_bounds_vectors(phases):
+    parameters = OptimisableParameters(*phases)
+    assert len(parameters) == 3
+    np.testing.assert_array_equal(parameters.lower, [1.0, -2.0, 0.0])
+    np.testing.assert_array_equal(parameters.upper, [10.0, 3.0, 5.0])
+    assert parameters.parameters == (
+        (phases[0], "final_time"),
+        (phases[0], "mass"),
+        (phases[1], "initial_time"),
+    )
+
+
+def test_non_optimisable_tuple_not_collected(phases):
+    parameters = OptimisableParameters(*phases)
+    assert all(attr_name != "span" for _, attr_name in parameters.parameters)
+    parameters.set_solution(parameters.lower)
+    assert phases[0].span == (0, 1)
+
+
+def test_index(phases):
+    parameters = OptimisableParameters(*phases)
+    assert parameters.index(phases[0], "mass") == 1
+    assert parameters.index(phases[1], "initial_time") == 2
+    with pytest.raises(KeyError, match="not a free optimisable parameter"):
+        parameters.index(phases[1], "final_time")
+
+
+def test_set_solution(phases):
+    parameters = OptimisableParameters(*phases)
+    parameters.set_solution([2.0, -1.0, 3.0])
+    assert phases[0].final_time == 2.0
+    assert phases[0].mass == -1.0
+    assert phases[1].initial_time == 3.0
+    assert len(OptimisableParameters(*phases)) == 0
+
+
+def test_set_solution_outside_bounds(phases):
+    parameters = OptimisableParameters(*phases)
+    with pytest.raises(ValueError, match="must lie within its bounds"):
+        parameters.set_solution([2.0, 4.0, 3.0])
+    assert phases[0].final_time == (1, 10)
+
+
+def test_set_solution_wrong_shape(phases):
+    parameters = OptimisableParameters(*phases)
+    with pytest.raises(ValueError, match=r"must have shape \(3,\)"):
+        parameters.set_solution([1.0, 2.0])
+
+
+def test_slots():
+    instance = SlotsPhase((0.5, 1.5))
+    parameters = OptimisableParameters(instance)
+    np.testing.assert_array_equal(parameters.lower, [0.5])
+    parameters.set_solution([1.0])
+    assert instance.duration == 1.0
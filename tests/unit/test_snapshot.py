@@ -0,0 +1,120 @@
+"""Tests for snapshots and pickling of processed property values."""
+
+import pickle
+import sys
+
+import numpy as np
+import pytest
+
+from pyproprop import (
+    UNSET,
+    processed_property,
+    processed_property_picklable,
+    processed_property_slots,
+    restore,
+    snapshot,
+)
+
+
+@processed_property_picklable
+class Solver:
+    """Dummy picklable class with processed properties and other attributes."""
+
+    tolerance = processed_property("tolerance", type=float, min=0, max=1)
+    method = processed_property("method", type=str, str_format="lower")
+    weights = processed_property("weights", type=float, iterable_allowed=True)
+    matrix = processed_property("matrix", type=np.ndarray, optional=True)
+
+    def __init__(self, tolerance, method):
+        self.tolerance = tolerance
+        self.method = method
+        self.iterations = 0
+
+
+@processed_property_picklable
+@processed_property_slots
+class SlotsSolver:
+    """Dummy picklable class storing processed properties in slots."""
+
+    __slots__ = ("iterations",)
+
+    tolerance = processed_property("tolerance", type=float, min=0, max=1)
+
+    def __init__(self, tolerance):
+        self.tolerance = tolerance
+        self.iterations = 0
+
+
+def test_snapshot_restore():
+    solver = Solver(0.1, "Newton")
+    state = snapshot(solver)
+    assert state == (0.1, "newton", UNSET, UNSET)
+    solver.tolerance = 0.5
+    solver.weights = np.ones(2)
+    restore(solver, state)
+    assert solver.tolerance == 0.1
+    assert not hasattr(solver, "_weights")
+
+
+def test_restore_does_not_check():
+    solver = Solver(0.1, "newton")
+    restore(solver, (2.0, "Newton", UNSET, UNSET))
+    assert solver.tolerance == 2.0
+    assert solver.method == "Newton"
+
+
+def test_restore_invalid_length():
+    with pytest.raises(ValueError, match="must have 4 values"):
+        restore(Solver(0.1, "newton"), (0.1,))
+
+
+@pytest.mark.parametrize("protocol", [2, pickle.HIGHEST_PROTOCOL])
+def test_pickle(protocol):
+    solver = Solver(0.1, "newton")
+    solver.iterations = 3
+    unpickled = pickle.loads(pickle.dumps(solver, protocol=protocol))
+    assert snapshot(unpickled) == (0.1, "newton", UNSET, UNSET)
+    assert unpickled.iterations == 3
+    slots_solver = SlotsSolver(0.2)
+    slots_solver.iterations = 4
+    unpickled = pickle.loads(pickle.dumps(slots_solver, protocol=protocol))
+    assert unpickled.tolerance == 0.2
+    assert unpickled.iterations == 4
+    assert not hasattr(unpickled, "__dict__")
+
+
+requires_protocol_5 = pytest.mark.skipif(
+    sys.version_info < (3, 8), reason="Pickle protocol 5 requires Python 3.8"
+)
+
+
+@requires_protocol_5
+def test_pickle_out_of_band_buffers():
+    solver = Solver(0.1, "newton")
+    solver.weights = np.arange(1000, dtype=float)
+    buffers = []
+    data = pickle.dumps(solver, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 1
+    assert len(data) < solver.weights.nbytes
+    unpickled = pickle.loads(data, buffers=buffers)
+    np.testing.assert_array_equal(unpickled.weights, solver.weights)
+    assert not unpickled.weights.flags.writeable
+
+
+@requires_protocol_5
+def test_pickle_in_band_arrays_read_only():
+    solver = Solver(0.1, "newton")
+    solver.weights = np.arange(3, dtype=float)
+    unpickled = pickle.loads(pickle.dumps(solver, protocol=5))
+    np.testing.assert_array_equal(unpickled.weights, [0.0, 1.0, 2.0])
+    assert not unpickled.weights.flags.writeable
+
+
+@requires_protocol_5
+def test_writeable_arrays_stay_writeable():
+    solver = Solver(0.1, "newton")
+    solver.matrix = np.zeros(3)
+    restore(solver, snapshot(solver))
+    assert solver.matrix.flags.writeable
+    unpickled = pickle.loads(pickle.dumps(solver, protocol=5))
+    assert unpickled.matrix.flags.writeable
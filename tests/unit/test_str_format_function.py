@@ -50,7 +50,11 @@ EXAMPLE_STR_5_FORMATTED : :py:obj:`dict`
 
 import pytest
 
-from pyproprop import format_str_case
+from pyproprop import format_str_case, format_str_case_many
+from pyproprop.format_str_case import (
+    SUPPORTED_STR_FORMAT_OPTIONS,
+    cached_format_str_case,
+)
 
 # TODO - make example strings fixtures using pytes-cases (see issue #36)
 LOWER_KEYWORD = "lower"
@@ -158,3 +162,48 @@ def test_formatted_string_method_expected_result_with_processing(input_str, expe
         format_str_case(input_str, case=HYPHEN_KEYWORD, process=True)
         == expected[HYPHEN_KEYWORD]
     )
+
+
+@pytest.mark.parametrize("case", sorted(SUPPORTED_STR_FORMAT_OPTIONS, key=str))
+@pytest.mark.parametrize("process", [False, True])
+def test_cached_formatting_matches_uncached(case, process):
+    """Cached results are the same as formatting afresh."""
+    for input_str in (EXAMPLE_STR_1, EXAMPLE_STR_3, EXAMPLE_STR_5):
+        expected = format_str_case(input_str, case, process=process)
+        for _ in range(2):
+            assert format_str_case(input_str, case, process, cache=True) == expected
+
+
+def test_cached_formatting_reuses_result():
+    cached_format_str_case.cache_clear()
+    format_str_case(EXAMPLE_STR_1, SNAKE_KEYWORD, cache=True)
+    format_str_case(EXAMPLE_STR_1, SNAKE_KEYWORD, cache=True)
+    format_str_case(EXAMPLE_STR_1, SNAKE_KEYWORD, process=True, cache=True)
+    cache_info = cached_format_str_case.cache_info()
+    assert cache_info.hits == 1
+    assert cache_info.misses == 2
+
+
+@pytest.mark.parametrize("case", [LOWER_KEYWORD, SNAKE_KEYWORD, HYPHEN_KEYWORD])
+@pytest.mark.parametrize("process", [False, True])
+@pytest.mark.parametrize("deduplicate", [False, True])
+def test_format_str_case_many_matches_format_str_case(case, process, deduplicate):
+    input_strs = [EXAMPLE_STR_1, EXAMPLE_STR_4, EXAMPLE_STR_1, EXAMPLE_STR_5]
+    expected = [format_str_case(item, case, process) for item in input_strs]
+    formatted = format_str_case_many(
+        input_strs, case, process=process, deduplicate=deduplicate
+    )
+    assert formatted == expected
+
+
+def test_format_str_case_many_lazy():
+    input_strs = iter([EXAMPLE_STR_1, EXAMPLE_STR_2])
+    formatted = format_str_case_many(input_strs, UPPER_KEYWORD, lazy=True)
+    assert not isinstance(formatted, list)
+    assert next(formatted) == EXAMPLE_STR_1_FORMATTED[UPPER_KEYWORD]
+    assert list(formatted) == [EXAMPLE_STR_2.upper()]
+
+
+def test_format_str_case_many_invalid_case():
+    with pytest.raises(KeyError):
+        format_str_case_many([EXAMPLE_STR_1], "invalid")
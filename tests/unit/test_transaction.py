@@ -0,0 +1,128 @@
+"""Tests for transactional assignment of processed properties."""
+
+import re
+
+import pytest
+
+from pyproprop import processed_property, transaction, trusted, update
+
+
+class ClassWithRelatedProperties:
+    """Dummy class with processed properties related to one another.
+
+    Attributes
+    ----------
+    lower : :py:property:
+        Int property that must be less than `upper`.
+    upper : :py:property:
+        Int property with a maximum value.
+    once : :py:property:
+        Read-only property.
+
+    """
+
+    lower = processed_property("lower", type=int, less_than="upper")
+    upper = processed_property("upper", type=int, max=100)
+    once = processed_property("once", read_only=True)
+
+    def __init__(self, lower, upper):
+        self.upper = upper
+        self.lower = lower
+
+
+@pytest.fixture
+def test_fixture():
+    """Fixture for easy instantiation of class with related properties."""
+    return ClassWithRelatedProperties(1, 2)
+
+
+def test_update_independent_of_order(test_fixture):
+    """Relations are checked against final values, not in order of setting."""
+    update(test_fixture, lower=10, upper=20)
+    assert (test_fixture.lower, test_fixture.upper) == (10, 20)
+    update(test_fixture, upper=2, lower=1)
+    assert (test_fixture.lower, test_fixture.upper) == (1, 2)
+
+
+def test_update_checks_relations_declared_by_other_properties(test_fixture):
+    """Updating only the compared-against property checks the relation."""
+    expected_error_msg = re.escape(
+        "`lower` with value `1` must be less than `upper` with value `0`."
+    )
+    with pytest.raises(ValueError, match=expected_error_msg):
+        update(test_fixture, upper=0)
+    assert test_fixture.upper == 2
+
+
+@pytest.mark.parametrize(
+    "values, error",
+    [
+        ({"lower": 50, "upper": 40}, ValueError),
+        ({"lower": 10, "upper": 200}, ValueError),
+        ({"lower": 10, "upper": "20"}, TypeError),
+        ({"lower": 10, "not_a_property": 20}, AttributeError),
+    ],
+)
+def test_failed_update_stores_nothing(test_fixture, values, error):
+    """No values are stored if any check fails."""
+    with pytest.raises(error):
+        update(test_fixture, **values)
+    assert (test_fixture.lower, test_fixture.upper) == (1, 2)
+
+
+def test_update_respects_read_only(test_fixture):
+    """Read-only properties can only be set once by an update."""
+    update(test_fixture, once=1)
+    with pytest.raises(AttributeError):
+        update(test_fixture, once=2, lower=0)
+    assert (test_fixture.once, test_fixture.lower) == (1, 1)
+
+
+def test_update_in_trusted_mode(test_fixture):
+    """Checks are skipped by updates in trusted mode."""
+    with trusted():
+        update(test_fixture, lower=50, upper=40)
+    assert (test_fixture.lower, test_fixture.upper) == (50, 40)
+
+
+def test_transaction_commits_on_exit(test_fixture):
+    """Values set in a transaction are stored together on exit."""
+    with transaction(test_fixture):
+        test_fixture.lower = 10
+        assert test_fixture.lower == 1
+        test_fixture.upper = 20
+    assert (test_fixture.lower, test_fixture.upper) == (10, 20)
+
+
+def test_failed_transaction_rolls_back(test_fixture):
+    """No values are stored if any check fails on exit."""
+    with pytest.raises(ValueError):
+        with transaction(test_fixture):
+            test_fixture.upper = 20
+            test_fixture.lower = 30
+    assert (test_fixture.lower, test_fixture.upper) == (1, 2)
+
+
+def test_transaction_discarded_on_exception(test_fixture):
+    """Pending values are discarded if an exception is raised."""
+    with pytest.raises(RuntimeError):
+        with transaction(test_fixture):
+            test_fixture.upper = 20
+            raise RuntimeError
+    assert test_fixture.upper == 2
+    test_fixture.upper = 3
+    assert test_fixture.upper == 3
+
+
+def test_transaction_only_defers_its_instance(test_fixture):
+    """Other instances are set immediately during a transaction."""
+    other = ClassWithRelatedProperties(1, 2)
+    with transaction(test_fixture):
+        with transaction(test_fixture):
+            test_fixture.upper = 20
+        other.upper = 30
+        assert other.upper == 30
+        assert test_fixture.upper == 2
+        with pytest.raises(ValueError):
+            other.upper = 200
+    assert test_fixture.upper == 20